@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Benchmark the DJVU cleanup engines against each other.
+
+Times the staged pipeline (one regex pass per rule), the fused single-sweep
+engine and the streaming pipeline on the same input and checks that all of
+them produce identical output. Also times the footnote extractor against the
+footnote pattern of the former convert_to_endnotes.
+
+Usage: python bench_preprocess.py [sein_und_zeit_djvu.txt] [--repeat 5]
+"""
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+from preprocess import (_clean_gap, clean_djvu_stream, clean_djvu_text, clean_djvu_text_fused,
+                        extract_footnotes, iter_file_chunks)
+
+# Footnote definition pattern of the former convert_to_endnotes
+LEGACY_FOOTNOTE_PATTERN = re.compile(r'\n\n(\d+) ([^\n].*?)(?=\n\n(?:\d+ |\w|$))', re.DOTALL)
+
+def best_time(fn, repeat):
+    """Best wall time of repeat runs, plus the last result."""
+    best = float('inf')
+    for _ in range(repeat):
+        _clean_gap.cache_clear()  # measure cold-cache fused runs
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark DJVU cleanup engines")
+    parser.add_argument("input", type=Path, nargs="?", default=Path("sein_und_zeit_djvu.txt"))
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    
+    if not args.input.exists():
+        print(f"Error: Input file {args.input} not found")
+        sys.exit(1)
+    
+    text = args.input.read_text(encoding='utf-8')
+    print(f"Input: {len(text)} characters, best of {args.repeat}")
+    
+    engines = {
+        "staged": lambda: clean_djvu_text(text),
+        "fused": lambda: clean_djvu_text_fused(text),
+        "stream": lambda: ''.join(clean_djvu_stream(iter_file_chunks(args.input))),
+    }
+    
+    results = {}
+    baseline = None
+    for name, fn in engines.items():
+        elapsed, results[name] = best_time(fn, args.repeat)
+        baseline = baseline or elapsed
+        print(f"  {name:<8} {elapsed:.3f}s  {len(text) / elapsed / 1e6:6.1f} Mchar/s  x{baseline / elapsed:.2f}")
+    
+    mismatched = [name for name, result in results.items() if result != results["staged"]]
+    if mismatched:
+        print(f"Output differs from staged pipeline: {', '.join(mismatched)}")
+        sys.exit(1)
+    print("✓ All engines produce identical output")
+    
+    legacy, _ = best_time(lambda: LEGACY_FOOTNOTE_PATTERN.findall(text), args.repeat)
+    linear, (_, table) = best_time(lambda: extract_footnotes(text, link_references=True), args.repeat)
+    notes = sum(len(page_notes) for page_notes in table.values())
+    print(f"  footnotes: legacy regex {legacy:.3f}s, extract_footnotes {linear:.3f}s "
+          f"({notes} notes on {len(table)} pages)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Benchmark term candidate scanning against the original implementation.
+
+The reference below is TermExtractor._extract_raw_terms as it was before
+term_scanner: every pattern through re.finditer with a per-character set for
+overlap checks. Both must produce identical term -> contexts mappings.
+
+Usage: python bench_terms.py [cleaned_text.md] [--repeat 3] [--workers 2 4]
+"""
+
+import argparse
+import re
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+
+from term_scanner import (COMPOUND_PATTERNS, PHILOSOPHICAL_MARKERS, STOPWORDS, candidate_term,
+                          extract_term_contexts, is_philosophical_term)
+
+def legacy_is_philosophical_term(term):
+    if term in STOPWORDS:
+        return False
+    if len(term) < 4:
+        return False
+    return any(marker in term for marker in PHILOSOPHICAL_MARKERS)
+
+def legacy_extract_term_contexts(paragraphs):
+    term_contexts = defaultdict(list)
+    
+    for para in paragraphs:
+        if len(para) < 20:
+            continue
+        
+        matched_positions = set()
+        for pattern in COMPOUND_PATTERNS:
+            for match in re.finditer(pattern, para):
+                start, end = match.span()
+                if any(pos in matched_positions for pos in range(start, end)):
+                    continue
+                
+                term = match.group().lower()
+                if legacy_is_philosophical_term(term):
+                    matched_positions.update(range(start, end))
+                    context_start = max(0, start - 100)
+                    context_end = min(len(para), end + 100)
+                    term_contexts[term].append(para[context_start:context_end].strip())
+    
+    return dict(term_contexts)
+
+def best_time(fn, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        is_philosophical_term.cache_clear()
+        candidate_term.cache_clear()
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark term candidate scanning")
+    parser.add_argument("input", type=Path, nargs="?", default=Path("cleaned_text.md"))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--workers", type=int, nargs="*", default=[2, 4],
+                       help="Process pool sizes to time")
+    args = parser.parse_args()
+    
+    if not args.input.exists():
+        print(f"Error: Input file {args.input} not found")
+        sys.exit(1)
+    
+    paragraphs = args.input.read_text(encoding='utf-8').split('\n\n')
+    print(f"Input: {len(paragraphs)} paragraphs, best of {args.repeat}")
+    
+    legacy_time, legacy = best_time(lambda: legacy_extract_term_contexts(paragraphs), args.repeat)
+    scanner_time, scanned = best_time(lambda: extract_term_contexts(paragraphs), args.repeat)
+    print(f"  legacy   {legacy_time:.3f}s")
+    print(f"  scanner  {scanner_time:.3f}s  x{legacy_time / scanner_time:.2f}")
+    
+    if scanned != legacy or list(scanned) != list(legacy):
+        print("Output differs from the original implementation")
+        sys.exit(1)
+    print(f"✓ Identical output ({len(scanned)} terms)")
+    
+    # Process pool scaling (batches are merged in document order)
+    for workers in args.workers:
+        elapsed, parallel = best_time(lambda: extract_term_contexts(paragraphs, workers), args.repeat)
+        status = "identical" if parallel == legacy else "DIFFERENT"
+        print(f"  {workers} workers  {elapsed:.3f}s  x{legacy_time / elapsed:.2f}  ({status})")
+
+if __name__ == "__main__":
+    main()
@@ -1,78 +1,191 @@
+from array import array
 from pathlib import Path
-from typing import List, Iterator
+from typing import List, Iterator, Optional, Tuple
+import hashlib
+import mmap
 import re
+import unicodedata
+
+# Section headings as emitted by preprocess.mark_sections ("## § 12. ...")
+SECTION_HEADER_PATTERN = re.compile(r'^#+ §')
+
+def paragraph_hash(text: str) -> str:
+    """Stable paragraph ID: hash of the NFC-normalized, whitespace-collapsed text."""
+    normalized = ' '.join(unicodedata.normalize('NFC', text).split())
+    return hashlib.sha1(normalized.encode('utf-8')).hexdigest()[:16]
 
 class TextChunker:
-    """Extracts paragraphs from cleaned Heidegger text."""
-    
-    def __init__(self, text_file: Path):
+    """Extracts paragraphs from cleaned Heidegger text.
+
+    The text is segmented once into a compact offset table (paragraph index ->
+    start/end offset, section id), so paragraph lookup, context windows and
+    section membership are O(1) instead of re-splitting the whole text.
+    """
+
+    def __init__(self, text_file: Path, use_mmap: bool = False):
         self.text_file = text_file
-        self.text = self._load_text()
-    
+        self.use_mmap = use_mmap
+        self._text: Optional[str] = None
+        self._buffer = None  # mmap of the UTF-8 file when use_mmap is set
+        self._paragraphs: Optional[List[str]] = None
+
+        # Offset table: character offsets into the text, or byte offsets with mmap
+        self._starts = array('q')
+        self._ends = array('q')
+        self._section_ids = array('l')   # -1 before the first § heading
+        self._section_starts: List[int] = []  # paragraph index of each § heading
+
+        if use_mmap:
+            self._buffer = self._map_file()
+        if self._buffer is None:
+            self._text = self._load_text()
+
+        self._build_offset_table()
+
+    def _map_file(self):
+        """Memory-map the file, or None when segmenting raw bytes would differ from read_text.
+
+        read_text translates \\r\\n and \\r to \\n, which byte offsets into the raw
+        file cannot; such files (and empty ones, which cannot be mapped) are read.
+        """
+        with open(self.text_file, 'rb') as f:
+            if f.seek(0, 2) == 0:
+                return None
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if buffer.find(b'\r') != -1:
+            buffer.close()
+            return None
+        return buffer
+
     def _load_text(self) -> str:
         """Load the cleaned text file."""
         return self.text_file.read_text(encoding='utf-8')
-    
+
+    @property
+    def text(self) -> str:
+        """Full cleaned text (decoded on first access when memory-mapped)."""
+        if self._text is None:
+            self._text = self._buffer[:].decode('utf-8')
+        return self._text
+
+    def _build_offset_table(self):
+        """Segment the text once, mirroring str.split('\\n\\n') + strip + length filter."""
+        source = self._buffer if self._buffer is not None else self._text
+        separator = b'\n\n' if self._buffer is not None else '\n\n'
+        size = len(source)
+        pos = 0
+
+        while pos <= size:
+            sep_idx = source.find(separator, pos)
+            piece_end = size if sep_idx == -1 else sep_idx
+            self._add_piece(source, pos, piece_end)
+            if sep_idx == -1:
+                break
+            pos = sep_idx + 2
+
+    def _add_piece(self, source, start: int, end: int):
+        """Record one split piece if it survives stripping and the length filter."""
+        piece = source[start:end]
+        if self._buffer is not None:
+            piece = piece.decode('utf-8')
+
+        para = piece.strip()
+        if not para or len(para) <= 10:  # Skip very short fragments
+            return
+
+        leading = piece[:len(piece) - len(piece.lstrip())]
+        if self._buffer is not None:
+            para_start = start + len(leading.encode('utf-8'))
+            para_end = para_start + len(para.encode('utf-8'))
+        else:
+            para_start = start + len(leading)
+            para_end = para_start + len(para)
+
+        if SECTION_HEADER_PATTERN.match(para):
+            self._section_starts.append(len(self._starts))
+
+        self._starts.append(para_start)
+        self._ends.append(para_end)
+        self._section_ids.append(len(self._section_starts) - 1)
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def _check_index(self, index: int):
+        if index < 0 or index >= len(self._starts):
+            raise IndexError(f"Paragraph index {index} out of range")
+
+    def paragraph_span(self, index: int) -> Tuple[int, int]:
+        """Return (start, end) offsets of a paragraph in the source text."""
+        self._check_index(index)
+        return self._starts[index], self._ends[index]
+
+    def get_paragraph(self, index: int) -> str:
+        """Return a single paragraph without materializing the others."""
+        if self._paragraphs is not None:
+            self._check_index(index)
+            return self._paragraphs[index]
+
+        start, end = self.paragraph_span(index)
+        if self._buffer is not None:
+            return self._buffer[start:end].decode('utf-8')
+        return self._text[start:end]
+
+    def paragraph_id(self, index: int) -> str:
+        """Return the content-hash ID of a paragraph (stable across re-numbering)."""
+        return paragraph_hash(self.get_paragraph(index))
+
+    def paragraph_ids(self) -> List[str]:
+        """Return content-hash IDs for all paragraphs in index order."""
+        return [self.paragraph_id(i) for i in range(len(self))]
+
+    def section_id(self, index: int) -> int:
+        """Return the § section number (0-based order of headings) for a paragraph, -1 if none."""
+        self._check_index(index)
+        return self._section_ids[index]
+
+    def section_header(self, index: int) -> Optional[str]:
+        """Return the § heading a paragraph belongs to (None before the first)."""
+        section = self.section_id(index)
+        return self.get_paragraph(self._section_starts[section]) if section >= 0 else None
+
     def extract_paragraphs(self) -> List[str]:
         """Split text into paragraphs, preserving section markers."""
-        # Split on double newlines (paragraph boundaries)
-        raw_paragraphs = self.text.split('\n\n')
-        
-        # Clean and filter paragraphs
-        paragraphs = []
-        for para in raw_paragraphs:
-            para = para.strip()
-            if para and len(para) > 10:  # Skip very short fragments
-                paragraphs.append(para)
-        
-        return paragraphs
-    
+        if self._paragraphs is None:
+            self._paragraphs = [self.get_paragraph(i) for i in range(len(self))]
+        return list(self._paragraphs)
+
     def extract_sections(self) -> List[tuple]:
         """Extract paragraphs grouped by sections (§ markers)."""
-        paragraphs = self.extract_paragraphs()
         sections = []
-        current_section = None
-        current_paras = []
-        
-        for para in paragraphs:
-            # Check if this is a section header (starts with §)
-            if para.startswith('# §'):
-                # Save previous section if exists
-                if current_section and current_paras:
-                    sections.append((current_section, current_paras))
-                
-                # Start new section
-                current_section = para
-                current_paras = []
-            else:
-                current_paras.append(para)
-        
-        # Add final section
-        if current_section and current_paras:
-            sections.append((current_section, current_paras))
-        
+
+        for section, header_idx in enumerate(self._section_starts):
+            end_idx = self._section_starts[section + 1] if section + 1 < len(self._section_starts) else len(self)
+            paras = [self.get_paragraph(i) for i in range(header_idx + 1, end_idx)]
+            if paras:
+                sections.append((self.get_paragraph(header_idx), paras))
+
         return sections
-    
+
+    def paragraph_sections(self) -> List[Optional[str]]:
+        """Return the enclosing § heading for each paragraph index (None before the first)."""
+        headers = [self.get_paragraph(i) for i in self._section_starts]
+        return [headers[s] if s >= 0 else None for s in self._section_ids]
+
     def get_paragraph_with_context(self, index: int, context_size: int = 2) -> tuple:
         """Get a paragraph with surrounding context for translation."""
-        paragraphs = self.extract_paragraphs()
-        
-        if index >= len(paragraphs):
-            raise IndexError(f"Paragraph index {index} out of range")
-        
-        current = paragraphs[index]
-        
+        current = self.get_paragraph(index)
+
         # Get previous context
         start_idx = max(0, index - context_size)
-        prev_context = paragraphs[start_idx:index]
-        
+        prev_context = [self.get_paragraph(i) for i in range(start_idx, index)]
+
         return current, prev_context
-    
-    def chunk_iterator(self, context_size: int = 2) -> Iterator[tuple]:
-        """Iterate through paragraphs with context."""
-        paragraphs = self.extract_paragraphs()
-        
-        for i, para in enumerate(paragraphs):
-            start_idx = max(0, i - context_size)
-            prev_context = paragraphs[start_idx:i]
-            yield i, para, prev_context
+
+    def chunk_iterator(self, context_size: int = 2, start: int = 0,
+                       end: Optional[int] = None) -> Iterator[tuple]:
+        """Iterate through paragraphs [start, end) with context."""
+        end = len(self) if end is None else min(end, len(self))
+
+        for i in range(start, end):
+            yield (i, *self.get_paragraph_with_context(i, context_size))
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Incremental rendering of passage comparisons.
+
+compare-passages renders one paragraph section at a time and writes it
+straight to the output file, so a book-wide comparison neither holds the
+whole document in memory nor waits until the end to produce anything.
+Rendered sections are cached per paragraph together with a hash of their
+inputs (every model's record for that paragraph); regenerating after one
+translation changed re-renders only that paragraph.
+"""
+
+import hashlib
+import json
+import logging
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, TextIO, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Bump when render_paragraph's output changes, to invalidate cached sections
+RENDER_VERSION = 1
+
+def render_input_hash(paragraph_number: int, models: Dict[str, Dict], separator: bool) -> str:
+    """Hash of everything a paragraph section is rendered from."""
+    payload = json.dumps([RENDER_VERSION, paragraph_number, separator, models], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()[:16]
+
+def render_paragraph(paragraph_number: int, models: Dict[str, Dict], separator: bool = False) -> str:
+    """Markdown section comparing every model's translation of one paragraph."""
+    lines = []
+    lines.append(f"## Paragraph {paragraph_number}")
+    lines.append("")
+
+    # Get German original (should be same across all models)
+    german_text = None
+    for model_name, model_data in models.items():
+        if isinstance(model_data, dict) and str(paragraph_number) in model_data:
+            para_data = model_data[str(paragraph_number)]
+            if para_data and isinstance(para_data, dict):
+                german_text = para_data.get('german_text', '').strip()
+                break
+
+    if german_text:
+        lines.append("### German Original")
+        lines.append("")
+        lines.append(german_text)
+        lines.append("")
+
+    # Compare each model's translation
+    for model_name, model_data in models.items():
+        if isinstance(model_data, dict) and "error" in model_data:
+            continue
+
+        lines.append(f"### {model_name.upper()} Translation")
+        lines.append("")
+
+        if str(paragraph_number) in model_data and model_data[str(paragraph_number)]:
+            para_data = model_data[str(paragraph_number)]
+
+            if para_data.get('error_message'):
+                lines.append(f"**Error:** {para_data['error_message']}")
+                lines.append("")
+                continue
+
+            # English translation
+            if para_data.get('english_translation'):
+                lines.append(f"**English:**")
+                lines.append(para_data['english_translation'].strip())
+                lines.append("")
+
+            # Translator's reasoning
+            if para_data.get('thinking'):
+                lines.append(f"**Translator's Notes:**")
+                lines.append(para_data['thinking'].strip())
+                lines.append("")
+
+            # Key terms
+            if para_data.get('key_terms'):
+                terms = para_data['key_terms']
+                if terms and len(terms) > 0:
+                    lines.append(f"**Key Terms:** {', '.join(terms)}")
+                    lines.append("")
+
+            # Uncertainties
+            if para_data.get('uncertainties'):
+                uncertainties = para_data['uncertainties']
+                if uncertainties and len(uncertainties) > 0:
+                    lines.append(f"**Translation Uncertainties:**")
+                    for uncertainty in uncertainties:
+                        lines.append(f"- {uncertainty}")
+                    lines.append("")
+        else:
+            lines.append("**No translation data available**")
+            lines.append("")
+
+    if separator:
+        lines.append("---")
+        lines.append("")
+
+    return '\n'.join(lines)
+
+class RenderCache:
+    """Rendered paragraph sections with the input hash they were rendered from."""
+
+    def __init__(self, cache_file: Optional[Path]):
+        self.cache_file = cache_file
+        self.sections: Dict[str, Dict[str, str]] = {}  # paragraph -> {"input_hash", "markdown"}
+        self.dirty = False
+
+        if cache_file and cache_file.exists():
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                self.sections = json.load(f)
+
+    def get(self, paragraph_number: int, input_hash: str) -> Optional[str]:
+        entry = self.sections.get(str(paragraph_number))
+        if entry and entry["input_hash"] == input_hash:
+            return entry["markdown"]
+        return None
+
+    def put(self, paragraph_number: int, input_hash: str, markdown: str):
+        self.sections[str(paragraph_number)] = {"input_hash": input_hash, "markdown": markdown}
+        self.dirty = True
+
+    def save(self):
+        if not self.cache_file or not self.dirty:
+            return
+        with open(self.cache_file, 'w', encoding='utf-8') as f:
+            json.dump(self.sections, f, ensure_ascii=False)
+        self.dirty = False
+
+def write_comparison(out: TextIO, paragraphs: Iterable[Tuple[int, Dict[str, Dict]]], cache: RenderCache,
+                     separator: bool) -> Dict[str, int]:
+    """Render (paragraph, models) pairs to `out` as they arrive.
+
+    Returns counts of rendered and cached sections and of models compared.
+    """
+    counts = {"rendered": 0, "cached": 0}
+    compared, failed = set(), set()
+    for paragraph_number, models in paragraphs:
+        for model_name, model_data in models.items():
+            if isinstance(model_data, dict) and "error" in model_data:
+                if model_name not in failed:
+                    logger.warning(f"Skipping {model_name} due to parsing error: {model_data['error']}")
+                    failed.add(model_name)
+            else:
+                compared.add(model_name)
+
+        input_hash = render_input_hash(paragraph_number, models, separator)
+        markdown = cache.get(paragraph_number, input_hash)
+        if markdown is None:
+            markdown = render_paragraph(paragraph_number, models, separator)
+            cache.put(paragraph_number, input_hash, markdown)
+            counts["rendered"] += 1
+        else:
+            counts["cached"] += 1
+
+        out.write(markdown + '\n')
+        out.flush()
+    counts["models"] = len(compared)
+    return counts
+
+def comparison_trailer() -> List[str]:
+    """Closing placeholder sections for manual analysis."""
+    return [
+        "## Comparative Analysis",
+        "",
+        "### Terminological Approaches",
+        "*[Space for analysis of how each model handles key German philosophical terms]*",
+        "",
+        "### Translation Strategies",
+        "*[Space for analysis of literal vs interpretive approaches]*",
+        "",
+        "### Philosophical Reasoning Quality",
+        "*[Space for evaluation of the depth and accuracy of each model's commentary]*",
+        "",
+    ]
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Concordance over the German text and every model's translation.
+
+The index holds every word token of the cleaned text with its (paragraph,
+start, end) location, using TextChunker numbering, plus each model's English
+for every translated paragraph. A lookup is a bisect over the sorted
+vocabulary (case-insensitive prefix match, so "Verhalten" also finds
+"Verhaltens"), so queries on the full book stay well under a second. The
+index records the size and mtime of its sources and is rebuilt when any of
+them changes.
+"""
+
+import json
+import logging
+import re
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from datetime import datetime
+from itertools import groupby
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from chunker import TextChunker
+from translation_merge import block_field, index_translation_runs, read_block
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 1
+TOKEN_PATTERN = re.compile(r'\w+(?:-\w+)*')
+
+@dataclass
+class ConcordanceHit:
+    """One German occurrence with its keyword-in-context window."""
+    paragraph: int
+    left: str
+    keyword: str
+    right: str
+
+@dataclass
+class ConcordanceIndex:
+    """Token locations in the German text plus per-model English by paragraph."""
+    tokens: Dict[str, List[int]] = field(default_factory=dict)  # token -> flat [paragraph, start, end, ...]
+    paragraphs: List[str] = field(default_factory=list)
+    english: Dict[str, Dict[int, str]] = field(default_factory=dict)  # model -> paragraph -> English
+    sources: Dict[str, List[float]] = field(default_factory=dict)  # path -> [size, mtime]
+    _vocabulary: Optional[List[str]] = field(default=None, repr=False)
+
+    @property
+    def vocabulary(self) -> List[str]:
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self.tokens)
+        return self._vocabulary
+
+    def matching_tokens(self, term: str) -> List[str]:
+        """Indexed tokens starting with term (case-insensitive)."""
+        prefix = term.lower()
+        vocabulary = self.vocabulary
+        matches = []
+        for i in range(bisect_left(vocabulary, prefix), len(vocabulary)):
+            if not vocabulary[i].startswith(prefix):
+                break
+            matches.append(vocabulary[i])
+        return matches
+
+    def lookup(self, term: str, width: int = 60) -> List[ConcordanceHit]:
+        """Every occurrence of tokens matching term, in text order."""
+        locations = []
+        for token in self.matching_tokens(term):
+            flat = self.tokens[token]
+            locations.extend(zip(flat[0::3], flat[1::3], flat[2::3]))
+
+        hits = []
+        for paragraph, start, end in sorted(locations):
+            text = self.paragraphs[paragraph]
+            hits.append(ConcordanceHit(
+                paragraph=paragraph,
+                left=text[max(0, start - width):start].replace('\n', ' '),
+                keyword=text[start:end],
+                right=text[end:end + width].replace('\n', ' '),
+            ))
+        return hits
+
+    def is_current(self, source_files: List[Path]) -> bool:
+        """True if the index was built from exactly these, unchanged, files."""
+        return self.sources == source_fingerprints(source_files)
+
+    def save(self, index_file: Path):
+        data = {
+            "version": INDEX_VERSION,
+            "created": datetime.now().isoformat(),
+            "sources": self.sources,
+            "paragraphs": self.paragraphs,
+            "english": {model: {str(n): text for n, text in paragraphs.items()}
+                        for model, paragraphs in self.english.items()},
+            "tokens": self.tokens,
+        }
+        with open(index_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, index_file: Path) -> Optional["ConcordanceIndex"]:
+        """Load a saved index (None if it was written by another index version)."""
+        with open(index_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        if data.get("version") != INDEX_VERSION:
+            return None
+
+        return cls(
+            tokens=data["tokens"],
+            paragraphs=data["paragraphs"],
+            english={model: {int(n): text for n, text in paragraphs.items()}
+                     for model, paragraphs in data["english"].items()},
+            sources=data["sources"],
+        )
+
+def source_fingerprints(source_files: List[Path]) -> Dict[str, List[float]]:
+    """Size and mtime of each source, to detect a stale index."""
+    fingerprints = {}
+    for path in source_files:
+        stat = path.stat()
+        fingerprints[str(path)] = [stat.st_size, stat.st_mtime]
+    return fingerprints
+
+def load_english(translation_file: Path) -> Dict[int, str]:
+    """English of every successfully translated paragraph (latest run wins)."""
+    chosen, _ = index_translation_runs([translation_file])
+
+    english = {}
+    with open(translation_file, 'rb') as f:
+        for number, block in chosen.items():
+            if block.is_success:
+                text = block_field(read_block(f, block), "English")
+                if text:
+                    english[number] = text
+    return english
+
+def build_concordance(text_file: Path, translation_files: List[Path]) -> ConcordanceIndex:
+    """Tokenize every paragraph and collect each model's English."""
+    chunker = TextChunker(text_file)
+    paragraphs = chunker.extract_paragraphs()
+
+    tokens: Dict[str, List[int]] = {}
+    for paragraph, text in enumerate(paragraphs):
+        for match in TOKEN_PATTERN.finditer(text):
+            tokens.setdefault(match.group().lower(), []).extend((paragraph, match.start(), match.end()))
+
+    english = {path.stem.replace('full_translation_', ''): load_english(path) for path in translation_files}
+
+    return ConcordanceIndex(
+        tokens=tokens,
+        paragraphs=paragraphs,
+        english=english,
+        sources=source_fingerprints([text_file, *translation_files]),
+    )
+
+def load_or_build(index_file: Path, text_file: Path,
+                  translation_files: List[Path]) -> Tuple[ConcordanceIndex, bool]:
+    """Return a current index, rebuilding and saving it if needed. Second value: rebuilt."""
+    if index_file.exists():
+        index = ConcordanceIndex.load(index_file)
+        if index is not None and index.is_current([text_file, *translation_files]):
+            return index, False
+
+    index = build_concordance(text_file, translation_files)
+    index.save(index_file)
+    return index, True
+
+def format_concordance(index: ConcordanceIndex, term: str, hits: List[ConcordanceHit],
+                       width: int = 60) -> str:
+    """Markdown report: KWIC lines grouped by paragraph, then each model's English."""
+    lines = [f"# Concordance: {term}", ""]
+    tokens = sorted({hit.keyword for hit in hits})
+    paragraphs = sorted({hit.paragraph for hit in hits})
+    lines.append(f"{len(hits)} occurrences in {len(paragraphs)} paragraphs ({', '.join(tokens)})")
+    lines.append("")
+
+    for paragraph, paragraph_hits in groupby(hits, key=lambda hit: hit.paragraph):
+        lines.append(f"## Paragraph {paragraph}")
+        lines.append("")
+        for hit in paragraph_hits:
+            lines.append(f"    {hit.left:>{width}} [{hit.keyword}] {hit.right}")
+        lines.append("")
+
+        for model, english in sorted(index.english.items()):
+            lines.append(f"**{model}:** {english.get(paragraph, '(not translated)')}")
+            lines.append("")
+
+    return "\n".join(lines)
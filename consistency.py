@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+Terminology consistency across model translations.
+
+Takes the convention term map (CONVENTIONS.md, or a YAML/JSON map) and every
+parsed translation, and for each paragraph whose German contains a term
+checks whether the English uses the expected rendering. Matching runs as
+vectorized pandas string operations over the whole book, one pass per term.
+
+Convention terms are nouns, so they only match capitalized ("Sein", not the
+possessive "seine"), and a CONVENTIONS.md line is only a rule once its
+primary rendering has been filled in; the generated alternatives are
+suggestions, not a decision.
+"""
+
+import json
+import logging
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List
+
+import pandas as pd
+
+from translation_merge import block_field, index_translation_runs, read_block
+
+logger = logging.getLogger(__name__)
+
+CONVENTION_LINE = re.compile(
+    r'^- \*\*(?P<term>[^*]+)\*\*:\s*(?P<primary>.*?)'
+    r'(?:\s*\[variants: (?P<variants>[^\]]*)\])?'
+    r'(?:\s*\(alt: (?P<alt>.*)\))?\s*$'
+)
+VARIANT_PATTERN = re.compile(r'([^\s,(]+) \(\d+x\)')
+ALT_SEPARATOR = re.compile(r'(?:^|,)\s*\d+\.\s+')
+# Noun inflections kept from the stem variants (Daseins, Welten, Sorgen, Seinkönnens)
+NOMINAL_ENDINGS = ("s", "n", "en", "ns", "ens")
+
+@dataclass
+class TermRule:
+    """A German term, its surface forms and the accepted English renderings."""
+    german: str
+    forms: List[str] = field(default_factory=list)
+    renderings: List[str] = field(default_factory=list)  # first is the expected one
+    nominal: bool = False  # only match capitalized forms
+
+    @property
+    def expected(self) -> str:
+        return self.renderings[0]
+
+def clean_rendering(text: str) -> str:
+    """Strip list markup, quotes and trailing commentary from a rendering."""
+    text = re.split(r'\s+-\s+|\s*\(', text, maxsplit=1)[0]
+    return text.strip(' *:"\'.,;')
+
+def nominal_variants(german: str, variants: List[str]) -> List[str]:
+    """Stem variants that inflect the noun itself (drops seine/seiner for sein, zeitlich for zeitlichkeit)."""
+    return [form for form in variants if form[len(german):] in NOMINAL_ENDINGS and form.startswith(german)]
+
+def parse_conventions(conventions_file: Path) -> Dict[str, TermRule]:
+    """Read term rules from CONVENTIONS.md ("- **term**: primary [variants: ...] (alt: 1. X, 2. Y)").
+
+    Terms without a primary rendering (the generated "**:" placeholder) are
+    skipped until one is chosen.
+    """
+    rules, undecided = {}, []
+    for line in conventions_file.read_text(encoding='utf-8').splitlines():
+        match = CONVENTION_LINE.match(line.strip())
+        if not match:
+            continue
+
+        german = match.group('term').strip().lower()
+        primary = clean_rendering(match.group('primary'))
+        if not primary:
+            undecided.append(german)
+            continue
+
+        renderings = [primary]
+        if match.group('alt'):
+            renderings += [clean_rendering(alt) for alt in ALT_SEPARATOR.split(match.group('alt'))]
+        renderings = list(dict.fromkeys(r for r in renderings if r))
+
+        variants = VARIANT_PATTERN.findall(match.group('variants') or '')
+        rules[german] = TermRule(german, [german] + nominal_variants(german, variants), renderings, nominal=True)
+
+    if undecided:
+        logger.warning(f"No primary rendering in {conventions_file} for: {', '.join(undecided)}")
+    return rules
+
+def load_term_map(term_map_file: Path) -> Dict[str, TermRule]:
+    """Read term rules from YAML/JSON: {german: rendering | [renderings] | {renderings, forms, nominal}}."""
+    with open(term_map_file, 'r', encoding='utf-8') as f:
+        if term_map_file.suffix.lower() == '.json':
+            data = json.load(f)
+        else:
+            import yaml
+            data = yaml.safe_load(f)
+
+    rules = {}
+    for german, spec in data.items():
+        german = german.lower()
+        nominal = False
+        if isinstance(spec, dict):
+            renderings = spec.get('renderings', [])
+            forms = [form.lower() for form in spec.get('forms', [])] or [german]
+            nominal = bool(spec.get('nominal', False))
+        else:
+            renderings = spec
+            forms = [german]
+        if isinstance(renderings, str):
+            renderings = [renderings]
+        if renderings:
+            rules[german] = TermRule(german, forms, list(renderings), nominal)
+
+    return rules
+
+def load_translation_texts(file_paths: List[Path]) -> pd.DataFrame:
+    """German and English of every successfully translated paragraph, one row per model-paragraph."""
+    rows = []
+    for file_path in file_paths:
+        model_name = file_path.stem.replace('full_translation_', '')
+        chosen, _ = index_translation_runs([file_path])
+
+        with open(file_path, 'rb') as f:
+            for number, block in sorted(chosen.items()):
+                if not block.is_success:
+                    continue
+                text = read_block(f, block)
+                rows.append({
+                    "model": model_name,
+                    "paragraph": number,
+                    "german": block_field(text, "German") or "",
+                    "english": block_field(text, "English") or "",
+                })
+
+    return pd.DataFrame(rows, columns=["model", "paragraph", "german", "english"])
+
+def words_pattern(words: List[str], nominal: bool = False) -> str:
+    """Regex matching any of the words as whole words (hyphenated compounds allowed).
+
+    With nominal, the first letter must be a capital and the rest matches in
+    any case; use it with case-sensitive matching.
+    """
+    if nominal:
+        alternatives = {re.escape(word[0].upper()) + '(?i:' + re.escape(word[1:]) + ')' for word in words}
+    else:
+        alternatives = {re.escape(word) for word in words}
+    alternatives = sorted(alternatives, key=len, reverse=True)
+    return r'(?<!\w)(?:' + '|'.join(alternatives) + r')(?!\w)'
+
+def check_consistency(translations: pd.DataFrame, rules: Dict[str, TermRule]) -> pd.DataFrame:
+    """One row per (model, paragraph, term) where the German uses the term.
+
+    `expected` is whether the English contains the expected rendering,
+    `accepted` whether it contains any listed rendering.
+    """
+    checks = []
+    for rule in rules.values():
+        has_term = translations["german"].str.contains(words_pattern(rule.forms, rule.nominal),
+                                                       case=rule.nominal, regex=True)
+        matched = translations.loc[has_term, ["model", "paragraph", "english"]]
+        if matched.empty:
+            continue
+
+        english = matched["english"]
+        checks.append(pd.DataFrame({
+            "model": matched["model"].values,
+            "paragraph": matched["paragraph"].values,
+            "term": rule.german,
+            "expected_rendering": rule.expected,
+            "expected": english.str.contains(words_pattern([rule.expected]), case=False, regex=True).values,
+            "accepted": english.str.contains(words_pattern(rule.renderings), case=False, regex=True).values,
+        }))
+
+    columns = ["model", "paragraph", "term", "expected_rendering", "expected", "accepted"]
+    if not checks:
+        return pd.DataFrame(columns=columns)
+    return pd.concat(checks, ignore_index=True)[columns]
+
+def model_consistency(checks: pd.DataFrame) -> pd.DataFrame:
+    """Per-model number of checks and share using the expected / any accepted rendering."""
+    return (checks.groupby("model")
+            .agg(checks=("expected", "size"), consistency=("expected", "mean"), accepted=("accepted", "mean"))
+            .sort_values("consistency", ascending=False))
+
+def term_consistency(checks: pd.DataFrame) -> pd.DataFrame:
+    """Expected-rendering rate for each term (rows) and model (columns)."""
+    return checks.pivot_table(index="term", columns="model", values="expected", aggfunc="mean")
+
+def worst_paragraphs(checks: pd.DataFrame, limit: int = 20) -> pd.DataFrame:
+    """Paragraphs with the most checks missing the expected rendering."""
+    misses = checks[~checks["expected"]]
+    if misses.empty:
+        return pd.DataFrame(columns=["paragraph", "misses", "checks", "terms", "models"])
+
+    summary = misses.groupby("paragraph").agg(
+        misses=("expected", "size"),
+        terms=("term", lambda terms: ", ".join(sorted(set(terms)))),
+        models=("model", lambda models: ", ".join(sorted(set(models)))),
+    )
+    summary["checks"] = checks.groupby("paragraph").size().reindex(summary.index)
+    summary = summary.reset_index().sort_values(["misses", "paragraph"], ascending=[False, True])
+    return summary[["paragraph", "misses", "checks", "terms", "models"]].head(limit)
+
+def format_consistency_report(checks: pd.DataFrame, rules: Dict[str, TermRule], limit: int = 20) -> str:
+    """Markdown report: per-model rates, per-term rates and the worst paragraphs."""
+    lines = ["# Terminology Consistency Report", ""]
+    lines.append("## Term Map")
+    lines.append("")
+    for rule in rules.values():
+        alternatives = f" (also accepted: {', '.join(rule.renderings[1:])})" if len(rule.renderings) > 1 else ""
+        lines.append(f"- **{rule.german}** → {rule.expected}{alternatives}")
+    lines.append("")
+
+    if checks.empty:
+        lines.append("No paragraph contains any of the terms.")
+        return "\n".join(lines)
+
+    lines.append("## Per-Model Consistency")
+    lines.append("")
+    lines.append("| Model | Checks | Expected rendering | Any accepted rendering |")
+    lines.append("|-------|--------|--------------------|------------------------|")
+    for model, row in model_consistency(checks).iterrows():
+        lines.append(f"| {model} | {int(row['checks'])} | {row['consistency']:.1%} | {row['accepted']:.1%} |")
+    lines.append("")
+
+    by_term = term_consistency(checks)
+    lines.append("## Per-Term Consistency")
+    lines.append("")
+    lines.append("| Term | " + " | ".join(by_term.columns) + " |")
+    lines.append("|------|" + "|".join("---" for _ in by_term.columns) + "|")
+    for term, row in by_term.iterrows():
+        rates = " | ".join("–" if pd.isna(rate) else f"{rate:.0%}" for rate in row)
+        lines.append(f"| {term} | {rates} |")
+    lines.append("")
+
+    lines.append("## Worst Paragraphs")
+    lines.append("")
+    lines.append("| Paragraph | Misses | Checks | Terms | Models |")
+    lines.append("|-----------|--------|--------|-------|--------|")
+    for _, row in worst_paragraphs(checks, limit).iterrows():
+        lines.append(f"| {row['paragraph']} | {row['misses']} | {row['checks']} | {row['terms']} | {row['models']} |")
+
+    return "\n".join(lines)
@@ -0,0 +1,451 @@
+#!/usr/bin/env python3
+"""
+Meta-commentary: critic models judging the competing translations.
+
+The prompt, chain and record helpers are shared by the single-paragraph
+meta-commentary mode and the bulk mode. Bulk runs every (critic, paragraph)
+pair concurrently, with a separate request limit per provider, and appends
+each result to one JSONL file as soon as it completes. A re-run skips pairs
+that already have a successful record, so failed pairs are simply retried.
+
+With early stopping, each paragraph's critics are asked one after another
+(paragraphs still run concurrently) and the remaining critics are skipped once
+a strict majority for one translation is locked in, or the mean accuracy
+scores separate the leader from the runner-up by a given margin.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from langchain_core.exceptions import OutputParserException
+
+from meta_analysis import MetaCommentary
+
+logger = logging.getLogger(__name__)
+
+# Model name prefix -> provider, for per-provider rate limits
+PROVIDER_PREFIXES = {"gpt": "openai", "claude": "anthropic", "gemini": "google", "grok": "xai"}
+# Concurrent critique requests per provider
+PROVIDER_CONCURRENCY = {"openai": 8, "anthropic": 4, "google": 4, "xai": 4}
+
+# Rough characters per token, for estimating what early stopping saves
+CHARS_PER_TOKEN = 4
+
+SYSTEM_PROMPT = "You are an expert in philosophical translation, analyzing different AI approaches to translating Heidegger."
+
+class CritiqueParseError(ValueError):
+    """The critic answered but no MetaCommentary could be parsed from it."""
+
+def provider_of(model_name: str) -> str:
+    """Provider serving a model, by name prefix."""
+    for prefix, provider in PROVIDER_PREFIXES.items():
+        if model_name.startswith(prefix):
+            return provider
+    return model_name
+
+def comparison_for_paragraph(models: Dict, paragraph_number: int) -> Dict:
+    """German original plus each model's English, reasoning, key terms and uncertainties."""
+    comparison_data = {
+        "paragraph_number": paragraph_number,
+        "german_original": "",
+        "translations": {}
+    }
+
+    for model_name, model_data in models.items():
+        if isinstance(model_data, dict) and "error" in model_data:
+            logger.warning(f"Skipping {model_name} due to parsing error")
+            continue
+
+        para_data = model_data.get(str(paragraph_number))
+        if not para_data or para_data.get('error_message'):
+            logger.warning(f"Skipping {model_name} - no valid translation for paragraph {paragraph_number}")
+            continue
+
+        # Get German original (same for all models)
+        if not comparison_data["german_original"]:
+            comparison_data["german_original"] = (para_data.get('german_text') or '').strip()
+
+        # Extract key elements for comparison
+        thinking = para_data.get('thinking') or ''
+        comparison_data["translations"][model_name] = {
+            "english": (para_data.get('english_translation') or '').strip(),
+            "key_reasoning": thinking.strip()[:500] + "..." if len(thinking) > 500 else thinking.strip(),
+            "key_terms": para_data.get('key_terms') or [],
+            "uncertainties": para_data.get('uncertainties') or []
+        }
+
+    return comparison_data
+
+def build_critique_prompt(comparison_data: Dict) -> str:
+    """Prompt asking a critic to judge every translation of one paragraph."""
+    critique_prompt = f"""You are analyzing different AI translations of this Heidegger passage from "Being and Time".
+
+# German Original (Paragraph {comparison_data['paragraph_number']})
+{comparison_data['german_original']}
+
+# Competing Translations
+
+"""
+
+    for model_name, trans_data in comparison_data["translations"].items():
+        critique_prompt += f"""## {model_name.upper()} Translation
+**English:** {trans_data['english']}
+
+**Key Reasoning:** {trans_data['key_reasoning']}
+
+**Key Terms:** {', '.join(trans_data['key_terms']) if trans_data['key_terms'] else 'None listed'}
+
+**Uncertainties:** {'; '.join(trans_data['uncertainties']) if trans_data['uncertainties'] else 'None listed'}
+
+"""
+
+    critique_prompt += """
+# Your Task
+
+Analyze all translations and provide:
+
+1. **Critique each translation** - strengths, weaknesses, philosophical accuracy (score 1-10)
+2. **Identify the best translation** - which model produced the most philosophically sound result?
+3. **Defend your choice** - detailed argument for why it's superior
+4. **Show your reasoning** - your analytical process and key considerations
+5. **Overall insights** - what this reveals about AI philosophical translation
+
+Focus on: terminology choices, phenomenological fidelity, accessibility vs precision, interpretive depth.
+
+Be thorough, specific, and fair in your analysis. You may critique your own translation if others are superior.
+"""
+    return critique_prompt
+
+def critique_chain(critic_model: str):
+    """Prompt -> critic -> MetaCommentary chain."""
+    from langchain_core.prompts import ChatPromptTemplate
+    from translator import Translator
+
+    critic = Translator(critic_model)
+
+    # Use structured output for meta-commentary
+    if critic_model.startswith("gemini") or critic_model.startswith("claude") or critic_model.startswith("grok"):
+        # Use PydanticOutputParser for problematic models
+        from langchain_core.output_parsers import PydanticOutputParser
+        parser = PydanticOutputParser(pydantic_object=MetaCommentary)
+        format_instructions = parser.get_format_instructions().replace("{", "{{").replace("}", "}}")
+        instructions = f"\n\n# Output Format\n\nRespond with valid JSON in this exact format:\n{format_instructions}"
+        structured_llm = critic.model | parser
+    else:
+        # Clean approach for GPT
+        instructions = ""
+        structured_llm = critic.model.with_structured_output(MetaCommentary)
+
+    prompt_template = ChatPromptTemplate.from_messages([
+        ("system", SYSTEM_PROMPT),
+        ("human", "{critique_prompt}" + instructions)
+    ])
+    return prompt_template | structured_llm
+
+def unwrap_meta_commentary(result) -> MetaCommentary:
+    """Return the parsed critique, raising CritiqueParseError if there is none."""
+    # Handle different response formats
+    if isinstance(result, dict) and 'parsed' in result:
+        result = result['parsed']
+    if not isinstance(result, MetaCommentary):
+        raise CritiqueParseError(f"unexpected result type: {type(result).__name__}")
+    return result
+
+def critique_record(paragraph_number: int, critic_model: str, comparison_data: Dict,
+                    meta_commentary: MetaCommentary) -> Dict:
+    """Saved form of one critique (the per-paragraph *_critiques_paragraph_N.json layout)."""
+    return {
+        "paragraph_number": paragraph_number,
+        "critic_model": critic_model,
+        "generated_at": json.dumps(comparison_data, indent=2, ensure_ascii=False),  # Include source data
+        "meta_commentary": {
+            "critic_model": meta_commentary.critic_model,
+            "paragraph_number": meta_commentary.paragraph_number,
+            "critiques": {k: {
+                "model_name": v.model_name,
+                "strengths": v.strengths,
+                "weaknesses": v.weaknesses,
+                "philosophical_accuracy_score": v.philosophical_accuracy_score,
+                "accessibility_score": v.accessibility_score
+            } for k, v in meta_commentary.critiques.items()},
+            "best_translation": meta_commentary.best_translation,
+            "reasoning": meta_commentary.reasoning,
+            "thinking": meta_commentary.thinking,
+            "overall_insights": meta_commentary.overall_insights
+        }
+    }
+
+class CritiqueStore:
+    """Append-only JSONL of critique records, indexed by (critic, paragraph).
+
+    Every attempt is appended with its status; the latest record for a pair
+    wins, so a successful retry supersedes an earlier failure.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.records: Dict[Tuple[str, int], Dict] = {}
+
+        if path.exists():
+            with open(path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    if line.strip():
+                        record = json.loads(line)
+                        self.records[(record["critic_model"], record["paragraph_number"])] = record
+
+    def is_done(self, critic_model: str, paragraph_number: int) -> bool:
+        record = self.records.get((critic_model, paragraph_number))
+        return record is not None and record.get("status", "ok") == "ok"
+
+    def append(self, record: Dict):
+        self.records[(record["critic_model"], record["paragraph_number"])] = record
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    def successful(self, paragraph_number: Optional[int] = None) -> List[Dict]:
+        """Successful records, optionally for one paragraph, in (paragraph, critic) order."""
+        return [record for (critic, number), record in sorted(self.records.items(), key=lambda item: (item[0][1], item[0][0]))
+                if record.get("status", "ok") == "ok"
+                and (paragraph_number is None or number == paragraph_number)]
+
+@dataclass
+class CritiqueOutcome:
+    """Result of one (critic, paragraph) request."""
+    critic_model: str
+    paragraph_number: int
+    status: str  # "ok", "parse_error", "error", "skipped" or "early_stopped"
+    latency: float  # seconds
+    error: Optional[str] = None
+
+async def _critique_async(chain, critic_model: str, comparison_data: Dict,
+                          semaphore: asyncio.Semaphore, store: CritiqueStore) -> CritiqueOutcome:
+    """Run one critique under its provider's limit and append the result."""
+    paragraph_number = comparison_data["paragraph_number"]
+    async with semaphore:
+        start = time.perf_counter()
+        meta_commentary = None
+        try:
+            result = await chain.ainvoke({"critique_prompt": build_critique_prompt(comparison_data)})
+            meta_commentary = unwrap_meta_commentary(result)
+            status, error = "ok", None
+        except (CritiqueParseError, OutputParserException) as e:
+            # Output parsers raise OutputParserException on malformed JSON
+            status, error = "parse_error", str(e)
+        except Exception as e:
+            status, error = "error", str(e)
+        latency = time.perf_counter() - start
+
+    if meta_commentary is not None:
+        record = critique_record(paragraph_number, critic_model, comparison_data, meta_commentary)
+    else:
+        record = {"paragraph_number": paragraph_number, "critic_model": critic_model}
+    record.update({"status": status, "error": error, "latency": round(latency, 2),
+                   "completed_at": datetime.now().isoformat()})
+    store.append(record)
+
+    if status == "ok":
+        logger.info(f"  ✓ {critic_model} on paragraph {paragraph_number} ({latency:.1f}s): "
+                    f"best = {meta_commentary.best_translation}")
+    else:
+        logger.warning(f"  ✗ {critic_model} on paragraph {paragraph_number} ({latency:.1f}s) {status}: {error}")
+    return CritiqueOutcome(critic_model, paragraph_number, status, latency, error)
+
+def _provider_semaphores(critics: List[str], max_concurrency: Optional[int]) -> Dict[str, asyncio.Semaphore]:
+    """One semaphore per provider (PROVIDER_CONCURRENCY, capped at max_concurrency)."""
+    semaphores = {}
+    for critic in critics:
+        provider = provider_of(critic)
+        if provider not in semaphores:
+            limit = PROVIDER_CONCURRENCY.get(provider, 4)
+            semaphores[provider] = asyncio.Semaphore(min(limit, max_concurrency) if max_concurrency else limit)
+    return semaphores
+
+def _comparison_or_none(models: Dict, paragraph_number: int) -> Optional[Dict]:
+    """Comparison data, or None (with a warning) if fewer than two translations are valid."""
+    comparison_data = comparison_for_paragraph(models, paragraph_number)
+    if len(comparison_data["translations"]) < 2:
+        logger.warning(f"Skipping paragraph {paragraph_number}: "
+                       f"{len(comparison_data['translations'])} valid translations")
+        return None
+    return comparison_data
+
+async def run_bulk_critiques(models: Dict, paragraph_numbers: Iterable[int], critics: List[str],
+                             store: CritiqueStore, max_concurrency: Optional[int] = None,
+                             chains: Optional[Dict] = None) -> List[CritiqueOutcome]:
+    """Critique every pending (critic, paragraph) pair concurrently.
+
+    Pairs with a successful record in the store are skipped, as are paragraphs
+    with fewer than two valid translations. Each provider gets its own
+    semaphore (PROVIDER_CONCURRENCY, capped at max_concurrency).
+    """
+    chains = chains if chains is not None else {critic: critique_chain(critic) for critic in critics}
+    semaphores = _provider_semaphores(critics, max_concurrency)
+
+    outcomes = []
+    tasks = []
+    for paragraph_number in paragraph_numbers:
+        pending = [critic for critic in critics if not store.is_done(critic, paragraph_number)]
+        outcomes.extend(CritiqueOutcome(critic, paragraph_number, "skipped", 0.0)
+                        for critic in critics if critic not in pending)
+        if not pending:
+            continue
+
+        comparison_data = _comparison_or_none(models, paragraph_number)
+        if comparison_data is None:
+            continue
+
+        for critic in pending:
+            tasks.append(_critique_async(chains[critic], critic, comparison_data,
+                                         semaphores[provider_of(critic)], store))
+
+    outcomes.extend(await asyncio.gather(*tasks))
+    return outcomes
+
+def translation_model(label: str, models: Iterable[str]) -> Optional[str]:
+    """Model a critic's label refers to ("CLAUDE", "GPT Translation" -> "claude", "gpt")."""
+    label = label.lower()
+    found = [(label.find(model.lower()), model) for model in models if model.lower() in label]
+    return min(found)[1] if found else None
+
+@dataclass
+class EarlyStopResult:
+    """How one paragraph's sequential vote ended."""
+    paragraph_number: int
+    winner: Optional[str]
+    reason: Optional[str]  # "majority", "score_margin", or None if no consensus
+    critiques: int  # successful critiques counted
+    calls: int  # requests made in this run
+    calls_saved: int
+    tokens_saved: int  # estimated, from prompt and average response size
+
+def consensus(votes: Counter, scores: Dict[str, List[int]], n_critics: int,
+              score_margin: Optional[float] = None, min_critiques: int = 2) -> Optional[Tuple[str, str]]:
+    """(winner, reason) once the outcome can no longer change enough to matter, else None.
+
+    A translation with more than half of all critics' votes has a locked-in
+    majority. Otherwise, with a score margin and at least min_critiques
+    critiques, the top mean accuracy score must lead the runner-up by it.
+    """
+    if votes:
+        leader, count = votes.most_common(1)[0]
+        if count > n_critics / 2:
+            return leader, "majority"
+
+    critiques = max((len(model_scores) for model_scores in scores.values()), default=0)
+    if score_margin is not None and critiques >= min_critiques and len(scores) >= 2:
+        means = sorted(((sum(s) / len(s), model) for model, s in scores.items()), reverse=True)
+        if means[0][0] - means[1][0] >= score_margin:
+            return means[0][1], "score_margin"
+
+    return None
+
+async def _critique_until_consensus(chains: Dict, critics: List[str], comparison_data: Dict,
+                                    semaphores: Dict[str, asyncio.Semaphore], store: CritiqueStore,
+                                    score_margin: Optional[float]) -> Tuple[List[CritiqueOutcome], EarlyStopResult]:
+    """Ask critics in order until consensus; existing records count without a call."""
+    paragraph_number = comparison_data["paragraph_number"]
+    models = list(comparison_data["translations"])
+    votes, scores = Counter(), defaultdict(list)
+    outcomes, response_sizes = [], []
+    calls, decision, stop_at = 0, None, len(critics)
+
+    for i, critic in enumerate(critics):
+        if store.is_done(critic, paragraph_number):
+            outcomes.append(CritiqueOutcome(critic, paragraph_number, "skipped", 0.0))
+        else:
+            outcomes.append(await _critique_async(chains[critic], critic, comparison_data,
+                                                  semaphores[provider_of(critic)], store))
+            calls += 1
+
+        if store.is_done(critic, paragraph_number):
+            meta_commentary = store.records[(critic, paragraph_number)]["meta_commentary"]
+            response_sizes.append(len(json.dumps(meta_commentary, ensure_ascii=False)))
+            vote = translation_model(meta_commentary.get("best_translation", ""), models)
+            if vote:
+                votes[vote] += 1
+            for label, critique in (meta_commentary.get("critiques") or {}).items():
+                model = translation_model(label, models)
+                if model and isinstance(critique.get("philosophical_accuracy_score"), (int, float)):
+                    scores[model].append(critique["philosophical_accuracy_score"])
+
+        decision = consensus(votes, scores, len(critics), score_margin)
+        if decision:
+            stop_at = i + 1
+            break
+
+    skipped = [critic for critic in critics[stop_at:] if not store.is_done(critic, paragraph_number)]
+    outcomes.extend(CritiqueOutcome(critic, paragraph_number, "early_stopped", 0.0) for critic in skipped)
+
+    call_chars = len(build_critique_prompt(comparison_data)) + (sum(response_sizes) / len(response_sizes)
+                                                                if response_sizes else 0)
+    result = EarlyStopResult(
+        paragraph_number=paragraph_number,
+        winner=decision[0] if decision else (votes.most_common(1)[0][0] if votes else None),
+        reason=decision[1] if decision else None,
+        critiques=len(response_sizes),
+        calls=calls,
+        calls_saved=len(skipped),
+        tokens_saved=int(len(skipped) * call_chars / CHARS_PER_TOKEN),
+    )
+    return outcomes, result
+
+async def run_sequential_critiques(models: Dict, paragraph_numbers: Iterable[int], critics: List[str],
+                                   store: CritiqueStore, max_concurrency: Optional[int] = None,
+                                   score_margin: Optional[float] = None,
+                                   chains: Optional[Dict] = None) -> Tuple[List[CritiqueOutcome], List[EarlyStopResult]]:
+    """Early-stopping variant of run_bulk_critiques: critics in order per paragraph."""
+    chains = chains if chains is not None else {critic: critique_chain(critic) for critic in critics}
+    semaphores = _provider_semaphores(critics, max_concurrency)
+
+    tasks = []
+    for paragraph_number in paragraph_numbers:
+        comparison_data = _comparison_or_none(models, paragraph_number)
+        if comparison_data is not None:
+            tasks.append(_critique_until_consensus(chains, critics, comparison_data, semaphores, store, score_margin))
+
+    outcomes, results = [], []
+    for paragraph_outcomes, result in await asyncio.gather(*tasks):
+        outcomes.extend(paragraph_outcomes)
+        results.append(result)
+    return outcomes, results
+
+def log_early_stopping(results: List[EarlyStopResult]):
+    """Per-paragraph verdicts and the calls and tokens early stopping saved."""
+    for result in sorted(results, key=lambda r: r.paragraph_number):
+        verdict = f"{result.winner} ({result.reason})" if result.reason else f"no consensus (leader: {result.winner})"
+        logger.info(f"  Paragraph {result.paragraph_number}: {verdict} after {result.critiques} critiques, "
+                    f"{result.calls} calls, saved {result.calls_saved} calls (~{result.tokens_saved} tokens)")
+
+    saved_calls = sum(r.calls_saved for r in results)
+    saved_tokens = sum(r.tokens_saved for r in results)
+    decided = sum(r.reason is not None for r in results)
+    logger.info(f"Early stopping: {decided}/{len(results)} paragraphs decided, "
+                f"{saved_calls} calls and ~{saved_tokens} tokens saved")
+
+def log_critique_outcomes(outcomes: List[CritiqueOutcome], elapsed: float):
+    """Summarize a bulk critique run per critic."""
+    by_critic: Dict[str, List[CritiqueOutcome]] = {}
+    for outcome in outcomes:
+        by_critic.setdefault(outcome.critic_model, []).append(outcome)
+
+    ran = [o for o in outcomes if o.status not in ("skipped", "early_stopped")]
+    failed = [o for o in ran if o.status != "ok"]
+    logger.info(f"Ran {len(ran)} critiques in {elapsed:.1f}s "
+                f"({sum(o.status == 'skipped' for o in outcomes)} already done, {len(failed)} failed)")
+    for critic, critic_outcomes in by_critic.items():
+        latencies = sorted(o.latency for o in critic_outcomes if o.status not in ("skipped", "early_stopped"))
+        ok = sum(o.status in ("ok", "skipped") for o in critic_outcomes)
+        stopped = sum(o.status == "early_stopped" for o in critic_outcomes)
+        median = f", median {latencies[len(latencies) // 2]:.1f}s" if latencies else ""
+        not_needed = f", {stopped} not needed" if stopped else ""
+        logger.info(f"  {critic}: {ok}/{len(critic_outcomes)} done{not_needed}{median}")
+    if failed:
+        logger.warning(f"  Failed pairs (re-run to retry): "
+                       f"{', '.join(f'{o.critic_model}/{o.paragraph_number}' for o in failed)}")
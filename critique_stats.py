@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+Aggregate statistics over critic scores.
+
+Critique records (single-paragraph JSON files or bulk JSONL) are flattened
+into a score tensor indexed critic x translated model x paragraph x metric,
+with NaN where a critic did not score a translation. Everything below is a
+NumPy reduction over that tensor: per-model means with confidence intervals,
+inter-critic agreement, each critic's preference for its own model's
+translation, and the resulting ranking. Adding a critique appends to flat
+arrays; the tensor is rebuilt on the next query with one scatter assignment.
+"""
+
+import json
+import math
+import warnings
+from dataclasses import dataclass, field
+from itertools import combinations
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from critique import CritiqueStore, translation_model
+
+METRICS = ("philosophical_accuracy_score", "accessibility_score")
+
+# Two-sided 95% Student t critical values by degrees of freedom (normal beyond 30)
+T_CRITICAL_95 = {1: 12.706, 2: 4.303, 3: 3.182, 4: 2.776, 5: 2.571, 6: 2.447, 7: 2.365, 8: 2.306,
+                 9: 2.262, 10: 2.228, 12: 2.179, 15: 2.131, 20: 2.086, 25: 2.060, 30: 2.042}
+
+def t_critical(df: int) -> float:
+    """95% t critical value, rounding df down to the nearest tabulated value."""
+    if df < 1:
+        return math.nan
+    if df > 30:
+        return 1.96
+    return T_CRITICAL_95[max(d for d in T_CRITICAL_95 if d <= df)]
+
+def model_label_key(label: str) -> str:
+    """Model key from a critic's label when no model list is known ("GPT Translation" -> "gpt")."""
+    return label.lower().replace("translation", "").strip()
+
+@dataclass
+class CritiqueScores:
+    """Critic scores as flat arrays plus the score tensor built from them."""
+    models: Optional[List[str]] = None  # translated models; inferred from labels if None
+    critics: List[str] = field(default_factory=list)
+    paragraphs: List[int] = field(default_factory=list)
+    _cells: Dict[str, List[int]] = field(default_factory=lambda: {"critic": [], "model": [], "paragraph": [], "metric": []})
+    _values: List[float] = field(default_factory=list)
+    _votes: Dict[tuple, int] = field(default_factory=dict)  # (critic, paragraph) index -> model index
+    _model_index: Dict[str, int] = field(default_factory=dict)
+    _critic_index: Dict[str, int] = field(default_factory=dict)
+    _paragraph_index: Dict[int, int] = field(default_factory=dict)
+    _tensor: Optional[np.ndarray] = None
+
+    def __post_init__(self):
+        for model in self.models or []:
+            self._model_index.setdefault(model, len(self._model_index))
+
+    @property
+    def model_names(self) -> List[str]:
+        return list(self._model_index)
+
+    @staticmethod
+    def _index(index: Dict, items: List, item) -> int:
+        if item not in index:
+            index[item] = len(items)
+            items.append(item)
+        return index[item]
+
+    def _model(self, label: str) -> Optional[int]:
+        if self.models:
+            model = translation_model(label, self.models)
+            return None if model is None else self._model_index[model]
+        key = model_label_key(label)
+        return self._model_index.setdefault(key, len(self._model_index)) if key else None
+
+    def add(self, record: Dict):
+        """Add one critique record ({critic_model, paragraph_number, meta_commentary})."""
+        critic = self._index(self._critic_index, self.critics, record["critic_model"])
+        paragraph = self._index(self._paragraph_index, self.paragraphs, int(record["paragraph_number"]))
+        meta_commentary = record["meta_commentary"]
+
+        for label, critique in (meta_commentary.get("critiques") or {}).items():
+            model = self._model(label)
+            if model is None or not isinstance(critique, dict):
+                continue
+            for metric, name in enumerate(METRICS):
+                score = critique.get(name)
+                if isinstance(score, (int, float)):
+                    for axis, index in (("critic", critic), ("model", model), ("paragraph", paragraph),
+                                        ("metric", metric)):
+                        self._cells[axis].append(index)
+                    self._values.append(float(score))
+
+        vote = self._model(meta_commentary.get("best_translation") or "")
+        if vote is not None:
+            self._votes[(critic, paragraph)] = vote
+        self._tensor = None
+
+    def extend(self, records: Iterable[Dict]):
+        for record in records:
+            self.add(record)
+
+    @property
+    def tensor(self) -> np.ndarray:
+        """Scores as (critic, model, paragraph, metric), NaN where missing; later critiques win."""
+        if self._tensor is None:
+            shape = (len(self.critics), len(self._model_index), len(self.paragraphs), len(METRICS))
+            tensor = np.full(shape, np.nan)
+            if self._values:
+                # Fancy assignment leaves duplicate cells in unspecified order, so keep
+                # only each cell's last score: the first occurrence in reverse
+                cells = np.ravel_multi_index([self._cells[axis] for axis in ("critic", "model", "paragraph", "metric")],
+                                             shape)
+                unique, reversed_first = np.unique(cells[::-1], return_index=True)
+                tensor.flat[unique] = np.array(self._values)[::-1][reversed_first]
+            self._tensor = tensor
+        return self._tensor
+
+    def votes(self) -> np.ndarray:
+        """Best-translation votes as (critic, paragraph) model indices, -1 where missing."""
+        votes = np.full((len(self.critics), len(self.paragraphs)), -1)
+        for (critic, paragraph), model in self._votes.items():
+            votes[critic, paragraph] = model
+        return votes
+
+def model_means(scores: CritiqueScores) -> pd.DataFrame:
+    """Mean of each metric per translated model, with n and a 95% t confidence interval."""
+    tensor = scores.tensor
+    # (model, observations, metric)
+    by_model = tensor.transpose(1, 0, 2, 3).reshape(tensor.shape[1], -1, tensor.shape[3])
+    n = np.sum(~np.isnan(by_model), axis=1)
+    with np.errstate(invalid='ignore', divide='ignore'), warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        mean = np.nanmean(by_model, axis=1) if by_model.size else np.full(n.shape, np.nan)
+        sd = np.nanstd(by_model, axis=1, ddof=1) if by_model.size else np.full(n.shape, np.nan)
+        half_width = np.vectorize(t_critical)(n - 1) * sd / np.sqrt(n) if n.size else n.astype(float)
+
+    rows = []
+    for m, model in enumerate(scores.model_names):
+        row = {"model": model}
+        for k, metric in enumerate(METRICS):
+            row[f"{metric}_mean"] = mean[m, k]
+            row[f"{metric}_ci"] = half_width[m, k]
+            row[f"{metric}_n"] = int(n[m, k])
+        rows.append(row)
+    return pd.DataFrame(rows).set_index("model")
+
+def critic_agreement(scores: CritiqueScores, metric: str = "philosophical_accuracy_score") -> pd.DataFrame:
+    """Pearson correlation between each pair of critics over the translations both scored."""
+    k = METRICS.index(metric)
+    flat = scores.tensor[..., k].reshape(len(scores.critics), -1)
+
+    matrix = np.full((len(scores.critics),) * 2, np.nan)
+    np.fill_diagonal(matrix, 1.0)
+    for a, b in combinations(range(len(scores.critics)), 2):
+        both = ~np.isnan(flat[a]) & ~np.isnan(flat[b])
+        if both.sum() >= 3 and flat[a][both].std() > 0 and flat[b][both].std() > 0:
+            matrix[a, b] = matrix[b, a] = np.corrcoef(flat[a][both], flat[b][both])[0, 1]
+    return pd.DataFrame(matrix, index=scores.critics, columns=scores.critics)
+
+def vote_agreement(scores: CritiqueScores) -> float:
+    """Share of critic pairs picking the same best translation, over paragraphs where both voted."""
+    votes = scores.votes()
+    agree = total = 0
+    for a, b in combinations(range(len(scores.critics)), 2):
+        both = (votes[a] >= 0) & (votes[b] >= 0)
+        agree += int(np.sum(votes[a][both] == votes[b][both]))
+        total += int(both.sum())
+    return agree / total if total else math.nan
+
+def self_preference(scores: CritiqueScores, metric: str = "philosophical_accuracy_score") -> pd.DataFrame:
+    """How much higher each critic scores its own model's translation than the other critics do."""
+    k = METRICS.index(metric)
+    tensor = scores.tensor[..., k]
+    rows = []
+    for c, critic in enumerate(scores.critics):
+        own = translation_model(critic, scores.model_names)
+        if own is None:
+            continue
+        m = scores.model_names.index(own)
+        others = np.delete(tensor[:, m, :], c, axis=0)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)  # paragraphs no other critic scored
+            others_mean = np.nanmean(others, axis=0) if len(others) else np.full(tensor.shape[2], np.nan)
+        diff = tensor[c, m, :] - others_mean
+        paired = ~np.isnan(diff)
+        rows.append({
+            "critic": critic,
+            "own_model": own,
+            "bias": float(diff[paired].mean()) if paired.any() else math.nan,
+            "paragraphs": int(paired.sum()),
+        })
+    return pd.DataFrame(rows, columns=["critic", "own_model", "bias", "paragraphs"])
+
+def rank_models(scores: CritiqueScores, metric: str = "philosophical_accuracy_score") -> pd.DataFrame:
+    """Models by mean score on the metric, with best-translation vote counts."""
+    means = model_means(scores)
+    votes = scores.votes()
+    means["votes"] = [int(np.sum(votes == m)) for m in range(len(scores.model_names))]
+    return means.sort_values([f"{metric}_mean", "votes"], ascending=False)
+
+def load_critique_records(critique_files: List[Path]) -> List[Dict]:
+    """Records from bulk JSONL files and single-critique JSON files."""
+    records = []
+    for critique_file in critique_files:
+        if critique_file.suffix == '.jsonl':
+            records.extend(CritiqueStore(critique_file).successful())
+        else:
+            with open(critique_file, 'r', encoding='utf-8') as f:
+                records.append(json.load(f))
+    return records
+
+def format_critique_stats(scores: CritiqueScores) -> List[str]:
+    """Markdown lines: ranking with confidence intervals, agreement and self-preference."""
+    lines = ["| Translation | Accuracy (95% CI) | Accessibility (95% CI) | Critic scores | Best votes |",
+             "|-------------|-------------------|------------------------|---------------|------------|"]
+
+    def cell(row, metric):
+        mean, ci = row[f"{metric}_mean"], row[f"{metric}_ci"]
+        if np.isnan(mean):
+            return "–"
+        return f"{mean:.2f}" if np.isnan(ci) else f"{mean:.2f} ± {ci:.2f}"
+
+    for model, row in rank_models(scores).iterrows():
+        lines.append(f"| {model} | {cell(row, METRICS[0])} | {cell(row, METRICS[1])} | "
+                     f"{int(row[f'{METRICS[0]}_n'])} | {int(row['votes'])} |")
+    lines.append("")
+
+    agreement = critic_agreement(scores)
+    pairs = agreement.values[np.triu_indices(len(scores.critics), k=1)]
+    pairs = pairs[~np.isnan(pairs)]
+    vote_share = vote_agreement(scores)
+    lines.append(f"**Inter-critic agreement:** "
+                 f"{'mean accuracy-score correlation ' + format(pairs.mean(), '.2f') if len(pairs) else 'too few shared scores for correlation'}; "
+                 f"{'best-translation votes agree for ' + format(vote_share, '.0%') + ' of critic pairs' if not np.isnan(vote_share) else 'no paired votes'}")
+    lines.append("")
+
+    bias = self_preference(scores)
+    bias = bias[~bias["bias"].isna()]
+    if not bias.empty:
+        lines.append("**Self-preference** (own-model accuracy score minus the other critics' mean):")
+        for _, row in bias.iterrows():
+            lines.append(f"- {row['critic']} → {row['own_model']}: {row['bias']:+.2f} over {row['paragraphs']} paragraphs")
+        lines.append("")
+
+    return lines
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Cross-model divergence of translations, for triaging meta-commentary.
+
+Each English text becomes a profile of hashed character n-grams (orders 1-6,
+lowercased, whitespace removed, as in chrF): a rolling polynomial hash over
+the code point array gives every n-gram of one order in a single NumPy
+expression, and np.unique counts them. Two profiles are compared with one
+np.intersect1d over the (hash, order) keys, giving chrF-style precision and
+recall averaged over the orders, combined as F1 so the score is symmetric.
+A paragraph's divergence is one minus the mean similarity of its model
+pairs; paragraphs where the models essentially agree can skip the expensive
+LLM critique. The whole book (four models) scores in a few seconds.
+"""
+
+import json
+import logging
+from dataclasses import dataclass, field
+from itertools import combinations
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+MAX_ORDER = 6
+HASH_BASE = np.uint64(1_000_003)
+ORDER_BITS = 3  # low bits of a key hold the n-gram order
+
+@dataclass
+class NgramProfile:
+    """Sorted unique (hash, order) keys with their counts, plus n-gram totals per order."""
+    keys: np.ndarray
+    counts: np.ndarray
+    totals: np.ndarray  # index n -> number of n-grams of order n
+
+@dataclass
+class ParagraphDivergence:
+    """How much the models' translations of one paragraph differ."""
+    paragraph: int
+    divergence: float  # 1 - mean pairwise similarity
+    min_similarity: float
+    outlier: str  # model least similar to the others
+    similarities: Dict[str, float] = field(default_factory=dict)  # "model_a/model_b" -> similarity
+
+def ngram_profile(text: str, max_order: int = MAX_ORDER) -> NgramProfile:
+    """Hashed character n-gram counts of a text (whitespace removed, lowercased)."""
+    chars = np.frombuffer(''.join(text.lower().split()).encode('utf-32-le'), dtype=np.uint32).astype(np.uint64)
+    totals = np.zeros(max_order + 1, dtype=np.int64)
+
+    keys = []
+    hashes = chars.copy()
+    for order in range(1, max_order + 1):
+        if order > 1:
+            # hash of chars[i:i+order] from the hash of chars[i:i+order-1]
+            hashes = hashes[:-1] * HASH_BASE + chars[order - 1:]
+        if len(hashes) == 0:
+            break
+        totals[order] = len(hashes)
+        keys.append((hashes << np.uint64(ORDER_BITS)) | np.uint64(order))
+
+    if not keys:
+        return NgramProfile(np.zeros(0, dtype=np.uint64), np.zeros(0, dtype=np.int64), totals)
+
+    unique, counts = np.unique(np.concatenate(keys), return_counts=True)
+    return NgramProfile(unique, counts, totals)
+
+def chrf_similarity(a: NgramProfile, b: NgramProfile) -> float:
+    """Symmetric chrF-style similarity (F1 of order-averaged n-gram precision/recall)."""
+    orders = np.nonzero((a.totals > 0) & (b.totals > 0))[0]
+    if len(orders) == 0:
+        return 1.0 if a.totals.sum() == b.totals.sum() == 0 else 0.0
+
+    _, ia, ib = np.intersect1d(a.keys, b.keys, assume_unique=True, return_indices=True)
+    matched = np.minimum(a.counts[ia], b.counts[ib])
+    matched_orders = (a.keys[ia] & np.uint64((1 << ORDER_BITS) - 1)).astype(np.int64)
+    overlap = np.bincount(matched_orders, weights=matched, minlength=len(a.totals))
+
+    precision = (overlap[orders] / a.totals[orders]).mean()
+    recall = (overlap[orders] / b.totals[orders]).mean()
+    if precision + recall == 0:
+        return 0.0
+    return float(2 * precision * recall / (precision + recall))
+
+def score_paragraphs(english: Dict[str, Dict[int, str]]) -> List[ParagraphDivergence]:
+    """Divergence of every paragraph translated by at least two models, most divergent first."""
+    paragraphs = sorted({number for texts in english.values() for number in texts})
+
+    results = []
+    for paragraph in paragraphs:
+        profiles = {model: ngram_profile(texts[paragraph])
+                    for model, texts in sorted(english.items()) if texts.get(paragraph)}
+        if len(profiles) < 2:
+            continue
+
+        similarities = {}
+        per_model: Dict[str, List[float]] = {model: [] for model in profiles}
+        for a, b in combinations(profiles, 2):
+            similarity = chrf_similarity(profiles[a], profiles[b])
+            similarities[f"{a}/{b}"] = similarity
+            per_model[a].append(similarity)
+            per_model[b].append(similarity)
+
+        values = np.array(list(similarities.values()))
+        results.append(ParagraphDivergence(
+            paragraph=paragraph,
+            divergence=float(1 - values.mean()),
+            min_similarity=float(values.min()),
+            outlier=min(per_model, key=lambda model: np.mean(per_model[model])),
+            similarities=similarities,
+        ))
+
+    results.sort(key=lambda result: (-result.divergence, result.paragraph))
+    return results
+
+def passages_english(models: Dict) -> Dict[str, Dict[int, str]]:
+    """Model -> paragraph -> English from extract-passages JSON models data."""
+    english = {}
+    for model_name, model_data in models.items():
+        if not isinstance(model_data, dict) or "error" in model_data:
+            continue
+        english[model_name] = {
+            int(number): para_data['english_translation']
+            for number, para_data in model_data.items()
+            if para_data and not para_data.get('error_message') and para_data.get('english_translation')
+        }
+    return english
+
+def translation_files_english(file_paths: List[Path]) -> Dict[str, Dict[int, str]]:
+    """Model -> paragraph -> English from full_translation_*.md files."""
+    from concordance import load_english
+    return {path.stem.replace('full_translation_', ''): load_english(path) for path in file_paths}
+
+def select_for_critique(divergences: List[ParagraphDivergence], top: Optional[int] = None,
+                        min_divergence: Optional[float] = None) -> List[int]:
+    """Paragraphs worth critiquing: the `top` most divergent and/or those above a threshold."""
+    selected = divergences
+    if min_divergence is not None:
+        selected = [d for d in selected if d.divergence >= min_divergence]
+    if top is not None:
+        selected = selected[:top]
+    return sorted(d.paragraph for d in selected)
+
+def save_divergences(divergences: List[ParagraphDivergence], output_file: Path):
+    with open(output_file, 'w', encoding='utf-8') as f:
+        json.dump([vars(d) for d in divergences], f, indent=2, ensure_ascii=False)
+
+def format_divergence_report(divergences: List[ParagraphDivergence], limit: int = 50) -> str:
+    """Markdown table of the most divergent paragraphs."""
+    lines = ["# Cross-Model Divergence", ""]
+    if not divergences:
+        lines.append("No paragraph has translations from two or more models.")
+        return "\n".join(lines)
+
+    values = np.array([d.divergence for d in divergences])
+    lines.append(f"{len(divergences)} paragraphs; divergence median {np.median(values):.3f}, "
+                 f"90th percentile {np.percentile(values, 90):.3f}, max {values.max():.3f}")
+    lines.append("")
+    lines.append("| Paragraph | Divergence | Least similar pair | Outlier |")
+    lines.append("|-----------|------------|--------------------|---------|")
+    for d in divergences[:limit]:
+        pair = min(d.similarities, key=d.similarities.get)
+        lines.append(f"| {d.paragraph} | {d.divergence:.3f} | {pair} ({d.min_similarity:.3f}) | {d.outlier} |")
+    return "\n".join(lines)
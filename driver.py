@@ -7,7 +7,7 @@ Basic flat configuration version.
 import argparse
 import logging
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 import sys
 
 from langchain.globals import set_debug, set_verbose
@@ -25,7 +25,7 @@ def setup_logging(level: str = "INFO"):
 def main():
     parser = argparse.ArgumentParser(description="Translate Being and Time using LangChain")
     parser.add_argument("--mode", default="translate", 
-                       choices=["translate", "extract-terms", "generate-configs", "extract-passages", "compare-passages", "meta-commentary", "compile-final-analysis"],
+                       choices=["translate", "extract-terms", "generate-configs", "extract-passages", "compare-passages", "meta-commentary", "compile-final-analysis", "export-dataset", "merge-translations", "retranslate-changed", "concordance", "check-consistency", "bulk-meta-commentary", "rank-divergence", "critique-stats"],
                        help="Operation mode")
     parser.add_argument("--input", "-i", type=Path, default=Path("cleaned_text.md"),
                        help="Input cleaned text file")
@@ -47,24 +47,64 @@ def main():
                        help="Enable LangChain debug mode (logs all events)")
     parser.add_argument("--verbose", action="store_true",
                        help="Enable LangChain verbose mode (logs important events)")
+    parser.add_argument("--mmap", action="store_true",
+                       help="Memory-map the cleaned text instead of reading it (translate, retranslate-changed, export-dataset)")
     
     # Term extraction specific arguments
     parser.add_argument("--top-terms", type=int, default=50,
                        help="Number of top terms to analyze with LLM")
     parser.add_argument("--min-freq", type=int, default=3,
                        help="Minimum frequency for term inclusion")
+    parser.add_argument("--workers", type=int, default=1,
+                       help="Processes for paragraph scanning in term extraction")
+    parser.add_argument("--term-scorer", default="heuristic", choices=["heuristic", "tfidf"],
+                       help="Ranking of terms sent for LLM analysis (tfidf: distinctiveness over § sections)")
+    parser.add_argument("--lemmatizer", default="snowball", choices=["snowball", "spacy"],
+                       help="Cluster term forms by Snowball stem or by spaCy lemma")
+    parser.add_argument("--spacy-model", default="de_core_news_sm",
+                       help="spaCy pipeline for --lemmatizer spacy")
+    parser.add_argument("--lemma-cache", type=Path, default=Path("lemma_cache.json"),
+                       help="Per-paragraph lemma cache for --lemmatizer spacy")
+    parser.add_argument("--concurrency", type=int, default=8,
+                       help="Concurrent LLM requests for term analysis (per-provider cap for bulk critiques)")
+    parser.add_argument("--term-cache", type=Path, default=Path("term_analysis_cache.json"),
+                       help="Cache of term analyses keyed by model, stem and contexts")
+    parser.add_argument("--refresh-terms", action="store_true",
+                       help="Re-analyze terms even if a cached analysis exists")
     
     # Passage extraction arguments
     parser.add_argument("--files", help="Comma-separated list of translation files to extract from")
     parser.add_argument("--paragraphs", help="Paragraph range to extract (e.g., '75-80')")
+    parser.add_argument("--shard-size", type=int,
+                       help="extract-passages: write JSONL shards of N paragraphs into the --output directory")
+    parser.add_argument("--render-cache", type=Path, default=Path("comparison_render_cache.json"),
+                       help="compare-passages: rendered paragraph sections keyed by input hash")
+    
+    # Concordance arguments
+    parser.add_argument("--term", help="German word or prefix to look up (concordance mode)")
+    
+    # Consistency arguments
+    parser.add_argument("--term-map", type=Path, default=Path("CONVENTIONS.md"),
+                       help="Term conventions: CONVENTIONS.md or a YAML/JSON German -> rendering map")
     
     # Meta-commentary arguments
     parser.add_argument("--critic-model", help="Model to use for meta-commentary analysis")
+    parser.add_argument("--critics", help="Comma-separated critic models (bulk-meta-commentary mode)")
+    parser.add_argument("--triage-top", type=int,
+                       help="Only critique the N paragraphs whose translations diverge most")
+    parser.add_argument("--min-divergence", type=float,
+                       help="Only critique paragraphs with at least this cross-model divergence (0-1)")
+    parser.add_argument("--early-stop", action="store_true",
+                       help="Ask critics in --critics order; stop once a majority best translation is locked in")
+    parser.add_argument("--score-margin", type=float,
+                       help="With --early-stop, also stop when the top mean accuracy score leads by this much")
     
     # Final analysis compilation arguments
     parser.add_argument("--critiques", help="Comma-separated critique JSON files for final analysis")
     parser.add_argument("--with-summary", action="store_true",
                        help="Generate final summary with GPT (for compile-final-analysis mode)")
+    parser.add_argument("--summary-cache", type=Path, default=Path("summary_cache.json"),
+                       help="Section summary cache for --with-summary (unchanged sections are not re-summarized)")
     
     args = parser.parse_args()
     
@@ -95,31 +135,63 @@ def main():
         compare_passages_mode(args, logger)
     elif args.mode == "meta-commentary":
         meta_commentary_mode(args, logger)
+    elif args.mode == "bulk-meta-commentary":
+        bulk_meta_commentary_mode(args, logger)
+    elif args.mode == "rank-divergence":
+        rank_divergence_mode(args, logger)
+    elif args.mode == "critique-stats":
+        critique_stats_mode(args, logger)
     elif args.mode == "compile-final-analysis":
         compile_final_analysis_mode(args, logger)
+    elif args.mode == "export-dataset":
+        export_dataset_mode(args, logger)
+    elif args.mode == "merge-translations":
+        merge_translations_mode(args, logger)
+    elif args.mode == "retranslate-changed":
+        retranslate_changed_mode(args, logger)
+    elif args.mode == "concordance":
+        concordance_mode(args, logger)
+    elif args.mode == "check-consistency":
+        check_consistency_mode(args, logger)
     else:
         translate_mode(args, logger)
 
 def extract_terms_mode(args, logger):
     """Term extraction mode."""
-    from term_extractor import TermExtractor
+    from term_extractor import TermAnalysisCache, TermExtractor
+    from term_index import build_term_index
     
     logger.info("Running term extraction mode")
-    extractor = TermExtractor(args.input, args.model)
+    lemmatizer = None
+    if args.lemmatizer == "spacy":
+        from lemmatizer import SpacyLemmatizer
+        lemmatizer = SpacyLemmatizer(args.spacy_model, n_process=args.workers, cache_file=args.lemma_cache)
+    extractor = TermExtractor(args.input, args.model, workers=args.workers, lemmatizer=lemmatizer)
     
     # Extract and cluster by stems
     philosophical_terms = extractor.extract_and_cluster_terms()
     
+    # Record where every term occurs (paragraph numbers as in translate mode),
+    # keyed by the same stems or lemmas as the clustered terms
+    output_dir = args.output.parent if args.output != Path("translation.md") else Path(".")
+    term_index = build_term_index(extractor.chunker, workers=args.workers, stem=extractor.normalize)
+    term_index.save(output_dir / "term_index.json")
+    
     # Prioritize and analyze terms
-    priority_terms = extractor.prioritize_terms(philosophical_terms, args.top_terms)
-    analyzed_terms = extractor.analyze_terms_batch(priority_terms)
+    priority_terms = extractor.prioritize_terms(philosophical_terms, args.top_terms, args.term_scorer)
+    cache = TermAnalysisCache(args.term_cache)
+    if (output_dir / "term_analysis.json").exists():
+        imported = cache.import_analysis(output_dir / "term_analysis.json")
+        if imported:
+            logger.info(f"Imported {imported} analyses from term_analysis.json into the cache")
+    analyzed_terms = extractor.analyze_terms_batch(priority_terms, args.concurrency, cache, args.refresh_terms)
     
     # Save analysis
-    output_dir = args.output.parent if args.output != Path("translation.md") else Path(".")
     extractor.save_analysis(analyzed_terms, output_dir / "term_analysis.json")
     
     logger.info(f"Term extraction complete. Found {len(analyzed_terms)} terms.")
     logger.info(f"Analysis saved to term_analysis.json")
+    logger.info(f"Term locations saved to term_index.json")
 
 def generate_configs_mode(args, logger):
     """Generate configuration files from term analysis."""
@@ -159,6 +231,35 @@ def generate_configs_mode(args, logger):
     
     logger.info("Generated GLOSSARY.md and CONVENTIONS.md")
 
+def write_translation_block(f, index: int, german: str, result: PhilosophicalTranslation):
+    """Write one translated paragraph in the translation markdown format."""
+    f.write(f"## Paragraph {index}\n\n")
+    f.write(f"**German:**\n{german}\n\n")
+    f.write(f"**English:**\n{result.translation}\n\n")
+    
+    if result.thinking:
+        f.write(f"**Translator's Notes:**\n{result.thinking}\n\n")
+    
+    if result.key_terms:
+        f.write(f"**Key Terms:** {', '.join(result.key_terms)}\n\n")
+    
+    if result.uncertainties:
+        f.write(f"**Translation Uncertainties:**\n")
+        for uncertainty in result.uncertainties:
+            f.write(f"- {uncertainty}\n")
+        f.write("\n")
+    
+    f.write("---\n\n")
+    f.flush()  # Force write to disk immediately
+
+def write_error_block(f, index: int, german: str, error: Exception):
+    """Write a failed paragraph so it can be found and repaired later."""
+    f.write(f"## Paragraph {index} - ERROR\n\n")
+    f.write(f"**German:**\n{german}\n\n")
+    f.write(f"**Error:**\n{str(error)}\n\n")
+    f.write("---\n\n")
+    f.flush()
+
 def translate_mode(args, logger):
     """Translation mode with progressive output."""
     # Initialize components
@@ -170,13 +271,12 @@ def translate_mode(args, logger):
     config = prompt_builder.build_context_dict()
     
     logger.info(f"Loading text from: {args.input}")
-    chunker = TextChunker(args.input)
-    paragraphs = chunker.extract_paragraphs()
+    chunker = TextChunker(args.input, use_mmap=args.mmap)
+    total_paragraphs = len(chunker)
     
-    logger.info(f"Found {len(paragraphs)} paragraphs")
+    logger.info(f"Found {total_paragraphs} paragraphs")
     
     # Handle sentinel value and validate range
-    total_paragraphs = len(paragraphs)
     end_idx = total_paragraphs if args.end == -1 else args.end
     
     if args.start >= total_paragraphs:
@@ -207,9 +307,9 @@ def translate_mode(args, logger):
             f.flush()  # Ensure header is written immediately
         
         for i in range(args.start, end_idx):
-            current_german = paragraphs[i]
+            current_german = chunker.get_paragraph(i)
             
-            logger.info(f"Translating paragraph {i}/{len(paragraphs)}")
+            logger.info(f"Translating paragraph {i}/{total_paragraphs}")
             logger.debug(f"German text: {current_german[:100]}...")
             
             # Build translation context
@@ -230,24 +330,7 @@ def translate_mode(args, logger):
                 structured_result = translator.translate_paragraph(context, config)
                 
                 # Write immediately after each translation
-                f.write(f"## Paragraph {i}\n\n")
-                f.write(f"**German:**\n{current_german}\n\n")
-                f.write(f"**English:**\n{structured_result.translation}\n\n")
-                
-                if structured_result.thinking:
-                    f.write(f"**Translator's Notes:**\n{structured_result.thinking}\n\n")
-                
-                if structured_result.key_terms:
-                    f.write(f"**Key Terms:** {', '.join(structured_result.key_terms)}\n\n")
-                
-                if structured_result.uncertainties:
-                    f.write(f"**Translation Uncertainties:**\n")
-                    for uncertainty in structured_result.uncertainties:
-                        f.write(f"- {uncertainty}\n")
-                    f.write("\n")
-                
-                f.write("---\n\n")
-                f.flush()  # Force write to disk immediately
+                write_translation_block(f, i, current_german, structured_result)
                 
                 # Update history (use just the translation text for context)
                 german_history.append(current_german)
@@ -258,21 +341,17 @@ def translate_mode(args, logger):
                 
             except Exception as e:
                 logger.error(f"Error translating paragraph {i}: {e}")
-                f.write(f"## Paragraph {i} - ERROR\n\n")
-                f.write(f"**German:**\n{current_german}\n\n")
-                f.write(f"**Error:**\n{str(e)}\n\n")
-                f.write("---\n\n")
-                f.flush()
+                write_error_block(f, i, current_german, e)
                 continue
     
     logger.info(f"Translation complete! Output saved to: {args.output}")
     logger.info(f"Translated {len(translations)} paragraphs successfully")
 
 def extract_passages_mode(args, logger):
-    """Extract specific paragraphs from multiple translation files to JSON."""
-    import json
+    """Extract specific paragraphs from multiple translation files to JSON or JSONL."""
     import dataclasses
     from datetime import datetime
+    from passages_store import PassageWriter
     from translation_parser import TranslationParser
     
     if not args.files:
@@ -305,56 +384,47 @@ def extract_passages_mode(args, logger):
     
     logger.info(f"Extracting paragraphs {args.paragraphs} from {len(file_paths)} translation files")
     
-    # Extract data structure
-    extracted_data = {
+    # Nested JSON for .json output, streamed records for .jsonl or --shard-size (a directory)
+    metadata = {
         "paragraph_range": args.paragraphs,
         "paragraph_numbers": paragraph_numbers,
         "extracted_date": datetime.now().isoformat(),
-        "models": {}
     }
+    total_extracted = 0
     
-    for file_path in file_paths:
-        logger.info(f"Parsing {file_path.name}...")
-        
-        # Determine model name from filename
-        model_name = file_path.stem.replace('full_translation_', '')
-        
-        try:
-            parser = TranslationParser(file_path)
-            stats = parser.get_statistics()
-            logger.info(f"  {file_path.name}: {stats}")
+    with PassageWriter(args.output, paragraph_numbers, metadata, args.shard_size) as writer:
+        for file_path in file_paths:
+            logger.info(f"Parsing {file_path.name}...")
             
-            # Extract requested paragraphs
-            model_data = {}
-            for para_num in paragraph_numbers:
-                paragraph = parser.get_paragraph(para_num)
-                if paragraph:
-                    # Convert dataclass to dict for JSON serialization
-                    para_dict = dataclasses.asdict(paragraph)
-                    model_data[str(para_num)] = para_dict
-                    logger.debug(f"  Extracted paragraph {para_num}")
-                else:
-                    logger.warning(f"  Paragraph {para_num} not found in {file_path.name}")
-                    model_data[str(para_num)] = None
+            # Determine model name from filename
+            model_name = file_path.stem.replace('full_translation_', '')
             
-            extracted_data["models"][model_name] = model_data
-            logger.info(f"  ✓ Extracted {len([p for p in model_data.values() if p is not None])} paragraphs")
-            
-        except Exception as e:
-            logger.error(f"Error parsing {file_path}: {e}")
-            extracted_data["models"][model_name] = {"error": str(e)}
-    
-    # Save to JSON
-    logger.info(f"Saving extracted passages to {args.output}")
-    with open(args.output, 'w', encoding='utf-8') as f:
-        json.dump(extracted_data, f, indent=2, ensure_ascii=False)
-    
-    # Summary
-    total_extracted = sum(
-        len([p for p in model_data.values() if p is not None and not isinstance(p, dict) or "error" not in p])
-        for model_data in extracted_data["models"].values()
-        if not isinstance(model_data, dict) or "error" not in model_data
-    )
+            try:
+                parser = TranslationParser(file_path)
+                stats = parser.get_statistics()
+                logger.info(f"  {file_path.name}: {stats}")
+                
+                # Extract requested paragraphs
+                extracted = 0
+                for para_num in paragraph_numbers:
+                    paragraph = parser.get_paragraph(para_num)
+                    if paragraph:
+                        # Convert dataclass to dict for JSON serialization
+                        writer.write(model_name, para_num, dataclasses.asdict(paragraph))
+                        extracted += 1
+                        logger.debug(f"  Extracted paragraph {para_num}")
+                    else:
+                        logger.warning(f"  Paragraph {para_num} not found in {file_path.name}")
+                        writer.write(model_name, para_num, None)
+                
+                total_extracted += extracted
+                logger.info(f"  ✓ Extracted {extracted} paragraphs")
+                
+            except Exception as e:
+                logger.error(f"Error parsing {file_path}: {e}")
+                writer.write_error(model_name, str(e))
+        
+        logger.info(f"Saving extracted passages to {args.output}")
     
     logger.info(f"✓ Extraction complete!")
     logger.info(f"  Paragraphs requested: {len(paragraph_numbers)}")
@@ -363,9 +433,10 @@ def extract_passages_mode(args, logger):
     logger.info(f"  Output: {args.output}")
 
 def compare_passages_mode(args, logger):
-    """Generate markdown comparison from extracted passages JSON."""
-    import json
+    """Generate markdown comparison from extracted passages, streamed paragraph by paragraph."""
     from datetime import datetime
+    from comparison import RenderCache, comparison_trailer, write_comparison
+    from passages_store import PassageStore
     
     if not args.input or not args.input.exists():
         logger.error(f"Input JSON file required and must exist: {args.input}")
@@ -386,13 +457,10 @@ def compare_passages_mode(args, logger):
         logger.error(f"Invalid paragraph range: {args.paragraphs}. Use format '75-80' or '77'")
         sys.exit(1)
     
-    # Load extracted data
+    # Load extracted data (only the selected paragraphs)
     logger.info(f"Loading extracted passages from {args.input}")
-    with open(args.input, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    available_paragraphs = data.get("paragraph_numbers", [])
-    models = data.get("models", {})
+    store = PassageStore(args.input)
+    available_paragraphs = store.paragraph_numbers
     
     # Validate selected paragraphs are available
     missing = [p for p in selected_paragraphs if p not in available_paragraphs]
@@ -400,117 +468,40 @@ def compare_passages_mode(args, logger):
         logger.error(f"Paragraphs {missing} not found in extracted data. Available: {available_paragraphs}")
         sys.exit(1)
     
-    logger.info(f"Comparing paragraphs {selected_paragraphs} from {len(models)} models")
+    logger.info(f"Comparing paragraphs {selected_paragraphs} from {args.input}")
     
-    # Generate comparison markdown
-    markdown_content = []
-    markdown_content.append(f"# Philosophical Translation Comparison - Paragraph{'s' if len(selected_paragraphs) > 1 else ''} {args.paragraphs}")
-    markdown_content.append("")
-    markdown_content.append(f"*Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} from {args.input}*")
-    markdown_content.append("")
+    # Header, then each paragraph section as it is rendered (or found in the render cache)
+    header = [
+        f"# Philosophical Translation Comparison - Paragraph{'s' if len(selected_paragraphs) > 1 else ''} {args.paragraphs}",
+        "",
+        f"*Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} from {args.input}*",
+        "",
+    ]
     
-    for para_num in selected_paragraphs:
-        markdown_content.append(f"## Paragraph {para_num}")
-        markdown_content.append("")
-        
-        # Get German original (should be same across all models)
-        german_text = None
-        for model_name, model_data in models.items():
-            if isinstance(model_data, dict) and str(para_num) in model_data:
-                para_data = model_data[str(para_num)]
-                if para_data and isinstance(para_data, dict):
-                    german_text = para_data.get('german_text', '').strip()
-                    break
-        
-        if german_text:
-            markdown_content.append("### German Original")
-            markdown_content.append("")
-            markdown_content.append(german_text)
-            markdown_content.append("")
-        
-        # Compare each model's translation
-        for model_name, model_data in models.items():
-            if isinstance(model_data, dict) and "error" in model_data:
-                logger.warning(f"Skipping {model_name} due to parsing error: {model_data['error']}")
-                continue
-                
-            markdown_content.append(f"### {model_name.upper()} Translation")
-            markdown_content.append("")
-            
-            if str(para_num) in model_data and model_data[str(para_num)]:
-                para_data = model_data[str(para_num)]
-                
-                if para_data.get('error_message'):
-                    markdown_content.append(f"**Error:** {para_data['error_message']}")
-                    markdown_content.append("")
-                    continue
-                
-                # English translation
-                if para_data.get('english_translation'):
-                    markdown_content.append(f"**English:**")
-                    markdown_content.append(para_data['english_translation'].strip())
-                    markdown_content.append("")
-                
-                # Translator's reasoning
-                if para_data.get('thinking'):
-                    markdown_content.append(f"**Translator's Notes:**")
-                    markdown_content.append(para_data['thinking'].strip())
-                    markdown_content.append("")
-                
-                # Key terms
-                if para_data.get('key_terms'):
-                    terms = para_data['key_terms']
-                    if terms and len(terms) > 0:
-                        markdown_content.append(f"**Key Terms:** {', '.join(terms)}")
-                        markdown_content.append("")
-                
-                # Uncertainties
-                if para_data.get('uncertainties'):
-                    uncertainties = para_data['uncertainties']
-                    if uncertainties and len(uncertainties) > 0:
-                        markdown_content.append(f"**Translation Uncertainties:**")
-                        for uncertainty in uncertainties:
-                            markdown_content.append(f"- {uncertainty}")
-                        markdown_content.append("")
-            else:
-                markdown_content.append("**No translation data available**")
-                markdown_content.append("")
-        
-        if len(selected_paragraphs) > 1:
-            markdown_content.append("---")
-            markdown_content.append("")
-    
-    # Add summary analysis section
-    markdown_content.append("## Comparative Analysis")
-    markdown_content.append("")
-    markdown_content.append("### Terminological Approaches")
-    markdown_content.append("*[Space for analysis of how each model handles key German philosophical terms]*")
-    markdown_content.append("")
-    markdown_content.append("### Translation Strategies")
-    markdown_content.append("*[Space for analysis of literal vs interpretive approaches]*")
-    markdown_content.append("")
-    markdown_content.append("### Philosophical Reasoning Quality")
-    markdown_content.append("*[Space for evaluation of the depth and accuracy of each model's commentary]*")
-    markdown_content.append("")
-    
-    # Save comparison
-    markdown_text = '\n'.join(markdown_content)
     logger.info(f"Writing comparison to {args.output}")
+    cache = RenderCache(args.render_cache)
     
     with open(args.output, 'w', encoding='utf-8') as f:
-        f.write(markdown_text)
+        f.write('\n'.join(header) + '\n')
+        try:
+            counts = write_comparison(f, store.paragraphs(selected_paragraphs), cache,
+                                      separator=len(selected_paragraphs) > 1)
+        finally:
+            cache.save()
+        f.write('\n'.join(comparison_trailer()))
     
     logger.info(f"✓ Comparison complete!")
-    logger.info(f"  Paragraphs compared: {len(selected_paragraphs)}")
-    logger.info(f"  Models compared: {len([m for m in models.keys() if not isinstance(models[m], dict) or 'error' not in models[m]])}")
+    logger.info(f"  Paragraphs compared: {len(selected_paragraphs)} "
+                f"({counts['rendered']} rendered, {counts['cached']} from cache)")
+    logger.info(f"  Models compared: {counts['models']}")
     logger.info(f"  Output: {args.output}")
 
 def meta_commentary_mode(args, logger):
     """Generate AI meta-commentary on competing translations."""
     import json
-    from meta_analysis import MetaCommentary, TranslationCritique
-    from translator import Translator
-    from prompt_builder import TranslationPromptBuilder
+    from critique import (build_critique_prompt, comparison_for_paragraph, critique_chain,
+                          critique_record, unwrap_meta_commentary)
+    from passages_store import PassageStore
     
     if not args.input or not args.input.exists():
         logger.error(f"Input JSON file required and must exist: {args.input}")
@@ -528,161 +519,44 @@ def meta_commentary_mode(args, logger):
     try:
         paragraph_number = int(args.paragraphs)
     except ValueError:
-        logger.error("Meta-commentary mode requires a single paragraph number, not a range")
+        logger.error("Meta-commentary mode requires a single paragraph number, not a range "
+                     "(use bulk-meta-commentary for ranges)")
         sys.exit(1)
     
-    # Load extracted data
+    # Load extracted data (only this paragraph)
     logger.info(f"Loading extracted passages from {args.input}")
-    with open(args.input, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    models = data.get("models", {})
-    available_paragraphs = data.get("paragraph_numbers", [])
+    store = PassageStore(args.input)
+    available_paragraphs = store.paragraph_numbers
     
     if paragraph_number not in available_paragraphs:
         logger.error(f"Paragraph {paragraph_number} not found. Available: {available_paragraphs}")
         sys.exit(1)
     
+    models = store.models([paragraph_number])
+    
     logger.info(f"Generating meta-commentary for paragraph {paragraph_number} using {args.critic_model}")
     
     # Extract clean comparison data
-    comparison_data = {
-        "paragraph_number": paragraph_number,
-        "german_original": "",
-        "translations": {}
-    }
-    
-    for model_name, model_data in models.items():
-        if isinstance(model_data, dict) and "error" in model_data:
-            logger.warning(f"Skipping {model_name} due to parsing error")
-            continue
-            
-        para_data = model_data.get(str(paragraph_number))
-        if not para_data or para_data.get('error_message'):
-            logger.warning(f"Skipping {model_name} - no valid translation for paragraph {paragraph_number}")
-            continue
-        
-        # Get German original (same for all models)
-        if not comparison_data["german_original"]:
-            comparison_data["german_original"] = para_data.get('german_text', '').strip()
-        
-        # Extract key elements for comparison
-        translation_summary = {
-            "english": para_data.get('english_translation', '').strip(),
-            "key_reasoning": para_data.get('thinking', '').strip()[:500] + "..." if len(para_data.get('thinking', '')) > 500 else para_data.get('thinking', '').strip(),
-            "key_terms": para_data.get('key_terms', []),
-            "uncertainties": para_data.get('uncertainties', [])
-        }
-        
-        comparison_data["translations"][model_name] = translation_summary
+    comparison_data = comparison_for_paragraph(models, paragraph_number)
     
     if len(comparison_data["translations"]) < 2:
         logger.error(f"Need at least 2 valid translations to compare. Found: {len(comparison_data['translations'])}")
         sys.exit(1)
     
-    # Create critique prompt
-    critique_prompt = f"""You are analyzing different AI translations of this Heidegger passage from "Being and Time". 
-
-# German Original (Paragraph {paragraph_number})
-{comparison_data['german_original']}
-
-# Competing Translations
-
-"""
-    
-    for model_name, trans_data in comparison_data["translations"].items():
-        critique_prompt += f"""## {model_name.upper()} Translation
-**English:** {trans_data['english']}
-
-**Key Reasoning:** {trans_data['key_reasoning']}
-
-**Key Terms:** {', '.join(trans_data['key_terms']) if trans_data['key_terms'] else 'None listed'}
-
-**Uncertainties:** {'; '.join(trans_data['uncertainties']) if trans_data['uncertainties'] else 'None listed'}
-
-"""
-    
-    critique_prompt += """
-# Your Task
-
-Analyze all translations and provide:
-
-1. **Critique each translation** - strengths, weaknesses, philosophical accuracy (score 1-10)
-2. **Identify the best translation** - which model produced the most philosophically sound result?
-3. **Defend your choice** - detailed argument for why it's superior 
-4. **Show your reasoning** - your analytical process and key considerations
-5. **Overall insights** - what this reveals about AI philosophical translation
-
-Focus on: terminology choices, phenomenological fidelity, accessibility vs precision, interpretive depth.
-
-Be thorough, specific, and fair in your analysis. You may critique your own translation if others are superior.
-"""
-    
     # Generate critique using the specified critic model
+    critique_prompt = build_critique_prompt(comparison_data)
     logger.info(f"Generating critique with {args.critic_model}...")
-    critic = Translator(args.critic_model)
-    
-    # Use structured output for meta-commentary
-    if args.critic_model.startswith("gemini") or args.critic_model.startswith("claude") or args.critic_model.startswith("grok"):
-        # Use PydanticOutputParser for problematic models
-        from langchain_core.output_parsers import PydanticOutputParser
-        parser = PydanticOutputParser(pydantic_object=MetaCommentary)
-        format_instructions = parser.get_format_instructions().replace("{", "{{").replace("}", "}}")
-        critique_prompt += f"\n\n# Output Format\n\nRespond with valid JSON in this exact format:\n{format_instructions}"
-        structured_llm = critic.model | parser
-    else:
-        # Clean approach for GPT
-        structured_llm = critic.model.with_structured_output(MetaCommentary)
-    
-    # Create simple prompt template
-    from langchain_core.prompts import ChatPromptTemplate
-    prompt_template = ChatPromptTemplate.from_messages([
-        ("system", "You are an expert in philosophical translation, analyzing different AI approaches to translating Heidegger."),
-        ("human", "{critique_prompt}")
-    ])
     
-    # Generate critique
     try:
-        chain = prompt_template | structured_llm
-        result = chain.invoke({"critique_prompt": critique_prompt})
-        
-        # Handle different response formats
-        if isinstance(result, dict) and 'parsed' in result:
-            meta_commentary = result['parsed'] 
-        else:
-            meta_commentary = result
-        
-        if not meta_commentary:
-            logger.error("Failed to generate meta-commentary")
-            sys.exit(1)
-        
+        result = critique_chain(args.critic_model).invoke({"critique_prompt": critique_prompt})
+        meta_commentary = unwrap_meta_commentary(result)
         logger.info(f"Generated critique: {len(critique_prompt)} char prompt -> {meta_commentary.critic_model} analysis")
-        
     except Exception as e:
         logger.error(f"Error generating meta-commentary: {e}")
         sys.exit(1)
     
     # Save structured result
-    output_data = {
-        "paragraph_number": paragraph_number,
-        "critic_model": args.critic_model,
-        "generated_at": json.dumps(comparison_data, indent=2, ensure_ascii=False),  # Include source data
-        "meta_commentary": {
-            "critic_model": meta_commentary.critic_model,
-            "paragraph_number": meta_commentary.paragraph_number,
-            "critiques": {k: {
-                "model_name": v.model_name,
-                "strengths": v.strengths, 
-                "weaknesses": v.weaknesses,
-                "philosophical_accuracy_score": v.philosophical_accuracy_score,
-                "accessibility_score": v.accessibility_score
-            } for k, v in meta_commentary.critiques.items()},
-            "best_translation": meta_commentary.best_translation,
-            "reasoning": meta_commentary.reasoning,
-            "thinking": meta_commentary.thinking,
-            "overall_insights": meta_commentary.overall_insights
-        }
-    }
+    output_data = critique_record(paragraph_number, args.critic_model, comparison_data, meta_commentary)
     
     logger.info(f"Saving meta-commentary to {args.output}")
     with open(args.output, 'w', encoding='utf-8') as f:
@@ -695,17 +569,152 @@ Be thorough, specific, and fair in your analysis. You may critique your own tran
     logger.info(f"  Best translation (according to {args.critic_model}): {meta_commentary.best_translation}")
     logger.info(f"  Output: {args.output}")
 
-def generate_final_summary(analysis_file: Path, translation_choices: dict, accuracy_scores: dict, num_translations: int, num_critiques: int, logger) -> str:
-    """Generate concluding summary using GPT."""
-    from translator import Translator
+def bulk_meta_commentary_mode(args, logger):
+    """Critique a paragraph range with several critics concurrently, resumably."""
+    import asyncio
+    import time
+    from critique import (CritiqueStore, log_critique_outcomes, log_early_stopping, run_bulk_critiques,
+                          run_sequential_critiques)
+    from passages_store import PassageStore
+    
+    if not args.input or not args.input.exists():
+        logger.error(f"Input JSON file required and must exist: {args.input}")
+        sys.exit(1)
+    
+    if not args.critics:
+        logger.error("--critics argument required for bulk-meta-commentary mode")
+        sys.exit(1)
+    
+    logger.info(f"Loading extracted passages from {args.input}")
+    store = PassageStore(args.input)
+    available_paragraphs = store.paragraph_numbers
+    
+    # Parse paragraph range (default: every extracted paragraph)
+    if args.paragraphs:
+        try:
+            if '-' in args.paragraphs:
+                start, end = map(int, args.paragraphs.split('-'))
+                paragraph_numbers = list(range(start, end + 1))
+            else:
+                paragraph_numbers = [int(args.paragraphs)]
+        except ValueError:
+            logger.error(f"Invalid paragraph range: {args.paragraphs}. Use format '75-80' or '77'")
+            sys.exit(1)
+        
+        missing = [n for n in paragraph_numbers if n not in available_paragraphs]
+        if missing:
+            logger.warning(f"Paragraphs not in {args.input}, skipped: {missing}")
+        paragraph_numbers = [n for n in paragraph_numbers if n in available_paragraphs]
+    else:
+        paragraph_numbers = list(available_paragraphs)
+    
+    models = store.models(paragraph_numbers)
+    
+    # Spend critique calls only where the models actually disagree
+    if args.triage_top is not None or args.min_divergence is not None:
+        from divergence import passages_english, score_paragraphs, select_for_critique
+        divergences = [d for d in score_paragraphs(passages_english(models)) if d.paragraph in paragraph_numbers]
+        selected = select_for_critique(divergences, args.triage_top, args.min_divergence)
+        logger.info(f"Triage: critiquing {len(selected)} of {len(paragraph_numbers)} paragraphs "
+                    f"by cross-model divergence")
+        paragraph_numbers = selected
+    
+    critics = [c.strip() for c in args.critics.split(',') if c.strip()]
+    output_file = args.output if args.output != Path("translation.md") else Path("critiques.jsonl")
+    store = CritiqueStore(output_file)
+    
+    logger.info(f"Critiquing {len(paragraph_numbers)} paragraphs with {len(critics)} critics "
+                f"({', '.join(critics)}) -> {output_file}")
+    
+    start = time.perf_counter()
+    if args.early_stop:
+        outcomes, results = asyncio.run(run_sequential_critiques(models, paragraph_numbers, critics, store,
+                                                                 args.concurrency, args.score_margin))
+        log_early_stopping(results)
+    else:
+        outcomes = asyncio.run(run_bulk_critiques(models, paragraph_numbers, critics, store, args.concurrency))
+    log_critique_outcomes(outcomes, time.perf_counter() - start)
+    
+    logger.info(f"✓ Bulk meta-commentary complete! Records in {output_file}")
+
+def rank_divergence_mode(args, logger):
+    """Rank paragraphs by how much the models' translations differ."""
+    import time
+    from divergence import (format_divergence_report, passages_english, save_divergences,
+                            score_paragraphs, select_for_critique, translation_files_english)
+    from passages_store import PassageStore, is_passages_path
+    
+    # Passages from extract-passages (JSON, JSONL or shards), or the full translation files
+    if is_passages_path(args.input):
+        english = passages_english(PassageStore(args.input).models())
+    else:
+        if args.files:
+            file_paths = [Path(f.strip()) for f in args.files.split(',')]
+        else:
+            file_paths = sorted(args.input.parent.glob('full_translation_*.md'))
+        
+        for file_path in file_paths:
+            if not file_path.exists():
+                logger.error(f"Translation file not found: {file_path}")
+                sys.exit(1)
+        english = translation_files_english(file_paths)
+    
+    if len(english) < 2:
+        logger.error(f"Need translations from at least 2 models. Found: {len(english)}")
+        sys.exit(1)
+    
+    start = time.perf_counter()
+    divergences = score_paragraphs(english)
+    logger.info(f"Scored {len(divergences)} paragraphs across {len(english)} models "
+                f"in {time.perf_counter() - start:.2f}s")
+    
+    if args.triage_top is not None or args.min_divergence is not None:
+        selected = select_for_critique(divergences, args.triage_top, args.min_divergence)
+        logger.info(f"Selected for critique ({len(selected)}): {','.join(map(str, selected))}")
+    
+    output_file = args.output if args.output != Path("translation.md") else Path("divergence_report.md")
+    output_file.write_text(format_divergence_report(divergences), encoding='utf-8')
+    save_divergences(divergences, output_file.with_suffix('.json'))
+    
+    logger.info(f"✓ Divergence ranking complete! Report saved to {output_file}")
+
+def critique_stats_mode(args, logger):
+    """Score statistics over every critique in the --critiques files."""
+    import time
+    from critique_stats import CritiqueScores, format_critique_stats, load_critique_records
+    
+    if not args.critiques:
+        logger.error("--critiques argument required for critique statistics")
+        sys.exit(1)
+    
+    critique_files = [Path(f.strip()) for f in args.critiques.split(',')]
+    for critique_file in critique_files:
+        if not critique_file.exists():
+            logger.error(f"Critique file not found: {critique_file}")
+            sys.exit(1)
+    
+    start = time.perf_counter()
+    scores = CritiqueScores()
+    scores.extend(load_critique_records(critique_files))
+    lines = ["# Critic Score Statistics", "",
+             f"{len(scores.critics)} critics, {len(scores.model_names)} translations, "
+             f"{len(scores.paragraphs)} paragraphs", ""]
+    lines.extend(format_critique_stats(scores))
+    logger.info(f"Aggregated critiques in {(time.perf_counter() - start) * 1000:.0f}ms")
+    
+    output_file = args.output if args.output != Path("translation.md") else Path("critique_stats.md")
+    output_file.write_text("\n".join(lines), encoding='utf-8')
+    
+    logger.info(f"✓ Critique statistics complete! Report saved to {output_file}")
+
+def generate_final_summary(analysis_file: Path, translation_choices: dict, accuracy_scores: dict, num_translations: int, num_critiques: int, logger, cache_file: Optional[Path] = None) -> str:
+    """Generate concluding summary with GPT: one call if the analysis fits, else section summaries (cached) and a reduce call."""
+    from summarizer import MapReduceSummarizer
     
     # Load the complete analysis that was just written
     with open(analysis_file, 'r', encoding='utf-8') as f:
         full_analysis = f.read()
     
-    # Create GPT translator
-    translator = Translator(model_name="gpt-4o")
-    
     # Build context about the experiment results
     consensus_info = ""
     if translation_choices:
@@ -717,42 +726,18 @@ def generate_final_summary(analysis_file: Path, translation_choices: dict, accur
             most_popular = max(choice_counts, key=choice_counts.get)
             consensus_info = f"Key finding: {most_popular} received {choice_counts[most_popular]} out of {len(translation_choices)} votes as the best translation."
     
-    prompt = f"""You are analyzing a completed AI translation experiment. Read this full analysis and write a concluding summary that synthesizes what happened and what it reveals.
-
-EXPERIMENT CONTEXT:
-- {num_translations} AI models each translated the same Heidegger paragraph
+    context = f"""- {num_translations} AI models each translated the same Heidegger paragraph
 - Then all {num_critiques} models critiqued all translations and chose the best one
-- {consensus_info}
-
-FULL ANALYSIS:
-{full_analysis}
-
-Write a final section titled "## Conclusion: What This Experiment Revealed" that covers:
-
-1. **What actually happened**: Brief recap of the experimental process (4 translations → 4 critiques)
-2. **The key finding**: Which translation was preferred and the level of consensus/disagreement
-3. **Meta-commentary insights**: What this reveals about AI's capability for philosophical evaluation
-4. **Broader significance**: What this means for AI-assisted scholarly work and transparent reasoning
-
-Keep it concise but insightful (~300-500 words). Write in academic tone. Focus on what this experiment actually demonstrates about AI philosophical reasoning capabilities."""
-
-    # Use simple completion
-    from langchain_core.prompts import ChatPromptTemplate
-    
-    prompt_template = ChatPromptTemplate.from_messages([
-        ("system", "You are an expert in AI and philosophical scholarship, writing a conclusion for an experimental study."),
-        ("human", "{prompt}")
-    ])
+- {consensus_info}"""
     
-    chain = prompt_template | translator.model
-    response = chain.invoke({"prompt": prompt})
-    
-    return response.content
+    summarizer = MapReduceSummarizer(model="gpt-4o", cache_file=cache_file)
+    return summarizer.summarize(full_analysis, context)
 
 def compile_final_analysis_mode(args, logger):
     """Compile comprehensive final analysis from passages and critiques."""
     import json
     from datetime import datetime
+    from passages_store import PassageStore
     from pathlib import Path
     
     if not args.input or not args.input.exists():
@@ -774,10 +759,9 @@ def compile_final_analysis_mode(args, logger):
         logger.error("Final analysis mode requires a single paragraph number, not a range")
         sys.exit(1)
     
-    # Load passages data
+    # Load passages data (only this paragraph)
     logger.info(f"Loading passages from {args.input}")
-    with open(args.input, 'r', encoding='utf-8') as f:
-        passages_data = json.load(f)
+    models = PassageStore(args.input).models([paragraph_number])
     
     # Load critique files
     critique_files = [Path(f.strip()) for f in args.critiques.split(',')]
@@ -789,6 +773,14 @@ def compile_final_analysis_mode(args, logger):
             logger.error(f"Critique file not found: {critique_file}")
             sys.exit(1)
         
+        # Bulk critique output: every critic's record for this paragraph
+        if critique_file.suffix == '.jsonl':
+            from critique import CritiqueStore
+            for record in CritiqueStore(critique_file).successful(paragraph_number):
+                critiques[record['critic_model']] = record['meta_commentary']
+                logger.info(f"  Loaded critique from {record['critic_model']} ({critique_file})")
+            continue
+        
         with open(critique_file, 'r', encoding='utf-8') as f:
             critique_data = json.load(f)
             critic_model = critique_data.get('critic_model', critique_file.stem.replace('_critiques_paragraph_77', ''))
@@ -796,7 +788,6 @@ def compile_final_analysis_mode(args, logger):
             logger.info(f"  Loaded critique from {critic_model}")
     
     # Extract paragraph data
-    models = passages_data.get("models", {})
     paragraph_data = {}
     german_original = ""
     
@@ -962,28 +953,20 @@ def compile_final_analysis_mode(args, logger):
                 ""
             ])
     
-    # Philosophical Accuracy Patterns
+    # Score statistics across critics (accuracy and accessibility)
     if accuracy_scores:
+        from critique_stats import CritiqueScores, format_critique_stats
+        
+        scores = CritiqueScores(models=list(paragraph_data))
+        scores.extend({"critic_model": critic_model, "paragraph_number": paragraph_number,
+                       "meta_commentary": meta_commentary}
+                      for critic_model, meta_commentary in critiques.items())
+        
         markdown_lines.extend([
-            "### Philosophical Accuracy Score Summary",
+            "### Critic Score Summary",
             ""
         ])
-        
-        # Calculate average scores for each translation
-        model_averages = {}
-        for critic_scores in accuracy_scores.values():
-            for model, score in critic_scores.items():
-                if isinstance(score, (int, float)):
-                    if model not in model_averages:
-                        model_averages[model] = []
-                    model_averages[model].append(score)
-        
-        for model, scores in model_averages.items():
-            if scores:
-                avg_score = sum(scores) / len(scores)
-                markdown_lines.append(f"- **{model}:** Average {avg_score:.1f}/10 (from {len(scores)} critics)")
-        
-        markdown_lines.append("")
+        markdown_lines.extend(format_critique_stats(scores))
     
     # Insights
     markdown_lines.extend([
@@ -1024,7 +1007,8 @@ def compile_final_analysis_mode(args, logger):
     if args.with_summary:
         logger.info("Generating final summary with GPT...")
         try:
-            summary = generate_final_summary(args.output, translation_choices, accuracy_scores, len(paragraph_data), len(critiques), logger)
+            summary = generate_final_summary(args.output, translation_choices, accuracy_scores, len(paragraph_data), len(critiques), logger,
+                                             cache_file=args.summary_cache)
             
             # Append summary to the file
             with open(args.output, 'a', encoding='utf-8') as f:
@@ -1043,5 +1027,242 @@ def compile_final_analysis_mode(args, logger):
     logger.info(f"  Consensus choice: {most_popular if 'most_popular' in locals() else 'No consensus'}")
     logger.info(f"  Output: {args.output}")
 
+def export_dataset_mode(args, logger):
+    """Export all model translations to one columnar dataset (Parquet/Arrow)."""
+    from translation_dataset import build_translation_frame, write_dataset
+    
+    # Default to every full translation next to the input text
+    if args.files:
+        file_paths = [Path(f.strip()) for f in args.files.split(',')]
+    else:
+        file_paths = sorted(args.input.parent.glob('full_translation_*.md'))
+    
+    if not file_paths:
+        logger.error("No translation files found (use --files or add full_translation_*.md files)")
+        sys.exit(1)
+    
+    for file_path in file_paths:
+        if not file_path.exists():
+            logger.error(f"Translation file not found: {file_path}")
+            sys.exit(1)
+    
+    output_file = args.output if args.output != Path("translation.md") else Path("translations.parquet")
+    
+    logger.info(f"Building dataset from {len(file_paths)} translation files")
+    chunker = TextChunker(args.input, use_mmap=args.mmap)
+    df = build_translation_frame(file_paths, chunker)
+    
+    try:
+        write_dataset(df, output_file)
+    except ImportError as e:
+        logger.error(f"Columnar export requires pyarrow (pip install pyarrow): {e}")
+        sys.exit(1)
+    except ValueError as e:
+        logger.error(str(e))
+        sys.exit(1)
+    
+    logger.info(f"✓ Dataset export complete!")
+    logger.info(f"  Models: {df['model'].nunique()}")
+    logger.info(f"  Rows: {len(df)}")
+    logger.info(f"  Error rows: {int(df['is_error'].sum())}")
+    logger.info(f"  Output: {output_file}")
+
+def merge_translations_mode(args, logger):
+    """Consolidate partial and overlapping translation runs into one ordered file."""
+    from translation_merge import merge_translation_files, log_merge_summary
+    
+    if not args.files:
+        logger.error("--files argument required for merge-translations mode (oldest run first)")
+        sys.exit(1)
+    
+    file_paths = [Path(f.strip()) for f in args.files.split(',')]
+    for file_path in file_paths:
+        if not file_path.exists():
+            logger.error(f"Translation file not found: {file_path}")
+            sys.exit(1)
+    
+    logger.info(f"Merging {len(file_paths)} translation runs into {args.output}")
+    summary = merge_translation_files(file_paths, args.output)
+    
+    logger.info(f"✓ Merge complete!")
+    log_merge_summary(summary, logger)
+    logger.info(f"  Output: {args.output}")
+
+def retranslate_changed_mode(args, logger):
+    """Re-number an existing translation by content hash and translate only changed paragraphs."""
+    import os
+    from paragraph_ids import build_remap, save_remap, remap_file_for
+    from translation_merge import index_translation_runs, read_block, renumber_block, block_field, read_model_name
+    
+    if not args.output.exists():
+        logger.error(f"Existing translation file required: {args.output}")
+        sys.exit(1)
+    
+    logger.info(f"Loading text from: {args.input}")
+    chunker = TextChunker(args.input, use_mmap=args.mmap)
+    
+    # Match the German stored in the translation against the re-preprocessed text
+    remap = build_remap(args.output, chunker)
+    save_remap(remap, args.output, args.input, remap_file_for(args.output))
+    
+    end_idx = len(chunker) if args.end == -1 else min(args.end, len(chunker))
+    changed = [i for i in remap.changed if args.start <= i < end_idx]
+    
+    logger.info(f"Paragraphs matched by content: {len(remap.mapping) - len(remap.dropped)}")
+    logger.info(f"  Re-numbered: {remap.moved}")
+    logger.info(f"  Old paragraphs whose text changed: {len(remap.dropped)}")
+    logger.info(f"  Paragraphs to re-translate: {len(changed)}")
+    
+    blocks, _ = index_translation_runs([args.output])
+    retained = {new: blocks[old] for old, new in remap.mapping.items() if new is not None}
+    to_translate = set(changed)
+    
+    translator = Translator(args.model) if to_translate else None
+    config = TranslationPromptBuilder().build_context_dict()
+    
+    german_history = []
+    english_history = []
+    retranslated = 0
+    
+    # Rebuild the file in new paragraph order, translating changed paragraphs in place
+    tmp_file = args.output.with_name(args.output.name + '.tmp')
+    with open(args.output, 'rb') as source, open(tmp_file, 'w', encoding='utf-8') as f:
+        f.write(f"# Being and Time - Translation\n\n")
+        f.write(f"**Model:** {read_model_name(args.output) or args.model}\n")
+        f.write(f"**Re-numbered from:** {args.input}\n\n")
+        f.write("---\n\n")
+        
+        for i in sorted(set(retained) | to_translate):
+            current_german = chunker.get_paragraph(i)
+            
+            if i in retained:
+                block_text = read_block(source, retained[i])
+                f.write(renumber_block(block_text, i).rstrip() + "\n\n")
+                english = block_field(block_text, "English")
+            else:
+                logger.info(f"Re-translating changed paragraph {i}")
+                context = TranslationContext(
+                    prev_german_paragraphs=german_history,
+                    prev_english_paragraphs=english_history,
+                    current_german=current_german,
+                    context_window_size=args.context_size
+                )
+                try:
+                    result = translator.translate_paragraph(context, config)
+                    write_translation_block(f, i, current_german, result)
+                    english = result.translation
+                    retranslated += 1
+                except Exception as e:
+                    logger.error(f"Error translating paragraph {i}: {e}")
+                    write_error_block(f, i, current_german, e)
+                    english = None
+            
+            # Keep a rolling context of consecutive successful paragraphs
+            if english:
+                german_history = (german_history + [current_german])[-args.context_size:]
+                english_history = (english_history + [english])[-args.context_size:]
+            else:
+                german_history, english_history = [], []
+    
+    os.replace(tmp_file, args.output)
+    
+    logger.info(f"✓ Incremental re-translation complete!")
+    logger.info(f"  Re-translated: {retranslated}/{len(to_translate)}")
+    logger.info(f"  Mapping: {remap_file_for(args.output)}")
+    logger.info(f"  Output: {args.output}")
+
+def concordance_mode(args, logger):
+    """Show every German occurrence of a term next to each model's English."""
+    import time
+    from concordance import format_concordance, load_or_build
+    
+    if not args.term:
+        logger.error("--term argument required for concordance mode")
+        sys.exit(1)
+    
+    if not args.input.exists():
+        logger.error(f"Input file not found: {args.input}")
+        sys.exit(1)
+    
+    # Default to every full translation next to the input text
+    if args.files:
+        file_paths = [Path(f.strip()) for f in args.files.split(',')]
+    else:
+        file_paths = sorted(args.input.parent.glob('full_translation_*.md'))
+    
+    for file_path in file_paths:
+        if not file_path.exists():
+            logger.error(f"Translation file not found: {file_path}")
+            sys.exit(1)
+    
+    index_file = args.input.with_name('concordance_index.json')
+    start = time.perf_counter()
+    index, rebuilt = load_or_build(index_file, args.input, file_paths)
+    if rebuilt:
+        logger.info(f"Built concordance index from {args.input} and {len(file_paths)} translations "
+                    f"in {time.perf_counter() - start:.2f}s -> {index_file}")
+    
+    lookup_start = time.perf_counter()
+    hits = index.lookup(args.term)
+    report = format_concordance(index, args.term, hits)
+    logger.info(f"Found {len(hits)} occurrences of '{args.term}' in {time.perf_counter() - lookup_start:.3f}s")
+    
+    if args.output != Path("translation.md"):
+        args.output.write_text(report, encoding='utf-8')
+        logger.info(f"Concordance saved to {args.output}")
+    else:
+        print(report)
+
+def check_consistency_mode(args, logger):
+    """Check that each model renders the convention terms the same way throughout."""
+    import time
+    from consistency import (check_consistency, format_consistency_report, load_term_map,
+                             load_translation_texts, model_consistency, parse_conventions)
+    
+    if not args.term_map.exists():
+        logger.error(f"Term map not found: {args.term_map}")
+        sys.exit(1)
+    
+    if args.term_map.suffix.lower() == '.md':
+        rules = parse_conventions(args.term_map)
+    else:
+        rules = load_term_map(args.term_map)
+    
+    if not rules:
+        logger.error(f"No term renderings found in {args.term_map}; "
+                     f"fill in the primary renderings or pass a YAML/JSON --term-map")
+        sys.exit(1)
+    
+    # Default to every full translation next to the input text
+    if args.files:
+        file_paths = [Path(f.strip()) for f in args.files.split(',')]
+    else:
+        file_paths = sorted(args.input.parent.glob('full_translation_*.md'))
+    
+    for file_path in file_paths:
+        if not file_path.exists():
+            logger.error(f"Translation file not found: {file_path}")
+            sys.exit(1)
+    
+    if not file_paths:
+        logger.error("No translation files found")
+        sys.exit(1)
+    
+    start = time.perf_counter()
+    translations = load_translation_texts(file_paths)
+    checks = check_consistency(translations, rules)
+    logger.info(f"Checked {len(rules)} terms over {len(translations)} translated paragraphs "
+                f"({len(checks)} occurrences) in {time.perf_counter() - start:.2f}s")
+    
+    if not checks.empty:
+        for model, row in model_consistency(checks).iterrows():
+            logger.info(f"  {model}: {row['consistency']:.1%} expected rendering, "
+                        f"{row['accepted']:.1%} any accepted ({int(row['checks'])} checks)")
+    
+    output_file = args.output if args.output != Path("translation.md") else Path("consistency_report.md")
+    output_file.write_text(format_consistency_report(checks, rules), encoding='utf-8')
+    
+    logger.info(f"✓ Consistency check complete! Report saved to {output_file}")
+
 if __name__ == "__main__":
     main()
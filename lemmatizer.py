@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+spaCy lemmatization backend for term clustering.
+
+Snowball stems merge unrelated words and split real inflections, so this maps
+every candidate term form to its spaCy lemma instead. Paragraphs go through
+`nlp.pipe` in batches (optionally across processes), and the form -> lemma
+pairs found in each paragraph are cached on disk by paragraph content hash,
+so a re-run only lemmatizes paragraphs that changed.
+
+Uses the installed German model (de_core_news_sm by default); without one it
+falls back to a blank German pipeline with spaCy's lookup lemmatizer, which
+needs the spacy-lookups-data package.
+"""
+
+import json
+import logging
+import time
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+from chunker import paragraph_hash
+from term_scanner import candidate_term
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SPACY_MODEL = "de_core_news_sm"
+# Components not needed for lemmas
+DISABLED_COMPONENTS = ["parser", "ner"]
+
+def load_pipeline(model: str = DEFAULT_SPACY_MODEL):
+    """Load a spaCy pipeline, falling back to blank German + lookup lemmas."""
+    import spacy
+
+    try:
+        return spacy.load(model, disable=DISABLED_COMPONENTS)
+    except OSError:
+        logger.warning(f"spaCy model {model} not installed; using the lookup lemmatizer "
+                       f"(install it with: python -m spacy download {model})")
+        nlp = spacy.blank("de")
+        nlp.add_pipe("lemmatizer", config={"mode": "lookup"})
+        nlp.initialize()
+        return nlp
+
+class LemmaCache:
+    """Per-paragraph form -> lemma pairs, keyed by pipeline and paragraph hash."""
+
+    def __init__(self, cache_file: Optional[Path], pipeline_name: str):
+        self.cache_file = cache_file
+        self.pipeline_name = pipeline_name
+        self.paragraphs: Dict[str, Dict[str, str]] = {}
+        self.dirty = False
+
+        if cache_file and cache_file.exists():
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            # Lemmas from another pipeline would mix two clusterings
+            if data.get("pipeline") == pipeline_name:
+                self.paragraphs = data["paragraphs"]
+
+    def get(self, paragraph_id: str) -> Optional[Dict[str, str]]:
+        return self.paragraphs.get(paragraph_id)
+
+    def put(self, paragraph_id: str, lemmas: Dict[str, str]):
+        self.paragraphs[paragraph_id] = lemmas
+        self.dirty = True
+
+    def save(self):
+        if not self.cache_file or not self.dirty:
+            return
+        with open(self.cache_file, 'w', encoding='utf-8') as f:
+            json.dump({"pipeline": self.pipeline_name, "paragraphs": self.paragraphs}, f, ensure_ascii=False)
+        self.dirty = False
+
+class SpacyLemmatizer:
+    """Maps lowercased term forms to lowercased spaCy lemmas."""
+
+    def __init__(self, model: str = DEFAULT_SPACY_MODEL, batch_size: int = 64,
+                 n_process: int = 1, cache_file: Optional[Path] = None):
+        self.model = model
+        self.batch_size = batch_size
+        self.n_process = n_process
+        self.cache_file = cache_file
+        self._nlp = None
+
+    @property
+    def nlp(self):
+        if self._nlp is None:
+            self._nlp = load_pipeline(self.model)
+        return self._nlp
+
+    @property
+    def pipeline_name(self) -> str:
+        meta = self.nlp.meta
+        return f"{meta['lang']}_{meta['name']}-{meta['version']}"
+
+    def _lemmatize_docs(self, paragraphs: List[str]) -> List[Dict[str, str]]:
+        """Form -> lemma for the candidate terms of each paragraph."""
+        results = []
+        docs = self.nlp.pipe(paragraphs, batch_size=self.batch_size, n_process=self.n_process)
+        for doc in docs:
+            lemmas = {}
+            for token in doc:
+                form = candidate_term(token.text)
+                if form is not None:
+                    lemmas.setdefault(form, token.lemma_.lower() or form)
+            results.append(lemmas)
+        return results
+
+    def lemma_map(self, paragraphs: Sequence[str]) -> Dict[str, str]:
+        """Most frequent lemma of every candidate term form in the paragraphs."""
+        cache = LemmaCache(self.cache_file, self.pipeline_name)
+        ids = [paragraph_hash(para) for para in paragraphs]
+
+        missing = {}
+        for paragraph_id, para in zip(ids, paragraphs):
+            if cache.get(paragraph_id) is None:
+                missing.setdefault(paragraph_id, para)
+
+        if missing:
+            start = time.perf_counter()
+            for paragraph_id, lemmas in zip(missing, self._lemmatize_docs(list(missing.values()))):
+                cache.put(paragraph_id, lemmas)
+            elapsed = time.perf_counter() - start
+            cache.save()
+
+            rate = len(missing) / elapsed if elapsed > 0 else 0
+            logger.info(f"spaCy ({self.pipeline_name}): lemmatized {len(missing)} paragraphs in {elapsed:.2f}s "
+                        f"({rate:.0f} paragraphs/s), {len(ids) - len(missing)} from cache")
+        else:
+            logger.info(f"spaCy ({self.pipeline_name}): all {len(ids)} paragraphs from cache")
+
+        votes = defaultdict(Counter)
+        for paragraph_id in ids:
+            for form, lemma in cache.get(paragraph_id).items():
+                votes[form][lemma] += 1
+
+        return {form: counts.most_common(1)[0][0] for form, counts in votes.items()}
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Content-hash paragraph identity across re-preprocessing.
+
+Paragraph numbers are positions in TextChunker's segmentation, so any change to
+preprocess.py shifts every later index. Each paragraph is therefore also keyed
+by a normalized content hash (chunker.paragraph_hash); matching hashes between
+an existing translation and the current text gives an old -> new index mapping
+and the set of paragraphs whose German actually changed.
+"""
+
+import json
+import logging
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from chunker import TextChunker, paragraph_hash
+from translation_merge import ParagraphBlock, block_field, index_translation_runs, read_block
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class ParagraphRemap:
+    """Mapping from a translation's paragraph numbers to the current text."""
+    mapping: Dict[int, Optional[int]] = field(default_factory=dict)  # old -> new (None if text changed)
+    changed: List[int] = field(default_factory=list)  # new indices with no matching translation
+
+    @property
+    def moved(self) -> int:
+        return sum(1 for old, new in self.mapping.items() if new is not None and new != old)
+
+    @property
+    def dropped(self) -> List[int]:
+        return sorted(old for old, new in self.mapping.items() if new is None)
+
+def match_paragraph_ids(old_ids: Dict[int, str], new_ids: List[str]) -> Dict[int, Optional[int]]:
+    """Map old paragraph numbers to new indices by content hash.
+
+    Repeated paragraphs (identical text) are paired up in document order.
+    """
+    positions = defaultdict(deque)
+    for new_index, para_id in enumerate(new_ids):
+        positions[para_id].append(new_index)
+
+    mapping = {}
+    for old_index in sorted(old_ids):
+        candidates = positions.get(old_ids[old_index])
+        mapping[old_index] = candidates.popleft() if candidates else None
+    return mapping
+
+def load_translation_ids(translation_file: Path) -> Dict[int, ParagraphBlock]:
+    """Return the latest block for each paragraph of a translation file."""
+    chosen, _ = index_translation_runs([translation_file])
+    return chosen
+
+def build_remap(translation_file: Path, chunker: TextChunker) -> ParagraphRemap:
+    """Compare the German stored in a translation with the current cleaned text."""
+    blocks = load_translation_ids(translation_file)
+
+    old_ids = {}
+    with open(translation_file, 'rb') as f:
+        for number, block in blocks.items():
+            german = block_field(read_block(f, block), "German")
+            if german is not None:
+                old_ids[number] = paragraph_hash(german)
+
+    mapping = match_paragraph_ids(old_ids, chunker.paragraph_ids())
+    return ParagraphRemap(mapping=mapping, changed=changed_paragraphs(mapping, len(chunker)))
+
+def changed_paragraphs(mapping: Dict[int, Optional[int]], new_count: int) -> List[int]:
+    """New indices to re-translate: unmatched ones where the translation's changed paragraphs now sit.
+
+    Each run of old paragraphs whose text changed is placed between the new
+    indices of its matched neighbours; a run at either end of the translation
+    extends from its one neighbour by the length of the run. New paragraphs
+    inserted inside the translated span are included too.
+    """
+    matched = {new for new in mapping.values() if new is not None}
+    olds = sorted(mapping)
+    changed = set()
+
+    i = 0
+    while i < len(olds):
+        if mapping[olds[i]] is not None:
+            i += 1
+            continue
+        j = i
+        while j < len(olds) and mapping[olds[j]] is None:
+            j += 1
+
+        run = j - i
+        before = mapping[olds[i - 1]] if i > 0 else None
+        after = mapping[olds[j]] if j < len(olds) else None
+        if before is not None and after is not None:
+            low, high = before + 1, after
+        elif after is not None:
+            low, high = max(0, after - run), after
+        elif before is not None:
+            low, high = before + 1, min(new_count, before + 1 + run)
+        else:
+            # Nothing matched at all: keep the old numbering
+            low, high = olds[i], min(new_count, olds[j - 1] + 1)
+        changed.update(k for k in range(low, high) if k not in matched)
+        i = j
+
+    mapped = sorted(matched)
+    if mapped:
+        changed.update(k for k in range(mapped[0], mapped[-1] + 1) if k not in matched)
+    return sorted(changed)
+
+def save_remap(remap: ParagraphRemap, translation_file: Path, text_file: Path, output_file: Path):
+    """Persist the old -> new mapping next to the translation."""
+    data = {
+        "translation_file": str(translation_file),
+        "text_file": str(text_file),
+        "created": datetime.now().isoformat(),
+        "mapping": {str(old): new for old, new in sorted(remap.mapping.items())},
+        "changed": remap.changed,
+    }
+    with open(output_file, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2)
+
+    logger.info(f"Saved paragraph mapping to {output_file}")
+
+def remap_file_for(translation_file: Path) -> Path:
+    """Default location of the persisted mapping for a translation file."""
+    return translation_file.with_name(translation_file.stem + '.remap.json')
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Streaming storage for extracted passages.
+
+extract-passages originally wrote one nested JSON document
+({"models": {model: {"75": {...}}}}) that every downstream mode had to load
+whole. This module adds a record-per-(model, paragraph) JSON Lines format:
+
+    passages.jsonl      header line, then {"model", "paragraph", "data"} records
+    passages/           the same split into shards of consecutive paragraphs,
+                        with manifest.json listing each shard's range
+
+Readers take the paragraphs they need: shards outside the range are never
+opened, and within a file only records whose paragraph matches are parsed
+(the model and paragraph are read from the line prefix with a regex). The
+legacy nested JSON is still read and written, so existing passages files
+keep working with every mode.
+"""
+
+import json
+import re
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+MANIFEST = "manifest.json"
+# Records are written with these keys first, so filtering needs no full parse
+RECORD_PREFIX = re.compile(r'^\{"model": ("(?:[^"\\]|\\.)*"), "paragraph": (\d+|null)')
+
+def shard_name(first: int, last: int) -> str:
+    return f"passages_{first:05d}-{last:05d}.jsonl"
+
+def is_passages_path(path: Path) -> bool:
+    """True for any passages format: nested JSON, JSONL or a shard directory."""
+    return path.suffix in ('.json', '.jsonl') or (path / MANIFEST).exists()
+
+class PassageWriter:
+    """Writes extracted passages as nested JSON, one JSONL file, or JSONL shards.
+
+    The format follows the output path: a .json file gets the legacy nested
+    document (built in memory), a .jsonl file one streamed file, and with
+    shard_size the output is a directory of shards of that many paragraphs.
+    """
+
+    def __init__(self, output: Path, paragraph_numbers: List[int], metadata: Optional[Dict] = None,
+                 shard_size: Optional[int] = None):
+        self.output = output
+        self.paragraph_numbers = sorted(paragraph_numbers)
+        self.header = {**(metadata or {}), "paragraph_numbers": self.paragraph_numbers}
+        self.shard_size = shard_size
+        self.nested = output.suffix == '.json' and not shard_size
+        self.models: Dict[str, Dict] = {}  # nested format only
+        self._files = {}
+        self._shards = {}  # paragraph -> (first, last) of its shard
+
+        if shard_size:
+            output.mkdir(parents=True, exist_ok=True)
+            for i in range(0, len(self.paragraph_numbers), shard_size):
+                chunk = self.paragraph_numbers[i:i + shard_size]
+                for number in chunk:
+                    self._shards[number] = (chunk[0], chunk[-1])
+
+    def _file(self, shard: tuple):
+        if shard not in self._files:
+            if self.shard_size:
+                path = self.output / shard_name(*shard)
+                header = {**self.header, "paragraph_numbers": [n for n in self.paragraph_numbers
+                                                               if shard[0] <= n <= shard[1]]}
+            else:
+                path, header = self.output, self.header
+            f = open(path, 'w', encoding='utf-8')
+            f.write(json.dumps(header, ensure_ascii=False) + '\n')
+            self._files[shard] = f
+        return self._files[shard]
+
+    def _write(self, shard: tuple, record: Dict):
+        self._file(shard).write(json.dumps(record, ensure_ascii=False) + '\n')
+
+    def write(self, model: str, paragraph: int, data: Optional[Dict]):
+        """One model's paragraph (None if the paragraph was not found)."""
+        if self.nested:
+            self.models.setdefault(model, {})[str(paragraph)] = data
+            return
+        self._write(self._shards.get(paragraph, (None, None)),
+                    {"model": model, "paragraph": paragraph, "data": data})
+
+    def write_error(self, model: str, error: str):
+        """A model whose file could not be parsed; recorded in every shard."""
+        if self.nested:
+            self.models[model] = {"error": error}
+            return
+        shards = sorted(set(self._shards.values())) if self.shard_size else [(None, None)]
+        for shard in shards:
+            self._write(shard, {"model": model, "paragraph": None, "error": error})
+
+    def close(self):
+        if self.nested:
+            with open(self.output, 'w', encoding='utf-8') as f:
+                json.dump({**self.header, "models": self.models}, f, indent=2, ensure_ascii=False)
+            return
+
+        for f in self._files.values():
+            f.close()
+        if not self.shard_size:
+            if not self._files:
+                self._file((None, None)).close()
+            return
+
+        shards = [{"file": shard_name(*shard), "first": shard[0], "last": shard[1]}
+                  for shard in sorted(set(self._shards.values())) if shard in self._files]
+        with open(self.output / MANIFEST, 'w', encoding='utf-8') as f:
+            json.dump({**self.header, "shards": shards}, f, indent=2, ensure_ascii=False)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+class PassageStore:
+    """Reads passages in any format, loading only the requested paragraphs."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._nested = None
+
+        if path.is_dir():
+            with open(path / MANIFEST, 'r', encoding='utf-8') as f:
+                self.header = json.load(f)
+            self.shards = [(path / shard["file"], shard["first"], shard["last"])
+                           for shard in self.header.get("shards", [])]
+        elif path.suffix == '.jsonl':
+            with open(path, 'r', encoding='utf-8') as f:
+                self.header = json.loads(f.readline() or '{}')
+            self.shards = [(path, None, None)]
+        else:
+            with open(path, 'r', encoding='utf-8') as f:
+                self._nested = json.load(f)
+            self.header = {k: v for k, v in self._nested.items() if k != "models"}
+            self.shards = []
+
+    @property
+    def paragraph_numbers(self) -> List[int]:
+        return self.header.get("paragraph_numbers", [])
+
+    def _records_nested(self, wanted: Optional[set]) -> Iterator[Dict]:
+        for model, model_data in self._nested.get("models", {}).items():
+            if isinstance(model_data, dict) and "error" in model_data:
+                yield {"model": model, "paragraph": None, "error": model_data["error"]}
+                continue
+            for number, data in model_data.items():
+                if wanted is None or int(number) in wanted:
+                    yield {"model": model, "paragraph": int(number), "data": data}
+
+    def records(self, paragraphs: Optional[Iterable[int]] = None) -> Iterator[Dict]:
+        """(model, paragraph) records for the given paragraphs (all if None), plus model errors."""
+        wanted = set(paragraphs) if paragraphs is not None else None
+        if self._nested is not None:
+            yield from self._records_nested(wanted)
+            return
+
+        for shard_file, first, last in self.shards:
+            if wanted is not None and first is not None and not any(first <= n <= last for n in wanted):
+                continue
+            with open(shard_file, 'r', encoding='utf-8') as f:
+                f.readline()  # header
+                for line in f:
+                    match = RECORD_PREFIX.match(line)
+                    if match is None:
+                        continue
+                    number = match.group(2)
+                    if number != 'null' and wanted is not None and int(number) not in wanted:
+                        continue
+                    yield json.loads(line)
+
+    def models(self, paragraphs: Optional[Iterable[int]] = None) -> Dict[str, Dict]:
+        """Nested {model: {"75": data}} (or {model: {"error": ...}}) for the given paragraphs."""
+        models: Dict[str, Dict] = {}
+        for record in self.records(paragraphs):
+            if record.get("paragraph") is None:
+                models[record["model"]] = {"error": record["error"]}
+            elif "error" not in models.get(record["model"], {}):
+                models.setdefault(record["model"], {})[str(record["paragraph"])] = record["data"]
+        return models
+
+    def paragraphs(self, paragraphs: Iterable[int]) -> Iterator[Tuple[int, Dict[str, Dict]]]:
+        """(paragraph, nested models) for each paragraph, holding one shard's records at a time."""
+        order = list(paragraphs)
+        if self._nested is not None or not self.shards or self.shards[0][1] is None:
+            groups = [order]
+        else:
+            groups = [[n for n in order if first <= n <= last] for _, first, last in self.shards]
+
+        for group in groups:
+            if not group:
+                continue
+            models = self.models(group)
+            for number in group:
+                yield number, {model: model_data if "error" in model_data
+                               else {key: data for key, data in model_data.items() if key == str(number)}
+                               for model, model_data in models.items()}
@@ -5,29 +5,37 @@ Input: Raw DJVU text with page breaks and hyphenation
 Output: Clean markdown ready for translation
 """
 
+import difflib
+import hashlib
+import json
 import re
 import sys
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
+from typing import Callable, List, Optional
 
-def clean_djvu_text(text):
+PAGE_BREAK_PATTERN = re.compile(r'(\w)\s*\n+\s*\d+\s*\n+\s*(\w)')
+# Single digit + space + actual content (footnotes only)
+FOOTNOTE_PATTERN = re.compile(r'\n\d [^\n]+')
+
+def clean_djvu_text(text, endnotes=False):
     """
-    Main preprocessing pipeline for DJVU text cleanup.
+    Main preprocessing pipeline for DJVU text cleanup (see CLEANING_STAGES).
+    With endnotes, footnotes are kept as linked endnotes instead of removed.
     """
-    # Step 1: Remove footnotes FIRST (before rejoining splits them)
-    text = remove_footnotes(text)
-    
-    # Step 2: Fix page break artifacts (includes removing standalone page numbers)
-    text = rejoin_split_text(text)
+    stages = CLEANING_STAGES
+    if endnotes:
+        text, footnote_table = extract_footnotes(text, link_references=True)
+        stages = CLEANING_STAGES[1:]  # replaces remove_footnotes
     
-    # Step 3: Clean hyphenation and formatting
-    text = fix_hyphenation(text)
-    text = clean_whitespace(text)
+    for stage in stages:
+        text = stage.fn(text)
     
-    # Step 4: Convert footnotes to endnotes (DISABLED - footnotes removed above)
-    # text = convert_to_endnotes(text)
-    
-    # Step 5: Mark structural elements
-    text = mark_sections(text)
+    if endnotes and footnote_table:
+        text += "\n\n" + format_endnotes(footnote_table)
     
     return text
 
@@ -37,7 +45,7 @@ def rejoin_split_text(text):
     """
     # Step 1: Find text + whitespace + page number + whitespace + text patterns
     # and join them with a single space
-    text = re.sub(r'(\w)\s*\n+\s*\d+\s*\n+\s*(\w)', r'\1 \2', text)
+    text = PAGE_BREAK_PATTERN.sub(r'\1 \2', text)
     
     # Step 2: Clean up any remaining standalone page numbers
     text = re.sub(r'\s+\d+\s+', ' ', text)
@@ -46,9 +54,8 @@ def rejoin_split_text(text):
 
 def remove_footnotes(text):
     """Remove footnote blocks entirely before processing page breaks."""
-    # Single digit + space + actual content (footnotes only)
     # This avoids removing page numbers like "200 " with no content
-    text = re.sub(r'\n\d [^\n]+', '', text)
+    text = FOOTNOTE_PATTERN.sub('', text)
     
     return text
 
@@ -59,70 +66,78 @@ def fix_hyphenation(text):
     
     return text
 
-# DISABLED: Endnotes conversion (may re-enable later)
-# Need to process footnotes BEFORE rejoining split text to work properly
-def convert_to_endnotes(text):
+# Footnotes as endnotes
+#
+# One linear finditer pass over the two kinds of lines that matter: footnote
+# lines (exactly what remove_footnotes drops, so the body is unchanged) and
+# page number lines. Footnotes are buffered until the page number line that
+# closes their page. Inline references ("Sorge. 1 ...") are linked per page,
+# since numbering restarts on every page.
+FOOTNOTE_OR_PAGE_LINE = re.compile(r'\n(?:(\d) ([^\n]+)|[^\S\n]*(\d+)[^\S\n]*(?=\n|\Z))')
+INLINE_REF_PATTERN = re.compile(r'([.!?:]) (\d)(?=\s|$)')
+
+@dataclass
+class Footnote:
+    page: Optional[int]  # printed page number (None after the last one)
+    number: int          # mark as printed on the page
+    endnote: int         # sequential endnote number
+    text: str
+
+def extract_footnotes(text, link_references=False):
     """
-    Convert inline footnotes to endnote references and collect endnotes at end.
-    Example: "text. 1 Aristoteles..." -> "text.[^1]" + endnotes section
-    
-    CURRENTLY DISABLED - footnotes are simply removed for now.
-    To re-enable: call this function BEFORE rejoin_split_text() in the pipeline.
+    Split footnotes out of raw DJVU text before rejoin_split_text.
+    Returns (body, table) where table maps page -> footnotes in document order.
+    With link_references, inline marks become [^N] endnote references.
     """
-    footnotes = {}
-    footnote_counter = 1
-    
-    # Step 1: Extract footnote definitions more carefully
-    # Look for: double newline + digit + space + content + double newline
-    footnote_pattern = r'\n\n(\d+) ([^\n].*?)(?=\n\n(?:\d+ |\w|$))'
+    pieces = []       # body text between removed footnote lines
+    table = {}
+    page_first = 0    # first piece of the current page
+    page_notes = []
+    endnote = 0
+    pos = 0
     
-    def extract_footnote(match):
-        nonlocal footnote_counter
-        original_num = match.group(1)
-        citation_text = match.group(2).strip()
+    def close_page(page):
+        nonlocal page_notes
+        if not page_notes:
+            return
+        for note in page_notes:
+            note.page = page
+        table.setdefault(page, []).extend(page_notes)
         
-        # Store footnote with new sequential number
-        footnotes[footnote_counter] = f"[^{footnote_counter}]: {citation_text}"
-        
-        # Create mapping for inline reference replacement
-        footnotes[f"orig_{original_num}"] = footnote_counter
-        
-        footnote_counter += 1
-        return "\n\n"  # Leave double newlines to preserve structure
-    
-    # Extract all footnote definitions
-    text = re.sub(footnote_pattern, extract_footnote, text, flags=re.DOTALL)
-    
-    # Step 2: Replace inline references
-    # Pattern: punctuation + space + digit + optional space/asterisk
-    inline_pattern = r'([.!?:]) (\d+)( \*?)'
+        if link_references:
+            marks = {str(note.number): note.endnote for note in page_notes}
+            
+            def link(match):
+                endnote_number = marks.pop(match.group(2), None)  # first mark only
+                return match.group(0) if endnote_number is None else f"{match.group(1)}[^{endnote_number}]"
+            
+            for i in range(page_first, len(pieces)):
+                if not marks:
+                    break
+                pieces[i] = INLINE_REF_PATTERN.sub(link, pieces[i])
+        page_notes = []
     
-    def replace_inline_ref(match):
-        punct = match.group(1)
-        orig_num = match.group(2)
-        
-        # Look up the new sequential number
-        new_num = footnotes.get(f"orig_{orig_num}")
-        if new_num:
-            return f"{punct}[^{new_num}]"
+    for match in FOOTNOTE_OR_PAGE_LINE.finditer(text):
+        pieces.append(text[pos:match.start()])
+        if match.group(1):
+            pos = match.end()
+            endnote += 1
+            page_notes.append(Footnote(None, int(match.group(1)), endnote, match.group(2).strip()))
         else:
-            # If footnote not found, leave as is
-            return match.group(0)
-    
-    text = re.sub(inline_pattern, replace_inline_ref, text)
-    
-    # Step 3: Build endnotes section
-    if footnotes:
-        endnote_list = []
-        for i in range(1, footnote_counter):
-            if footnotes.get(i):
-                endnote_list.append(footnotes[i])
-        
-        if endnote_list:
-            endnotes_section = "\n\n## Endnotes\n\n" + "\n\n".join(endnote_list)
-            text = text + endnotes_section
+            pos = match.start()
+            close_page(int(match.group(3)))
+            page_first = len(pieces)
     
-    return text
+    pieces.append(text[pos:])
+    close_page(None)
+    return ''.join(pieces), table
+
+def format_endnotes(table):
+    """Render the footnote table as a markdown endnotes section."""
+    notes = [note for page_notes in table.values() for note in page_notes]
+    if not notes:
+        return ""
+    return "## Endnotes\n\n" + "\n\n".join(f"[^{note.endnote}]: {note.text}" for note in notes)
 
 def mark_sections(text):
     """Mark § section breaks as markdown headings."""
@@ -133,6 +148,10 @@ def mark_sections(text):
 
 def clean_whitespace(text):
     """Clean up excessive whitespace while preserving paragraph structure."""
+    return collapse_whitespace(text).strip()
+
+def collapse_whitespace(text):
+    """Whitespace cleanup without the final strip (safe to apply piecewise)."""
     # Remove excessive blank lines (more than 2)
     text = re.sub(r'\n{3,}', '\n\n', text)
     
@@ -142,15 +161,474 @@ def clean_whitespace(text):
     # Ensure single spaces between words (but preserve intentional spacing)
     text = re.sub(r'(?<!\n) {2,}(?!\n)', ' ', text)
     
-    return text.strip()
+    return text
 
-def main():
-    if len(sys.argv) != 3:
-        print("Usage: python preprocess.py input.txt output.md")
+# Named, versioned pipeline stages
+#
+# Bump a stage's version whenever its rules change: cached outputs are keyed by
+# the input hash chained through every stage name and version, so a re-run
+# reuses everything before the first changed stage and recomputes from there.
+@dataclass(frozen=True)
+class Stage:
+    name: str
+    version: int
+    fn: Callable[[str], str]
+
+CLEANING_STAGES = [
+    # Remove footnotes FIRST (before rejoining splits them)
+    Stage("remove_footnotes", 1, remove_footnotes),
+    # Fix page break artifacts (includes removing standalone page numbers)
+    Stage("rejoin_split_text", 1, rejoin_split_text),
+    # Clean hyphenation and formatting
+    Stage("fix_hyphenation", 1, fix_hyphenation),
+    Stage("clean_whitespace", 1, clean_whitespace),
+    # Mark structural elements
+    Stage("mark_sections", 1, mark_sections),
+]
+
+@dataclass
+class StageReport:
+    """What happened to one stage in a cached run."""
+    name: str
+    version: int
+    cached: bool
+    seconds: float = 0.0
+    changed_paragraphs: List[int] = field(default_factory=list)  # indices in the new output
+    added: int = 0
+    removed: int = 0
+    compared: bool = False  # False when there was no previous output to diff against
+
+def stage_keys(text, stages=None):
+    """Cache key of each stage output: the input hash chained through name + version."""
+    key = hashlib.sha256(text.encode('utf-8')).hexdigest()
+    keys = []
+    for stage in stages or CLEANING_STAGES:
+        key = hashlib.sha256(f"{key}:{stage.name}:{stage.version}".encode('utf-8')).hexdigest()
+        keys.append(key)
+    return keys
+
+def diff_paragraphs(old_text, new_text):
+    """Paragraph-level diff: (changed indices in new_text, added count, removed count)."""
+    old_paras = old_text.split('\n\n')
+    new_paras = new_text.split('\n\n')
+    matcher = difflib.SequenceMatcher(None, old_paras, new_paras, autojunk=False)
+    
+    changed, added, removed = [], 0, 0
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == 'equal':
+            continue
+        changed.extend(range(j1, j2))
+        added += max(0, (j2 - j1) - (i2 - i1))
+        removed += max(0, (i2 - i1) - (j2 - j1))
+    return changed, added, removed
+
+class StageCache:
+    """Content-addressed store of stage outputs plus the last run per source file."""
+    
+    def __init__(self, cache_dir):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.runs_file = self.cache_dir / "runs.json"
+    
+    def path(self, key):
+        return self.cache_dir / f"{key}.txt"
+    
+    def get(self, key):
+        path = self.path(key)
+        return path.read_text(encoding='utf-8') if path.exists() else None
+    
+    def put(self, key, text):
+        path = self.path(key)
+        tmp_path = path.with_suffix('.tmp')
+        tmp_path.write_text(text, encoding='utf-8')
+        tmp_path.replace(path)
+    
+    def last_run(self, source):
+        """Stage name -> key from the previous run on this source."""
+        if not self.runs_file.exists():
+            return {}
+        with open(self.runs_file, 'r', encoding='utf-8') as f:
+            return json.load(f).get(str(source), {})
+    
+    def record_run(self, source, stages, keys):
+        runs = {}
+        if self.runs_file.exists():
+            with open(self.runs_file, 'r', encoding='utf-8') as f:
+                runs = json.load(f)
+        runs[str(source)] = {stage.name: key for stage, key in zip(stages, keys)}
+        with open(self.runs_file, 'w', encoding='utf-8') as f:
+            json.dump(runs, f, indent=2)
+
+def clean_djvu_text_cached(text, cache_dir, source="default", stages=None):
+    """
+    Run the staged pipeline, reusing cached stage outputs. Returns the cleaned
+    text and a StageReport per stage, with paragraph diffs against the previous
+    run on the same source for every recomputed stage.
+    """
+    stages = stages or CLEANING_STAGES
+    cache = StageCache(cache_dir)
+    keys = stage_keys(text, stages)
+    previous = cache.last_run(source)
+    
+    # Resume from the output of the last stage whose key is still cached
+    first = 0
+    for i in reversed(range(len(stages))):
+        cached_text = cache.get(keys[i])
+        if cached_text is not None:
+            text, first = cached_text, i + 1
+            break
+    
+    reports = [StageReport(stage.name, stage.version, cached=True) for stage in stages[:first]]
+    for stage, key in zip(stages[first:], keys[first:]):
+        start = time.perf_counter()
+        text = stage.fn(text)
+        report = StageReport(stage.name, stage.version, cached=False,
+                             seconds=time.perf_counter() - start)
+        cache.put(key, text)
+        
+        previous_text = cache.get(previous[stage.name]) if stage.name in previous else None
+        if previous_text is not None:
+            report.changed_paragraphs, report.added, report.removed = diff_paragraphs(previous_text, text)
+            report.compared = True
+        reports.append(report)
+    
+    cache.record_run(source, stages, keys)
+    return text, reports
+
+def print_stage_reports(reports, limit=10):
+    """Print one line per stage: cached, or recomputed with its paragraph diff."""
+    for report in reports:
+        label = f"{report.name} v{report.version}"
+        if report.cached:
+            print(f"  {label}: cached")
+        elif not report.compared:
+            print(f"  {label}: computed in {report.seconds:.3f}s (no previous run to compare)")
+        else:
+            changed = report.changed_paragraphs
+            suffix = '...' if len(changed) > limit else ''
+            print(f"  {label}: recomputed in {report.seconds:.3f}s, {len(changed)} paragraphs changed "
+                  f"{changed[:limit]}{suffix} (+{report.added}/-{report.removed})")
+
+# Streaming pipeline
+#
+# Each streamed stage keeps a carry-over buffer and only emits the prefix up to
+# a split point that no match of its patterns can straddle, so cleaning the
+# pieces separately gives exactly the same output as clean_djvu_text():
+# - footnote removal and section marking only match within a line, so they
+#   split just before a newline;
+# - the page-break, hyphenation and whitespace passes only match runs of
+#   whitespace/digits/¬ between words, so they split between two adjacent
+#   "solid" characters that none of those patterns can consume.
+SOLID_PAIR_SPLIT = re.compile(r'.*[^\s\d¬§]([^\s\d¬§])', re.DOTALL)
+
+def _split_before_last_newline(buffer):
+    return max(buffer.rfind('\n'), 0)
+
+def _split_between_solids(buffer):
+    match = SOLID_PAIR_SPLIT.match(buffer)
+    return match.start(1) if match else 0
+
+def _stream_stage(chunks, transform, find_split):
+    """Apply a text transform to a chunk stream, carrying over unsafe tails."""
+    buffer = ''
+    for chunk in chunks:
+        buffer += chunk
+        split = find_split(buffer)
+        if split > 0:
+            yield transform(buffer[:split])
+            buffer = buffer[split:]
+    yield transform(buffer)
+
+def _join_and_clean(text):
+    """Steps 2-3 of clean_djvu_text, minus the global strip."""
+    return collapse_whitespace(fix_hyphenation(rejoin_split_text(text)))
+
+def _stream_strip(chunks):
+    """Streaming equivalent of str.strip() over the concatenated chunks."""
+    started = False
+    pending = ''
+    for chunk in chunks:
+        if not started:
+            chunk = chunk.lstrip()
+            if not chunk:
+                continue
+            started = True
+        chunk = pending + chunk
+        kept = chunk.rstrip()
+        pending = chunk[len(kept):]
+        if kept:
+            yield kept
+
+def clean_djvu_stream(chunks):
+    """
+    Streaming version of clean_djvu_text over an iterable of text chunks.
+    Memory stays bounded by the chunk size plus the longest unsplittable run.
+    """
+    stream = _stream_stage(chunks, remove_footnotes, _split_before_last_newline)
+    stream = _stream_stage(stream, _join_and_clean, _split_between_solids)
+    stream = _stream_strip(stream)
+    stream = _stream_stage(stream, mark_sections, _split_before_last_newline)
+    return (piece for piece in stream if piece)
+
+# Fused single-pass engine
+#
+# Every rule in clean_djvu_text only rewrites a "gap": a maximal run of
+# whitespace, digits and ¬ between two solid characters (a footnote line starts
+# right after a newline inside such a run and is absorbed into it). The fused
+# engine visits each gap once in a single re.sub sweep and decides its
+# replacement from the gap plus the kind of its neighbours, reusing the staged
+# rules on that tiny window. Decisions are memoized since the same gaps
+# (" \n", "\n\n", page numbers) recur thousands of times. Single spaces
+# between words never change and are skipped by the pattern itself.
+GAP_PATTERN = re.compile(
+    r'[\s\d¬](?<!(?<=[^\s\d¬]) (?=[^\s\d¬]))(?:(?<=\n)\d [^\n]+|[\s\d¬])*'
+)
+SECTION_NUMBER_GAP = re.compile(r' \d+')
+
+# Stand-in neighbours: a word character, any other solid character, or none
+GAP_CONTEXT = {'w': 'a', 'o': '.', '': ''}
+
+@lru_cache(maxsize=None)
+def _neighbour_kind(char):
+    return 'w' if re.match(r'\w', char) else 'o'
+
+@lru_cache(maxsize=1 << 16)
+def _clean_gap(gap, left, right):
+    """Apply the staged rules to one gap; return (cleaned gap, consumed right neighbour)."""
+    left_ctx = GAP_CONTEXT[left]
+    right_ctx = GAP_CONTEXT[right]
+    window = left_ctx + remove_footnotes(gap) + right_ctx
+    
+    # A page-break join that ends on the right neighbour uses it up, so the next
+    # gap cannot start a join from the same character
+    consumed = right == 'w' and any(m.end() == len(window) for m in PAGE_BREAK_PATTERN.finditer(window))
+    
+    window = collapse_whitespace(fix_hyphenation(rejoin_split_text(window)))
+    return window[len(left_ctx):len(window) - len(right_ctx)], consumed
+
+def _starts_section_heading(text, pos):
+    """True if mark_sections would turn the '§' at text[pos] into a heading."""
+    next_gap = GAP_PATTERN.match(text, pos + 1)
+    if not next_gap or next_gap.start() != pos + 1:
+        return False
+    end = next_gap.end()
+    right = _neighbour_kind(text[end]) if end < len(text) else ''
+    cleaned, _ = _clean_gap(next_gap.group(), 'o', right)
+    return SECTION_NUMBER_GAP.fullmatch(cleaned) is not None and text.startswith('.', end)
+
+def clean_djvu_text_fused(text):
+    """
+    Single-sweep equivalent of clean_djvu_text (footnotes, page breaks,
+    hyphenation, whitespace and § headings decided gap by gap).
+    """
+    text_length = len(text)
+    last_end = -1
+    last_consumed = False
+    
+    def replace_gap(match):
+        nonlocal last_end, last_consumed
+        start, end = match.span()
+        
+        if start == 0:
+            left = ''
+        elif last_consumed and last_end == start - 1:
+            left = 'o'  # the word character before us was already joined
+        else:
+            left = _neighbour_kind(text[start - 1])
+        right = _neighbour_kind(text[end]) if end < text_length else ''
+        
+        cleaned, last_consumed = _clean_gap(match.group(), left, right)
+        last_end = end
+        
+        if start == 0:
+            cleaned = cleaned.lstrip()
+        if not right:
+            cleaned = cleaned.rstrip()
+        
+        # "§ N." at the start of a line becomes a heading (mark_sections)
+        if right == 'o' and text[end] == '§' and (cleaned.endswith('\n') or (start == 0 and not cleaned)):
+            if _starts_section_heading(text, end):
+                cleaned += '## '
+        
+        return cleaned
+    
+    cleaned_text = GAP_PATTERN.sub(replace_gap, text)
+    if text.startswith('§') and _starts_section_heading(text, 0):
+        cleaned_text = '## ' + cleaned_text
+    return cleaned_text
+
+def iter_file_chunks(input_file, chunk_size=1 << 16):
+    """Read a text file in fixed-size character chunks."""
+    with open(input_file, 'r', encoding='utf-8') as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+
+def clean_djvu_file(input_file, output_file, chunk_size=1 << 16):
+    """Stream-clean one DJVU text file to disk. Returns (input_chars, output_chars)."""
+    input_chars = 0
+    output_chars = 0
+    
+    def counted(chunks):
+        nonlocal input_chars
+        for chunk in chunks:
+            input_chars += len(chunk)
+            yield chunk
+    
+    with open(output_file, 'w', encoding='utf-8') as f:
+        for piece in clean_djvu_stream(counted(iter_file_chunks(input_file, chunk_size))):
+            f.write(piece)
+            output_chars += len(piece)
+    
+    return input_chars, output_chars
+
+# Directory mode
+
+def _clean_one(input_file, output_file, engine="fused"):
+    """Clean one file (process pool worker). Returns its manifest entry."""
+    start = time.perf_counter()
+    text = input_file.read_text(encoding='utf-8')
+    clean = clean_djvu_text_fused if engine == "fused" else clean_djvu_text
+    processed_text = clean(text)
+    
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    output_file.write_text(processed_text, encoding='utf-8')
+    
+    return {
+        "input": str(input_file),
+        "output": str(output_file),
+        "status": "cleaned",
+        "input_chars": len(text),
+        "output_chars": len(processed_text),
+        "footnotes_removed": len(FOOTNOTE_PATTERN.findall(text)),
+        "seconds": round(time.perf_counter() - start, 3),
+    }
+
+def is_up_to_date(input_file, output_file):
+    """True if the output exists and is newer than its input."""
+    return output_file.exists() and output_file.stat().st_mtime >= input_file.stat().st_mtime
+
+def load_manifest_entries(manifest_file):
+    """Previous manifest entries by input path (empty if there is no manifest)."""
+    if not manifest_file.exists():
+        return {}
+    with open(manifest_file, 'r', encoding='utf-8') as f:
+        return {entry["input"]: entry for entry in json.load(f).get("files", [])}
+
+def clean_djvu_directory(input_dir, output_dir, pattern="*.txt", workers=None,
+                         force=False, engine="fused", previous=None):
+    """
+    Clean every DJVU export in input_dir into output_dir (<stem>.md) over a
+    process pool, skipping outputs newer than their inputs. Skipped files keep
+    their counts from the previous manifest. Returns the manifest entries in
+    input order.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    
+    previous = previous or {}
+    input_files = sorted(p for p in input_dir.rglob(pattern) if p.is_file())
+    entries = {}
+    pending = []
+    
+    for input_file in input_files:
+        output_file = output_dir / input_file.relative_to(input_dir).with_suffix('.md')
+        if not force and is_up_to_date(input_file, output_file):
+            entry = dict(previous.get(str(input_file), {"input": str(input_file), "output": str(output_file)}))
+            entry["status"] = "skipped"
+            entries[input_file] = entry
+        else:
+            pending.append((input_file, output_file))
+    
+    if pending:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(_clean_one, input_file, output_file, engine): input_file
+                       for input_file, output_file in pending}
+            for future, input_file in futures.items():
+                try:
+                    entries[input_file] = future.result()
+                except Exception as e:
+                    entries[input_file] = {"input": str(input_file), "status": "error", "error": str(e)}
+                print(f"  {entries[input_file]['status']}: {input_file}")
+    
+    return [entries[input_file] for input_file in input_files]
+
+def write_manifest(entries, manifest_file, total_seconds):
+    """Write the per-file manifest plus totals as JSON."""
+    cleaned = [e for e in entries if e["status"] == "cleaned"]
+    counted = [e for e in entries if "output_chars" in e]  # cleaned now or in an earlier run
+    manifest = {
+        "created": datetime.now().isoformat(),
+        "files": entries,
+        "totals": {
+            "files": len(entries),
+            "cleaned": len(cleaned),
+            "skipped": sum(1 for e in entries if e["status"] == "skipped"),
+            "errors": sum(1 for e in entries if e["status"] == "error"),
+            "input_chars": sum(e["input_chars"] for e in counted),
+            "output_chars": sum(e["output_chars"] for e in counted),
+            "footnotes_removed": sum(e["footnotes_removed"] for e in counted),
+            "seconds": round(total_seconds, 3),
+        },
+    }
+    with open(manifest_file, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+    return manifest
+
+def main_directory(args):
+    """Batch-clean a directory of DJVU exports and write a manifest."""
+    start = time.perf_counter()
+    print(f"Preprocessing DJVU directory: {args.input} -> {args.output}")
+    
+    manifest_file = args.manifest or args.output / "manifest.json"
+    entries = clean_djvu_directory(args.input, args.output, args.pattern, args.workers,
+                                   args.force, args.engine, load_manifest_entries(manifest_file))
+    manifest = write_manifest(entries, manifest_file, time.perf_counter() - start)
+    
+    totals = manifest["totals"]
+    print(f"Files: {totals['files']} ({totals['cleaned']} cleaned, {totals['skipped']} up to date, "
+          f"{totals['errors']} failed)")
+    print(f"Characters: {totals['input_chars']} -> {totals['output_chars']}, "
+          f"footnotes removed: {totals['footnotes_removed']}")
+    print(f"Manifest: {manifest_file}")
+    print("DJVU preprocessing complete!")
+    
+    if totals["errors"]:
         sys.exit(1)
+
+def main():
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Clean DJVU-derived Sein und Zeit text")
+    parser.add_argument("input", type=Path, help="Raw DJVU text file, or a directory of them")
+    parser.add_argument("output", type=Path, help="Cleaned markdown output (directory in directory mode)")
+    parser.add_argument("--stream", action="store_true",
+                       help="Process in chunks with constant memory (identical output)")
+    parser.add_argument("--chunk-size", type=int, default=1 << 16,
+                       help="Characters per chunk in --stream mode")
+    parser.add_argument("--engine", choices=["fused", "staged"], default="fused",
+                       help="Single-sweep cleanup or the original pass-per-rule pipeline")
+    parser.add_argument("--pattern", default="*.txt",
+                       help="Glob for input files in directory mode")
+    parser.add_argument("--workers", type=int, default=None,
+                       help="Worker processes in directory mode (default: CPU count)")
+    parser.add_argument("--force", action="store_true",
+                       help="Re-clean files whose output is already newer than the input")
+    parser.add_argument("--endnotes", action="store_true",
+                       help="Keep footnotes as linked endnotes instead of removing them (staged engine)")
+    parser.add_argument("--cache-dir", type=Path, default=None,
+                       help="Cache stage outputs here and recompute only from the first changed stage")
+    parser.add_argument("--manifest", type=Path, default=None,
+                       help="Manifest path in directory mode (default: <output>/manifest.json)")
+    args = parser.parse_args()
     
-    input_file = Path(sys.argv[1])
-    output_file = Path(sys.argv[2])
+    if args.input.is_dir():
+        main_directory(args)
+        return
+    
+    input_file = args.input
+    output_file = args.output
     
     if not input_file.exists():
         print(f"Error: Input file {input_file} not found")
@@ -158,24 +636,51 @@ def main():
     
     print(f"Preprocessing DJVU text: {input_file}...")
     
-    # Read input
-    with open(input_file, 'r', encoding='utf-8') as f:
-        text = f.read()
-    
-    print(f"Input: {len(text)} characters")
-    
-    # Process
-    processed_text = clean_djvu_text(text)
+    if args.endnotes and (args.stream or args.cache_dir):
+        print("Error: --endnotes cannot be combined with --stream or --cache-dir")
+        sys.exit(1)
     
-    # Write output
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(processed_text)
+    if args.cache_dir:
+        text = input_file.read_text(encoding='utf-8')
+        input_chars = len(text)
+        print(f"Input: {input_chars} characters")
+        
+        processed_text, reports = clean_djvu_text_cached(text, args.cache_dir, source=input_file.resolve())
+        print_stage_reports(reports)
+        output_chars = len(processed_text)
+        output_file.write_text(processed_text, encoding='utf-8')
+    elif args.stream:
+        input_chars, output_chars = clean_djvu_file(input_file, output_file, args.chunk_size)
+        print(f"Input: {input_chars} characters")
+    else:
+        # Read input
+        with open(input_file, 'r', encoding='utf-8') as f:
+            text = f.read()
+        
+        input_chars = len(text)
+        print(f"Input: {input_chars} characters")
+        
+        # Process
+        if args.endnotes:
+            processed_text = clean_djvu_text(text, endnotes=True)
+        elif args.engine == "fused":
+            processed_text = clean_djvu_text_fused(text)
+        else:
+            processed_text = clean_djvu_text(text)
+        output_chars = len(processed_text)
+        
+        # Write output
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write(processed_text)
     
-    print(f"Output: {len(processed_text)} characters -> {output_file}")
+    print(f"Output: {output_chars} characters -> {output_file}")
     print("DJVU preprocessing complete!")
     print("\nNext steps:")
     print("- Review Greek passages manually")
-    print("- Footnotes removed for cleaner audiobook flow")
+    if args.endnotes:
+        print("- Footnotes kept as endnotes")
+    else:
+        print("- Footnotes removed for cleaner audiobook flow")
     print("- Numbered arguments maintained for philosophical structure")
 
 if __name__ == "__main__":
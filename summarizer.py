@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Map-reduce summarization of compiled analyses.
+
+An analysis that fits the reduce budget goes straight to the conclusion
+prompt in one call. Larger ones are split at their "## " headings
+(oversized sections at "### " and then at blank lines, headings without a
+body dropped) and every section is summarized on its own, concurrently. A
+reduce call then writes the conclusion from the section summaries instead
+of the full text. If the summaries themselves outgrow the
+reduce budget they are summarized again in groups, so a whole-book analysis
+never reaches the model in one prompt.
+
+Summaries are cached on disk by a hash of the model, prompt and section
+text, so rebuilding an analysis only summarizes the sections that changed.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SUMMARY_MODEL = "gpt-4o"
+MAX_SECTION_CHARS = 12000  # about 3k tokens per map call
+MAX_REDUCE_CHARS = 24000  # summaries above this are reduced in groups first
+# Timestamp lines would change every section's cache key on each rebuild
+VOLATILE_LINE = re.compile(r'^\*Generated on .*\*$\n?', re.MULTILINE)
+
+SECTION_SYSTEM = "You are an expert in AI and philosophical scholarship, summarizing part of an experimental study."
+SECTION_PROMPT = """Summarize this section of an analysis of AI translations of Heidegger.
+
+Keep every concrete finding: which translation each critic preferred, scores, terminology choices
+and disagreements, and notable philosophical points. Omit boilerplate. Write 80-200 words of plain prose.
+
+SECTION: {title}
+
+{text}"""
+
+CONCLUSION_SYSTEM = "You are an expert in AI and philosophical scholarship, writing a conclusion for an experimental study."
+CONCLUSION_PROMPT = """You are analyzing a completed AI translation experiment. Read {source} and write a concluding summary that synthesizes what happened and what it reveals.
+
+EXPERIMENT CONTEXT:
+{context}
+
+{heading}:
+{material}
+
+Write a final section titled "## Conclusion: What This Experiment Revealed" that covers:
+
+1. **What actually happened**: Brief recap of the experimental process (translations → critiques)
+2. **The key finding**: Which translation was preferred and the level of consensus/disagreement
+3. **Meta-commentary insights**: What this reveals about AI's capability for philosophical evaluation
+4. **Broader significance**: What this means for AI-assisted scholarly work and transparent reasoning
+
+Keep it concise but insightful (~300-500 words). Write in academic tone. Focus on what this experiment actually demonstrates about AI philosophical reasoning capabilities."""
+
+@dataclass
+class Section:
+    """A titled slice of the analysis markdown."""
+    title: str
+    text: str
+
+def _split_at_heading(markdown: str, level: int) -> List[Section]:
+    """Split at headings of exactly `level`; text before the first becomes an untitled section."""
+    pattern = re.compile(rf'^{"#" * level} (.+)$', re.MULTILINE)
+    matches = list(pattern.finditer(markdown))
+    sections = []
+    preamble = markdown[:matches[0].start()] if matches else markdown
+    if preamble.strip():
+        sections.append(Section("Introduction", preamble.strip()))
+    for match, following in zip(matches, matches[1:] + [None]):
+        end = following.start() if following else len(markdown)
+        sections.append(Section(match.group(1).strip(), markdown[match.start():end].strip()))
+    return sections
+
+def _has_body(section: Section) -> bool:
+    """False for a section that is only its heading (e.g. "## Four AI Translations" before its ### parts)."""
+    return any(line.strip() and not line.startswith('#') for line in section.text.splitlines())
+
+def _split_blocks(section: Section, max_chars: int) -> List[Section]:
+    """Pack blank-line-separated blocks into parts of at most max_chars (a block is never cut)."""
+    parts, current = [], []
+    for block in re.split(r'\n\s*\n', section.text):
+        if current and len('\n\n'.join(current + [block])) > max_chars:
+            parts.append('\n\n'.join(current))
+            current = []
+        current.append(block)
+    if current:
+        parts.append('\n\n'.join(current))
+    if len(parts) == 1:
+        return [section]
+    return [Section(f"{section.title} (part {i}/{len(parts)})", part) for i, part in enumerate(parts, 1)]
+
+def split_sections(markdown: str, max_chars: int = MAX_SECTION_CHARS) -> List[Section]:
+    """Sections at "## " headings, with oversized ones split at "### " and then blank lines.
+
+    Heading-only sections are dropped; the "### " parts carry their parent's title.
+    """
+    sections = []
+    for section in _split_at_heading(VOLATILE_LINE.sub('', markdown), 2):
+        if not _has_body(section):
+            continue
+        if len(section.text) <= max_chars:
+            sections.append(section)
+            continue
+        for subsection in _split_at_heading(section.text, 3):
+            if not _has_body(subsection):
+                continue
+            if subsection.title == "Introduction":
+                subsection.title = section.title
+            else:
+                subsection.title = f"{section.title} / {subsection.title}"
+            sections.extend(_split_blocks(subsection, max_chars))
+    return sections
+
+def summary_key(model: str, prompt: str) -> str:
+    """Cache key: hash of the model and the filled-in prompt (template plus input text)."""
+    return hashlib.sha1(f"{model}\0{prompt}".encode('utf-8')).hexdigest()[:16]
+
+def format_summaries(summaries: List[Section]) -> str:
+    return '\n\n'.join(f"### {summary.title}\n{summary.text}" for summary in summaries)
+
+def group_summaries(summaries: List[Section], max_chars: int) -> List[Section]:
+    """Consecutive summaries packed into sections of at most max_chars (at least one each)."""
+    groups, current = [], []
+    for summary in summaries:
+        if current and len(format_summaries(current + [summary])) > max_chars:
+            groups.append(current)
+            current = []
+        current.append(summary)
+    if current:
+        groups.append(current)
+    return [Section(f"{group[0].title} – {group[-1].title}" if len(group) > 1 else group[0].title,
+                    format_summaries(group)) for group in groups]
+
+class SummaryCache:
+    """Summaries on disk, keyed by summary_key."""
+
+    def __init__(self, cache_file: Optional[Path]):
+        self.cache_file = cache_file
+        self.summaries: Dict[str, str] = {}
+        self.dirty = False
+
+        if cache_file and cache_file.exists():
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                self.summaries = json.load(f)
+
+    def get(self, key: str) -> Optional[str]:
+        return self.summaries.get(key)
+
+    def put(self, key: str, summary: str):
+        self.summaries[key] = summary
+        self.dirty = True
+
+    def save(self):
+        if not self.cache_file or not self.dirty:
+            return
+        with open(self.cache_file, 'w', encoding='utf-8') as f:
+            json.dump(self.summaries, f, indent=2, ensure_ascii=False)
+        self.dirty = False
+
+def summary_chain(system: str, model: str = DEFAULT_SUMMARY_MODEL):
+    """{prompt} -> model -> text chain."""
+    from langchain_core.output_parsers import StrOutputParser
+    from langchain_core.prompts import ChatPromptTemplate
+    from translator import Translator
+
+    prompt_template = ChatPromptTemplate.from_messages([
+        ("system", system),
+        ("human", "{prompt}")
+    ])
+    return prompt_template | Translator(model_name=model).model | StrOutputParser()
+
+class MapReduceSummarizer:
+    """Summarizes sections concurrently (cached), then reduces them to a conclusion."""
+
+    def __init__(self, model: str = DEFAULT_SUMMARY_MODEL, cache_file: Optional[Path] = None,
+                 max_concurrency: int = 8, max_section_chars: int = MAX_SECTION_CHARS,
+                 max_reduce_chars: int = MAX_REDUCE_CHARS, map_chain=None, reduce_chain=None):
+        self.model = model
+        self.cache = SummaryCache(cache_file)
+        self.max_concurrency = max_concurrency
+        self.max_section_chars = max_section_chars
+        self.max_reduce_chars = max_reduce_chars
+        self._map_chain = map_chain
+        self._reduce_chain = reduce_chain
+        self.calls = 0
+        self.cached = 0
+
+    @property
+    def map_chain(self):
+        if self._map_chain is None:
+            self._map_chain = summary_chain(SECTION_SYSTEM, self.model)
+        return self._map_chain
+
+    @property
+    def reduce_chain(self):
+        if self._reduce_chain is None:
+            self._reduce_chain = summary_chain(CONCLUSION_SYSTEM, self.model)
+        return self._reduce_chain
+
+    async def _summarize(self, chain, prompt: str, semaphore: asyncio.Semaphore) -> str:
+        key = summary_key(self.model, prompt)
+        summary = self.cache.get(key)
+        if summary is not None:
+            self.cached += 1
+            return summary
+        async with semaphore:
+            summary = (await chain.ainvoke({"prompt": prompt})).strip()
+        self.calls += 1
+        self.cache.put(key, summary)
+        return summary
+
+    async def _map(self, sections: List[Section], semaphore: asyncio.Semaphore) -> List[Section]:
+        prompts = [SECTION_PROMPT.format(title=section.title, text=section.text) for section in sections]
+        summaries = await asyncio.gather(*(self._summarize(self.map_chain, prompt, semaphore)
+                                           for prompt in prompts))
+        return [Section(section.title, summary) for section, summary in zip(sections, summaries)]
+
+    async def _summarize_async(self, markdown: str, context: str) -> str:
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        analysis = VOLATILE_LINE.sub('', markdown).strip()
+        if len(analysis) <= self.max_reduce_chars:
+            logger.info(f"Analysis fits one prompt ({len(analysis)} chars); skipping section summaries")
+            prompt = CONCLUSION_PROMPT.format(source="this full analysis", context=context,
+                                              heading="FULL ANALYSIS", material=analysis)
+            return await self._summarize(self.reduce_chain, prompt, semaphore)
+
+        sections = split_sections(markdown, self.max_section_chars)
+        summaries = await self._map(sections, semaphore)
+        level = 1
+        logger.info(f"Summarized {len(sections)} sections")
+
+        # Collapse the summaries in groups until they fit one reduce prompt
+        while len(format_summaries(summaries)) > self.max_reduce_chars:
+            groups = group_summaries(summaries, self.max_reduce_chars)
+            if len(groups) == len(summaries):
+                break  # no two summaries fit together; reduce what we have
+            summaries = await self._map(groups, semaphore)
+            level += 1
+            logger.info(f"Reduced to {len(summaries)} group summaries (level {level})")
+
+        prompt = CONCLUSION_PROMPT.format(source="these summaries of the analysis sections", context=context,
+                                          heading="SECTION SUMMARIES", material=format_summaries(summaries))
+        return await self._summarize(self.reduce_chain, prompt, semaphore)
+
+    def summarize(self, markdown: str, context: str) -> str:
+        """Conclusion for the analysis; only changed sections cost a model call."""
+        try:
+            return asyncio.run(self._summarize_async(markdown, context))
+        finally:
+            self.cache.save()
+            logger.info(f"Summary calls: {self.calls} made, {self.cached} from cache")
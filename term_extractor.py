@@ -4,16 +4,41 @@ Term extraction system for Heidegger's Being and Time.
 Hybrid approach: primitive text analysis + LLM philosophical analysis.
 """
 
-import re
+import asyncio
+import hashlib
 import json
+import time
 from collections import Counter, defaultdict
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
+from typing import Callable, Dict, List, Tuple, Optional
 from dataclasses import dataclass, asdict
+from datetime import datetime
 import logging
+from langchain_core.exceptions import OutputParserException
+from pydantic import BaseModel, Field
 from chunker import TextChunker
+from term_scanner import count_terms, is_philosophical_term, stem_term
 from translator import Translator
-from nltk.stem.snowball import GermanStemmer
+
+# Sample contexts kept per stem for the LLM prompt
+MAX_CONTEXTS = 8
+
+TERM_PROMPT = """Analyze the philosophical term "{canonical_form}" in Heidegger's "Being and Time".
+
+This term appears {total_frequency} times total in these forms: {forms_info}
+Stem: {stem}
+
+Context examples:
+{contexts}
+
+Provide:
+- Philosophical importance (1-10 scale, where 10 = fundamental Heideggerian concept)
+- Core concept (is this a central concept in Being and Time?)
+- Translation challenges (what makes this term difficult to translate?)
+- Suggested renderings (2-3 possible English translations)
+- Contextual variations (does the meaning shift across different contexts?)
+
+Be concise and focus on translation-relevant insights."""
 
 @dataclass
 class PhilosophicalTerm:
@@ -33,40 +58,138 @@ class PhilosophicalTerm:
         if self.suggested_renderings is None:
             self.suggested_renderings = []
 
+class TermAnalysis(BaseModel):
+    """Structured LLM analysis of a term (mirrors the PhilosophicalTerm analysis fields)."""
+    philosophical_importance: int = Field(description="Importance 1-10, where 10 = fundamental Heideggerian concept", ge=1, le=10)
+    is_core_concept: bool = Field(description="Whether this is a central concept in Being and Time")
+    translation_challenges: str = Field(description="What makes this term difficult to translate")
+    suggested_renderings: List[str] = Field(description="2-3 possible English translations", default_factory=list)
+    contextual_variations: str = Field(description="Whether and how the meaning shifts across contexts")
+    
+    def apply_to(self, term: PhilosophicalTerm) -> PhilosophicalTerm:
+        """Copy the analysis onto a PhilosophicalTerm."""
+        term.philosophical_importance = self.philosophical_importance
+        term.is_core_concept = self.is_core_concept
+        term.translation_challenges = self.translation_challenges
+        term.suggested_renderings = list(self.suggested_renderings)
+        term.contextual_variations = self.contextual_variations
+        return term
+
+class TermAnalysisParseError(ValueError):
+    """The model answered but no TermAnalysis could be parsed from it."""
+
+@dataclass
+class TermAnalysisOutcome:
+    """Result of one term analysis request."""
+    term: str
+    status: str  # "ok", "parse_error" or "error"
+    latency: float  # seconds
+    error: Optional[str] = None
+
+def log_analysis_outcomes(outcomes: List[TermAnalysisOutcome], elapsed: float,
+                          logger: logging.Logger):
+    """Summarize latencies and failures of a term analysis batch."""
+    latencies = sorted(o.latency for o in outcomes)
+    parse_failures = [o.term for o in outcomes if o.status == "parse_error"]
+    errors = [o.term for o in outcomes if o.status == "error"]
+    
+    logger.info(f"Analyzed {len(outcomes) - len(parse_failures) - len(errors)}/{len(outcomes)} terms in {elapsed:.1f}s")
+    if latencies:
+        logger.info(f"  Latency: median {latencies[len(latencies) // 2]:.1f}s, max {latencies[-1]:.1f}s, "
+                    f"total {sum(latencies):.1f}s")
+    if parse_failures:
+        logger.warning(f"  Parse failures ({len(parse_failures)}): {', '.join(parse_failures)}")
+    if errors:
+        logger.warning(f"  Request errors ({len(errors)}): {', '.join(errors)}")
+
+# Analysis fields of PhilosophicalTerm that the cache stores
+ANALYSIS_FIELDS = ("philosophical_importance", "is_core_concept", "translation_challenges",
+                   "suggested_renderings", "contextual_variations")
+
+def contexts_hash(contexts: List[str]) -> str:
+    """Hash of the sample contexts a term was analyzed with."""
+    return hashlib.sha1("\n\x1e\n".join(contexts).encode('utf-8')).hexdigest()[:16]
+
+def prompt_hash() -> str:
+    """Hash of the term analysis prompt template."""
+    return hashlib.sha1(TERM_PROMPT.encode('utf-8')).hexdigest()[:16]
+
+class TermAnalysisCache:
+    """LLM term analyses persisted by (model, stem, contexts hash, prompt hash).
+    
+    A term is only re-analyzed when the model, its stem, the contexts shown
+    to the model or the prompt template change.
+    """
+    
+    def __init__(self, cache_file: Path):
+        self.cache_file = cache_file
+        self.entries: Dict[str, Dict] = {}
+        self.hits = 0
+        self.logger = logging.getLogger(__name__)
+        
+        if cache_file.exists():
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f).get("entries", {})
+            self.logger.info(f"Loaded {len(self.entries)} cached term analyses from {cache_file}")
+    
+    @staticmethod
+    def key(model_name: str, term: PhilosophicalTerm) -> str:
+        return f"{model_name}|{term.stem}|{contexts_hash(term.contexts)}|{prompt_hash()}"
+    
+    def apply(self, model_name: str, term: PhilosophicalTerm) -> bool:
+        """Fill in a cached analysis; False if this term has not been analyzed yet."""
+        entry = self.entries.get(self.key(model_name, term))
+        if entry is None:
+            return False
+        for name in ANALYSIS_FIELDS:
+            setattr(term, name, entry["analysis"][name])
+        self.hits += 1
+        return True
+    
+    def put(self, model_name: str, term: PhilosophicalTerm):
+        self.entries[self.key(model_name, term)] = {
+            "model": model_name,
+            "stem": term.stem,
+            "canonical_form": term.canonical_form,
+            "analyzed_at": datetime.now().isoformat(),
+            "analysis": {name: getattr(term, name) for name in ANALYSIS_FIELDS},
+        }
+    
+    def import_analysis(self, analysis_file: Path) -> int:
+        """Seed the cache from a term_analysis.json that records its model."""
+        with open(analysis_file, 'r', encoding='utf-8') as f:
+            analysis_data = json.load(f)
+        
+        model_name = analysis_data.get("metadata", {}).get("model")
+        if not model_name:
+            return 0  # older files do not say which model wrote them
+        
+        imported = 0
+        for term_data in analysis_data.get("terms", []):
+            term = PhilosophicalTerm(**term_data)
+            if term.philosophical_importance is not None and self.key(model_name, term) not in self.entries:
+                self.put(model_name, term)
+                imported += 1
+        return imported
+    
+    def save(self):
+        tmp_file = self.cache_file.with_name(self.cache_file.name + '.tmp')
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump({"entries": self.entries}, f, indent=2, ensure_ascii=False)
+        tmp_file.replace(self.cache_file)
+
 class TermExtractor:
     """Extracts and analyzes philosophical terms from Heidegger's text."""
     
-    def __init__(self, text_file: Path, model_name: str = "gpt-4o"):
+    def __init__(self, text_file: Path, model_name: str = "gpt-4o", workers: int = 1, lemmatizer=None):
         self.text_file = text_file
+        self.workers = workers  # processes for paragraph scanning
+        self.lemmatizer = lemmatizer  # lemmatizer.SpacyLemmatizer, or None for Snowball stems
         self.chunker = TextChunker(text_file)
         self.text = self.chunker.text
         self.translator = Translator(model_name)  # Reuse for LLM analysis
+        self.normalize: Callable[[str], str] = stem_term  # set by extract_and_cluster_terms
         self.logger = logging.getLogger(__name__)
-        
-        # Initialize German stemmer
-        self.stemmer = GermanStemmer()
-        
-        # Updated patterns - simpler and more targeted
-        self.compound_patterns = [
-            r'\b[Ii]n-der-[Ww]elt-sein\b',  # Exact compound matches first
-            r'\b[Ss]ein-zum-[Tt]ode?\b',    # Being-toward-death
-            r'\b[A-Z][a-z]+(?:-[a-z]+)+\b', # General hyphenated compounds  
-            r'\b[a-z]+(?:heit|keit|ung|schaft|tum|nis)\b', # Philosophical suffixes
-            r'\b[DdSsZzWwEeGgAaBbFf][a-zäöüß]{3,}\b', # German philosophical terms
-        ]
-        
-        # Common non-philosophical words to filter out
-        self.stopwords = {
-            'der', 'die', 'das', 'und', 'oder', 'aber', 'auch', 'noch', 'nur', 
-            'wie', 'was', 'wenn', 'dann', 'sich', 'auf', 'aus', 'bei', 'mit',
-            'nach', 'von', 'vor', 'über', 'unter', 'durch', 'für', 'gegen',
-            'ohne', 'um', 'bis', 'seit', 'während', 'wegen', 'trotz',
-            'diese', 'dieses', 'dieser', 'dem', 'den', 'allem', 'andere', 'anderen',
-            # Functional/connective words
-            'damit', 'daher', 'darin', 'dabei', 'dafür', 'dagegen', 'danach', 
-            'davon', 'dazu', 'demnach', 'deshalb', 'deswegen', 'hierbei', 
-            'hierzu', 'indem', 'insofern', 'somit', 'wobei', 'wodurch', 'zudem'
-        }
     
     def extract_and_cluster_terms(self) -> Dict[str, PhilosophicalTerm]:
         """Extract terms and cluster by stem."""
@@ -75,8 +198,9 @@ class TermExtractor:
         # Step 1: Extract raw terms
         raw_term_contexts = self._extract_raw_terms()
         
-        # Step 2: Cluster by stem  
-        stem_clusters = self._cluster_by_stem(raw_term_contexts)
+        # Step 2: Cluster by stem (or lemma)
+        self.normalize = self._term_normalizer(raw_term_contexts[0])
+        stem_clusters = self._cluster_by_stem(raw_term_contexts, self.normalize)
         
         # Step 3: Create PhilosophicalTerm objects
         philosophical_terms = {}
@@ -87,54 +211,47 @@ class TermExtractor:
         self.logger.info(f"Clustered into {len(philosophical_terms)} stem groups")
         return philosophical_terms
 
-    def _extract_raw_terms(self) -> Dict[str, List[str]]:
-        """Extract raw terms with contexts."""
-        term_contexts = defaultdict(list)
-        paragraphs = self.text.split('\n\n')
-        
-        for para in paragraphs:
-            if len(para) < 20:
-                continue
-                
-            # Apply patterns in order of specificity
-            matched_positions = set()
-            
-            for pattern in self.compound_patterns:
-                for match in re.finditer(pattern, para):
-                    start, end = match.span()
-                    
-                    # Skip overlapping matches
-                    if any(pos in matched_positions for pos in range(start, end)):
-                        continue
-                        
-                    term = match.group().lower()
-                    
-                    if self._is_philosophical_term(term):
-                        matched_positions.update(range(start, end))
-                        
-                        # Context window
-                        context_start = max(0, start - 100)  
-                        context_end = min(len(para), end + 100)
-                        context = para[context_start:context_end].strip()
-                        
-                        term_contexts[term].append(context)
-        
-        return dict(term_contexts)
+    def _extract_raw_terms(self) -> Tuple[Counter, Dict[str, List[str]]]:
+        """Extract raw term frequencies and sample contexts (see term_scanner)."""
+        # Only the first MAX_CONTEXTS per stem are kept, so no term needs more
+        return count_terms(self.text.split('\n\n'), self.workers, max_contexts=MAX_CONTEXTS)
 
-    def _cluster_by_stem(self, raw_terms: Dict[str, List[str]]) -> Dict[str, Dict]:
-        """Cluster terms by German stem."""
+    def _term_normalizer(self, term_counts: Counter) -> Callable[[str], str]:
+        """Snowball stemming, or spaCy lemmas when a lemmatizer is set.
+        
+        Snowball is always timed so its throughput is logged next to spaCy's.
+        """
+        stem_term("sein")  # load the stemmer outside the timing
+        start = time.perf_counter()
+        stems = {term: stem_term(term) for term in term_counts}
+        elapsed = time.perf_counter() - start
+        rate = len(stems) / elapsed if elapsed > 0 else 0
+        self.logger.info(f"Snowball: stemmed {len(stems)} terms in {elapsed:.2f}s ({rate:.0f} terms/s), "
+                         f"{len(set(stems.values()))} clusters")
+        
+        if self.lemmatizer is None:
+            return stem_term
+        
+        lemmas = self.lemmatizer.lemma_map(self.text.split('\n\n'))
+        clusters = {lemmas.get(term, term) for term in term_counts}
+        self.logger.info(f"spaCy: {len(clusters)} clusters")
+        return lambda term: lemmas.get(term, term)
+    
+    def _cluster_by_stem(self, raw_terms: Tuple[Counter, Dict[str, List[str]]],
+                         normalize: Callable[[str], str] = stem_term) -> Dict[str, Dict]:
+        """Cluster terms by German stem (or by any term -> cluster key function)."""
         stem_data = defaultdict(lambda: {
             'forms': Counter(),
             'contexts': [],
             'total_frequency': 0
         })
         
-        for term, contexts in raw_terms.items():
-            stem = self.stemmer.stem(term)
-            frequency = len(contexts)
+        term_counts, term_contexts = raw_terms
+        for term, frequency in term_counts.items():
+            stem = normalize(term)
             
             stem_data[stem]['forms'][term] += frequency
-            stem_data[stem]['contexts'].extend(contexts)
+            stem_data[stem]['contexts'].extend(term_contexts[term])
             stem_data[stem]['total_frequency'] += frequency
         
         return dict(stem_data)
@@ -149,49 +266,32 @@ class TermExtractor:
             stem=stem,
             total_frequency=cluster_data['total_frequency'],
             morphological_forms=dict(cluster_data['forms']),
-            contexts=cluster_data['contexts'][:8]  # Sample contexts
+            contexts=cluster_data['contexts'][:MAX_CONTEXTS]  # Sample contexts
         )
 
     def _is_philosophical_term(self, term: str) -> bool:
         """Filter for philosophical terms."""
-        # Stopwords and noise
-        if term in self.stopwords:
-            return False
-            
-        if len(term) < 4:
-            return False
-            
-        # Philosophical indicators
-        philosophical_markers = [
-            'sein', 'da', 'zeit', 'welt', 'sorge', 'angst', 'wahrheit',
-            'heit', 'keit', 'ung', 'schaft', 'tum', 'nis'
-        ]
-        
-        return any(marker in term for marker in philosophical_markers)
+        return is_philosophical_term(term)
     
-    def prioritize_terms(self, philosophical_terms: Dict[str, PhilosophicalTerm], top_n: int = 100) -> List[PhilosophicalTerm]:
-        """Prioritize terms for LLM analysis based on frequency and patterns."""
-        
-        def priority_score(term: PhilosophicalTerm) -> float:
-            score = term.total_frequency  # Base frequency
-            
-            # Boost for capitalized canonical forms (likely important concepts)
-            if any(c.isupper() for c in term.canonical_form):
-                score *= 1.5
+    def prioritize_terms(self, philosophical_terms: Dict[str, PhilosophicalTerm], top_n: int = 100,
+                         scorer: str = "heuristic") -> List[PhilosophicalTerm]:
+        """Prioritize terms for LLM analysis.
+        
+        scorer="heuristic" weights frequency by spelling patterns; scorer="tfidf"
+        ranks stems by TF-IDF distinctiveness over the § sections (see term_tfidf).
+        """
+        if scorer == "tfidf":
+            from term_tfidf import section_tfidf_scores
             
-            # Boost for compound words with philosophical suffixes
-            if any(term.canonical_form.endswith(suffix) for suffix in ['heit', 'keit', 'ung', 'schaft']):
-                score *= 2.0
+            # Key the scores like the terms: Snowball stems or spaCy lemmas
+            tfidf = section_tfidf_scores(self.chunker.extract_sections(), self.workers, stem=self.normalize)
             
-            # Boost for terms containing 'sein' or 'da'
-            if 'sein' in term.canonical_form or 'da' in term.canonical_form:
-                score *= 1.8
-            
-            # Boost for hyphenated terms (often technical)
-            if '-' in term.canonical_form:
-                score *= 1.3
-            
-            return score
+            def priority_score(term: PhilosophicalTerm) -> float:
+                return tfidf.get(term.stem, 0.0)
+        elif scorer == "heuristic":
+            priority_score = self._heuristic_priority
+        else:
+            raise ValueError(f"Unknown term scorer: {scorer}")
         
         # Calculate priority scores
         term_scores = [
@@ -203,90 +303,141 @@ class TermExtractor:
         term_scores.sort(key=lambda x: x[1], reverse=True)
         top_terms = [term for term, score in term_scores[:top_n]]
         
-        self.logger.info(f"Prioritized top {len(top_terms)} terms for LLM analysis")
+        self.logger.info(f"Prioritized top {len(top_terms)} terms for LLM analysis ({scorer} scorer)")
         return top_terms
     
-    def analyze_term_philosophically(self, term: PhilosophicalTerm) -> PhilosophicalTerm:
-        """Phase 2: Use LLM to analyze philosophical significance of a term."""
+    @staticmethod
+    def _heuristic_priority(term: PhilosophicalTerm) -> float:
+        """Frequency boosted by capitalization, suffixes, 'sein'/'da' and hyphens."""
+        score = term.total_frequency  # Base frequency
+        
+        # Boost for capitalized canonical forms (likely important concepts)
+        if any(c.isupper() for c in term.canonical_form):
+            score *= 1.5
         
+        # Boost for compound words with philosophical suffixes
+        if any(term.canonical_form.endswith(suffix) for suffix in ['heit', 'keit', 'ung', 'schaft']):
+            score *= 2.0
+        
+        # Boost for terms containing 'sein' or 'da'
+        if 'sein' in term.canonical_form or 'da' in term.canonical_form:
+            score *= 1.8
+        
+        # Boost for hyphenated terms (often technical)
+        if '-' in term.canonical_form:
+            score *= 1.3
+        
+        return score
+    
+    def _term_prompt(self, term: PhilosophicalTerm) -> str:
+        """Prompt asking for a structured analysis of one term."""
         # Show morphological forms in prompt
         forms_info = ", ".join([f"{form} ({freq}x)" for form, freq in term.morphological_forms.items()])
         
-        prompt = f"""Analyze the philosophical term "{term.canonical_form}" in Heidegger's "Being and Time".
-
-This term appears {term.total_frequency} times total in these forms: {forms_info}
-Stem: {term.stem}
-
-Context examples:
-{chr(10).join(f"- {ctx[:200]}..." for ctx in term.contexts)}
-
-Provide analysis in this format:
-- Philosophical importance (1-10 scale, where 10 = fundamental Heideggerian concept)
-- Core concept (yes/no - is this a central concept in Being and Time?)
-- Translation challenges (what makes this term difficult to translate?)
-- Suggested renderings (2-3 possible English translations)
-- Contextual variations (does the meaning shift across different contexts?)
-
-Be concise and focus on translation-relevant insights."""
-
+        return TERM_PROMPT.format(
+            canonical_form=term.canonical_form,
+            total_frequency=term.total_frequency,
+            forms_info=forms_info,
+            stem=term.stem,
+            contexts="\n".join(f"- {ctx[:200]}..." for ctx in term.contexts),
+        )
+    
+    def _term_analysis_chain(self):
+        """Prompt -> model -> TermAnalysis chain for the configured model."""
+        from langchain_core.prompts import ChatPromptTemplate
+        
+        model_name = self.translator.model_name
+        if model_name.startswith("gemini") or model_name.startswith("claude") or model_name.startswith("grok"):
+            # Use PydanticOutputParser for models with structured output issues
+            from langchain_core.output_parsers import PydanticOutputParser
+            parser = PydanticOutputParser(pydantic_object=TermAnalysis)
+            instructions = f"\n\n# Output Format\n\nRespond with valid JSON in this exact format:\n{parser.get_format_instructions()}"
+            structured_llm = self.translator.model | parser
+        else:
+            # include_raw surfaces parsing errors instead of raising or returning None
+            instructions = ""
+            structured_llm = self.translator.model.with_structured_output(TermAnalysis, include_raw=True)
+        
+        prompt_template = ChatPromptTemplate.from_messages([
+            ("system", "You are an expert on Heidegger and philosophical translation."),
+            ("human", "{term_prompt}" + instructions.replace("{", "{{").replace("}", "}}"))
+        ])
+        return prompt_template | structured_llm
+    
+    @staticmethod
+    def _unwrap_analysis(result) -> TermAnalysis:
+        """Return the parsed analysis, raising TermAnalysisParseError if there is none."""
+        if isinstance(result, dict) and 'parsed' in result:
+            if result.get('parsing_error') or result['parsed'] is None:
+                raise TermAnalysisParseError(str(result.get('parsing_error') or "model returned no parsed output"))
+            result = result['parsed']
+        if not isinstance(result, TermAnalysis):
+            raise TermAnalysisParseError(f"unexpected result type: {type(result).__name__}")
+        return result
+    
+    def analyze_term_philosophically(self, term: PhilosophicalTerm) -> PhilosophicalTerm:
+        """Phase 2: Use LLM to analyze philosophical significance of a term."""
         try:
-            # For now, let's use a simpler approach - direct model call
-            from langchain_core.messages import HumanMessage
-            response = self.translator.model.invoke([HumanMessage(content=prompt)])
-            analysis_text = response.content
-            
-            # Parse the response (simple regex parsing)
-            importance_match = re.search(r'importance.*?(\d+)', analysis_text.lower())
-            importance = int(importance_match.group(1)) if importance_match else 5
-            
-            core_concept = 'yes' in analysis_text.lower() and 'core concept' in analysis_text.lower()
-            
-            # Extract other fields with simple pattern matching
-            challenges = self._extract_section(analysis_text, "translation challenges")
-            renderings = self._extract_renderings(analysis_text)
-            variations = self._extract_section(analysis_text, "contextual variations")
-            
-            # Update the term with analysis
-            term.philosophical_importance = importance
-            term.is_core_concept = core_concept
-            term.translation_challenges = challenges
-            term.suggested_renderings = renderings
-            term.contextual_variations = variations
-            
-            return term
-            
+            result = self._term_analysis_chain().invoke({"term_prompt": self._term_prompt(term)})
+            return self._unwrap_analysis(result).apply_to(term)
         except Exception as e:
             self.logger.warning(f"Failed to analyze term '{term.canonical_form}': {e}")
             return term
     
-    def _extract_section(self, text: str, section_name: str) -> str:
-        """Extract a section from LLM response."""
-        pattern = rf"{section_name}[:\-\s]*(.+?)(?:\n-|\n[A-Z]|$)"
-        match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
-        return match.group(1).strip() if match else ""
-    
-    def _extract_renderings(self, text: str) -> List[str]:
-        """Extract suggested renderings from LLM response."""
-        section = self._extract_section(text, "suggested renderings")
-        if not section:
-            return []
-        
-        # Split on commas, semicolons, or line breaks
-        renderings = re.split(r'[,;\n]+', section)
-        return [r.strip(' -"\'') for r in renderings if r.strip()]
-    
-    def analyze_terms_batch(self, priority_terms: List[PhilosophicalTerm]) -> List[PhilosophicalTerm]:
-        """Analyze multiple terms using LLM."""
-        self.logger.info(f"Analyzing {len(priority_terms)} terms with LLM...")
-        
-        analyzed_terms = []
-        for i, term in enumerate(priority_terms):
-            self.logger.info(f"Analyzing term {i+1}/{len(priority_terms)}: {term.canonical_form} (stem: {term.stem})")
-            
-            analyzed = self.analyze_term_philosophically(term)
-            analyzed_terms.append(analyzed)
-        
-        return analyzed_terms
+    async def _analyze_term_async(self, chain, term: PhilosophicalTerm,
+                                  semaphore: asyncio.Semaphore) -> TermAnalysisOutcome:
+        """Analyze one term under the concurrency limit, timing the request."""
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                result = await chain.ainvoke({"term_prompt": self._term_prompt(term)})
+                self._unwrap_analysis(result).apply_to(term)
+                status, error = "ok", None
+            except (TermAnalysisParseError, OutputParserException) as e:
+                # Output parsers raise OutputParserException on malformed JSON
+                status, error = "parse_error", str(e)
+            except Exception as e:
+                status, error = "error", str(e)
+            latency = time.perf_counter() - start
+        
+        outcome = TermAnalysisOutcome(term.canonical_form, status, latency, error)
+        if status == "ok":
+            self.logger.info(f"  ✓ {term.canonical_form} ({latency:.1f}s)")
+        else:
+            self.logger.warning(f"  ✗ {term.canonical_form} ({latency:.1f}s) {status}: {error}")
+        return outcome
+    
+    async def analyze_terms_async(self, priority_terms: List[PhilosophicalTerm],
+                                  concurrency: int = 8) -> List[TermAnalysisOutcome]:
+        """Analyze terms concurrently, at most `concurrency` requests in flight."""
+        chain = self._term_analysis_chain()
+        semaphore = asyncio.Semaphore(concurrency)
+        return await asyncio.gather(*(self._analyze_term_async(chain, term, semaphore)
+                                      for term in priority_terms))
+    
+    def analyze_terms_batch(self, priority_terms: List[PhilosophicalTerm], concurrency: int = 8,
+                            cache: Optional[TermAnalysisCache] = None,
+                            refresh: bool = False) -> List[PhilosophicalTerm]:
+        """Analyze multiple terms using LLM, skipping terms already in the cache."""
+        model_name = self.translator.model_name
+        pending = priority_terms
+        if cache is not None and not refresh:
+            pending = [term for term in priority_terms if not cache.apply(model_name, term)]
+            self.logger.info(f"Reusing {len(priority_terms) - len(pending)} cached term analyses")
+        
+        self.logger.info(f"Analyzing {len(pending)} terms with LLM ({concurrency} concurrent)...")
+        
+        start = time.perf_counter()
+        outcomes = asyncio.run(self.analyze_terms_async(pending, concurrency)) if pending else []
+        log_analysis_outcomes(outcomes, time.perf_counter() - start, self.logger)
+        
+        if cache is not None:
+            for term, outcome in zip(pending, outcomes):
+                if outcome.status == "ok":
+                    cache.put(model_name, term)
+            cache.save()
+        
+        return priority_terms
     
     def generate_glossary(self, analyzed_terms: List[PhilosophicalTerm]) -> str:
         """Generate GLOSSARY.md content from analyzed terms."""
@@ -376,6 +527,7 @@ Be concise and focus on translation-relevant insights."""
         analysis_data = {
             "metadata": {
                 "source_file": str(self.text_file),
+                "model": self.translator.model_name,
                 "total_terms": len(analyzed_terms),
                 "analysis_date": None  # Could add timestamp
             },
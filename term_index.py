@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Inverted index of term occurrences.
+
+PhilosophicalTerm only keeps a few sample contexts, so this records every
+occurrence found by the term scanner as (paragraph, start, end), using
+TextChunker's paragraph numbering and character offsets into the paragraph.
+Stems map to their surface forms, so "where does Zuhandenheit appear" is a
+dictionary lookup instead of a rescan of the text.
+"""
+
+import json
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from chunker import TextChunker
+from term_scanner import MIN_PARAGRAPH_LENGTH, scan_paragraph, stem_term
+
+logger = logging.getLogger(__name__)
+
+# (paragraph index, start, end)
+Location = Tuple[int, int, int]
+
+@dataclass
+class TermIndex:
+    """Surface form -> locations, and stem -> surface forms."""
+    forms: Dict[str, List[Location]] = field(default_factory=dict)
+    stems: Dict[str, List[str]] = field(default_factory=dict)
+    paragraph_ids: List[str] = field(default_factory=list)  # content hashes, to detect a stale index
+    source_file: Optional[str] = None
+
+    def locations(self, term: str, stem: Callable[[str], str] = stem_term) -> List[Location]:
+        """All occurrences of a surface form, or of every form sharing its stem."""
+        term = term.lower()
+        if term in self.forms:
+            return list(self.forms[term])
+
+        found = [loc for form in self.stems.get(stem(term), []) for loc in self.forms[form]]
+        return sorted(found)
+
+    def paragraphs(self, term: str, stem: Callable[[str], str] = stem_term) -> List[int]:
+        """Paragraph indices in which a term (or its stem) occurs."""
+        return sorted({paragraph for paragraph, _, _ in self.locations(term, stem)})
+
+    def is_current(self, chunker: TextChunker) -> bool:
+        """True if the index was built from the chunker's current text."""
+        return self.paragraph_ids == chunker.paragraph_ids()
+
+    def save(self, output_file: Path):
+        data = {
+            "source_file": self.source_file,
+            "created": datetime.now().isoformat(),
+            "paragraph_ids": self.paragraph_ids,
+            "stems": self.stems,
+            "forms": {form: [list(loc) for loc in locs] for form, locs in self.forms.items()},
+        }
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+
+        logger.info(f"Saved term index ({len(self.forms)} forms, {len(self.stems)} stems) to {output_file}")
+
+    @classmethod
+    def load(cls, index_file: Path) -> "TermIndex":
+        with open(index_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        return cls(
+            forms={form: [tuple(loc) for loc in locs] for form, locs in data["forms"].items()},
+            stems=data["stems"],
+            paragraph_ids=data["paragraph_ids"],
+            source_file=data.get("source_file"),
+        )
+
+def _scan_for_index(para: str) -> List[Tuple[str, int, int]]:
+    """Occurrences in one paragraph in text order (process pool worker)."""
+    if len(para) < MIN_PARAGRAPH_LENGTH:
+        return []
+    return sorted(scan_paragraph(para), key=lambda occurrence: occurrence[1])
+
+def build_term_index(chunker: TextChunker, workers: int = 1,
+                     stem: Callable[[str], str] = stem_term) -> TermIndex:
+    """Scan every TextChunker paragraph and index the term occurrences."""
+    paragraphs = chunker.extract_paragraphs()
+
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            scanned = list(executor.map(_scan_for_index, paragraphs, chunksize=64))
+    else:
+        scanned = [_scan_for_index(para) for para in paragraphs]
+
+    forms: Dict[str, List[Location]] = {}
+    for paragraph, occurrences in enumerate(scanned):
+        for term, start, end in occurrences:
+            forms.setdefault(term, []).append((paragraph, start, end))
+
+    stems: Dict[str, List[str]] = {}
+    for form in forms:
+        stems.setdefault(stem(form), []).append(form)
+
+    return TermIndex(
+        forms=forms,
+        stems=stems,
+        paragraph_ids=chunker.paragraph_ids(),
+        source_file=str(chunker.text_file),
+    )
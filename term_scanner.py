@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Candidate term scanning for TermExtractor.
+
+Patterns are applied in order of specificity and a match is dropped if it
+overlaps a span already claimed by an earlier accepted term. Claimed spans are
+kept as sorted, disjoint intervals, so the overlap test is one bisect instead
+of probing every character position; the philosophical-term filter is
+memoized since the same words recur throughout the text, and patterns that
+need a literal (the hyphenated compounds) skip paragraphs without it.
+"""
+
+import re
+from bisect import bisect_left
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import repeat
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Updated patterns - simpler and more targeted
+COMPOUND_PATTERNS = [
+    r'\b[Ii]n-der-[Ww]elt-sein\b',  # Exact compound matches first
+    r'\b[Ss]ein-zum-[Tt]ode?\b',    # Being-toward-death
+    r'\b[A-Z][a-z]+(?:-[a-z]+)+\b', # General hyphenated compounds
+    r'\b[a-z]+(?:heit|keit|ung|schaft|tum|nis)\b', # Philosophical suffixes
+    r'\b[DdSsZzWwEeGgAaBbFf][a-zäöüß]{3,}\b', # German philosophical terms
+]
+# Text every match of the pattern contains; paragraphs without it skip the scan
+PATTERN_LITERALS = ['-der-', '-zum-', '-', None, None]
+COMPILED_PATTERNS = [(re.compile(pattern), literal)
+                     for pattern, literal in zip(COMPOUND_PATTERNS, PATTERN_LITERALS)]
+
+# Common non-philosophical words to filter out
+STOPWORDS = frozenset({
+    'der', 'die', 'das', 'und', 'oder', 'aber', 'auch', 'noch', 'nur',
+    'wie', 'was', 'wenn', 'dann', 'sich', 'auf', 'aus', 'bei', 'mit',
+    'nach', 'von', 'vor', 'über', 'unter', 'durch', 'für', 'gegen',
+    'ohne', 'um', 'bis', 'seit', 'während', 'wegen', 'trotz',
+    'diese', 'dieses', 'dieser', 'dem', 'den', 'allem', 'andere', 'anderen',
+    # Functional/connective words
+    'damit', 'daher', 'darin', 'dabei', 'dafür', 'dagegen', 'danach',
+    'davon', 'dazu', 'demnach', 'deshalb', 'deswegen', 'hierbei',
+    'hierzu', 'indem', 'insofern', 'somit', 'wobei', 'wodurch', 'zudem'
+})
+
+# Philosophical indicators
+PHILOSOPHICAL_MARKERS = [
+    'sein', 'da', 'zeit', 'welt', 'sorge', 'angst', 'wahrheit',
+    'heit', 'keit', 'ung', 'schaft', 'tum', 'nis'
+]
+MARKER_PATTERN = re.compile('|'.join(map(re.escape, PHILOSOPHICAL_MARKERS)))
+
+MIN_PARAGRAPH_LENGTH = 20
+CONTEXT_WINDOW = 100
+STEM_CACHE_SIZE = 1 << 16
+
+# (lowercased term, start, end) within a paragraph
+Occurrence = Tuple[str, int, int]
+
+@lru_cache(maxsize=None)
+def _german_stemmer():
+    from nltk.stem.snowball import GermanStemmer
+    return GermanStemmer()
+
+@lru_cache(maxsize=STEM_CACHE_SIZE)
+def stem_term(term: str) -> str:
+    """Snowball stem of a term, memoized for everything that clusters by stem."""
+    return _german_stemmer().stem(term)
+
+@lru_cache(maxsize=None)
+def is_philosophical_term(term: str) -> bool:
+    """Filter for philosophical terms."""
+    # Stopwords and noise
+    if term in STOPWORDS:
+        return False
+
+    if len(term) < 4:
+        return False
+
+    return MARKER_PATTERN.search(term) is not None
+
+@lru_cache(maxsize=None)
+def candidate_term(word: str) -> Optional[str]:
+    """Lowercased term if a matched word passes the filter, else None."""
+    term = word.lower()
+    return term if is_philosophical_term(term) else None
+
+def scan_paragraph(para: str) -> List[Occurrence]:
+    """Accepted term occurrences in one paragraph, in pattern priority order."""
+    occurrences = []
+    starts: List[int] = []  # claimed spans, sorted and disjoint
+    ends: List[int] = []
+
+    for pattern, literal in COMPILED_PATTERNS:
+        if literal and literal not in para:
+            continue
+
+        for match in pattern.finditer(para):
+            # Rejected words never claim a span, so filter before the overlap test
+            term = candidate_term(match.group())
+            if term is None:
+                continue
+
+            # Skip overlapping matches: the last claimed span starting before
+            # our end is the only one that can reach into us
+            start, end = match.span()
+            i = bisect_left(starts, end)
+            if i and ends[i - 1] > start:
+                continue
+
+            starts.insert(i, start)
+            ends.insert(i, end)
+            occurrences.append((term, start, end))
+
+    return occurrences
+
+def term_context(para: str, start: int, end: int) -> str:
+    """Context window around an occurrence."""
+    context_start = max(0, start - CONTEXT_WINDOW)
+    context_end = min(len(para), end + CONTEXT_WINDOW)
+    return para[context_start:context_end].strip()
+
+def _scan_batch(paragraphs: Sequence[str],
+                max_contexts: Optional[int] = None) -> Tuple[Counter, Dict[str, List[str]]]:
+    """Term counts and contexts for a batch of paragraphs (process pool worker)."""
+    counts = Counter()
+    term_contexts = defaultdict(list)
+
+    for para in paragraphs:
+        if len(para) < MIN_PARAGRAPH_LENGTH:
+            continue
+
+        for term, start, end in scan_paragraph(para):
+            counts[term] += 1
+            contexts = term_contexts[term]
+            if max_contexts is None or len(contexts) < max_contexts:
+                contexts.append(term_context(para, start, end))
+
+    return counts, dict(term_contexts)
+
+def count_terms(paragraphs: Sequence[str], workers: int = 1,
+                max_contexts: Optional[int] = None) -> Tuple[Counter, Dict[str, List[str]]]:
+    """Term frequencies plus (up to max_contexts) contexts per term.
+
+    With several workers, contiguous batches are scanned in a process pool and
+    merged in document order, so the result is identical to a single pass.
+    """
+    if workers <= 1:
+        return _scan_batch(paragraphs, max_contexts)
+
+    batch_size = max(1, -(-len(paragraphs) // (workers * 4)))
+    batches = [paragraphs[i:i + batch_size] for i in range(0, len(paragraphs), batch_size)]
+
+    counts = Counter()
+    term_contexts: Dict[str, List[str]] = {}
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for batch_counts, batch_contexts in executor.map(_scan_batch, batches, repeat(max_contexts)):
+            counts.update(batch_counts)
+            for term, contexts in batch_contexts.items():
+                merged = term_contexts.setdefault(term, [])
+                room = len(contexts) if max_contexts is None else max_contexts - len(merged)
+                merged.extend(contexts[:room])
+
+    return counts, term_contexts
+
+def extract_term_contexts(paragraphs: Sequence[str], workers: int = 1) -> Dict[str, List[str]]:
+    """Map each term to the contexts of its occurrences."""
+    return count_terms(paragraphs, workers)[1]
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+TF-IDF distinctiveness of term stems over the § sections.
+
+Each § section is a document. Scanner occurrences are folded into stems and
+collected as a sparse stem x section count matrix in coordinate form (three
+parallel NumPy arrays), then weighted with sublinear tf, smoothed idf and
+per-section L2 normalization. A stem's score is its weight summed over all
+sections: a term that is frequent in many sections still scores well, but
+filler that is merely frequent ("dasselbe", "darüber") is no longer boosted
+by surface features of its spelling.
+"""
+
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import repeat
+from typing import Callable, Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from term_scanner import count_terms, stem_term
+
+@dataclass
+class SectionTermMatrix:
+    """Sparse stem x section counts in coordinate form."""
+    stems: List[str]
+    rows: np.ndarray    # stem index per entry
+    cols: np.ndarray    # section index per entry
+    counts: np.ndarray  # occurrences per entry
+    n_sections: int
+
+def _section_counts(paragraphs: Sequence[str]) -> Counter:
+    """Term counts of one section (process pool worker)."""
+    return count_terms(paragraphs, workers=1, max_contexts=0)[0]
+
+def build_section_matrix(sections: Sequence[Tuple[str, List[str]]], workers: int = 1,
+                         stem: Callable[[str], str] = stem_term) -> SectionTermMatrix:
+    """Count scanner terms, folded into stems, per (heading, paragraphs) section."""
+    paragraphs = [paras for _, paras in sections]
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            section_counts = list(executor.map(_section_counts, paragraphs))
+    else:
+        section_counts = [_section_counts(paras) for paras in paragraphs]
+
+    stem_ids: Dict[str, int] = {}
+    rows, cols, counts = [], [], []
+    for section, term_counts in enumerate(section_counts):
+        stem_counts = Counter()
+        for term, count in term_counts.items():
+            stem_counts[stem(term)] += count
+
+        for stem_form, count in stem_counts.items():
+            rows.append(stem_ids.setdefault(stem_form, len(stem_ids)))
+            cols.append(section)
+            counts.append(count)
+
+    return SectionTermMatrix(
+        stems=list(stem_ids),
+        rows=np.array(rows, dtype=np.int64),
+        cols=np.array(cols, dtype=np.int64),
+        counts=np.array(counts, dtype=np.float64),
+        n_sections=len(sections),
+    )
+
+def tfidf_scores(matrix: SectionTermMatrix) -> Dict[str, float]:
+    """Summed, section-normalized TF-IDF weight of every stem."""
+    if not matrix.stems:
+        return {}
+
+    n_stems = len(matrix.stems)
+    document_frequency = np.bincount(matrix.rows, minlength=n_stems)
+    idf = np.log((1 + matrix.n_sections) / (1 + document_frequency)) + 1
+
+    weights = (1 + np.log(matrix.counts)) * idf[matrix.rows]
+    norms = np.sqrt(np.bincount(matrix.cols, weights=weights ** 2, minlength=matrix.n_sections))
+    weights /= norms[matrix.cols]
+
+    scores = np.bincount(matrix.rows, weights=weights, minlength=n_stems)
+    return dict(zip(matrix.stems, scores.tolist()))
+
+def section_tfidf_scores(sections: Sequence[Tuple[str, List[str]]], workers: int = 1,
+                         stem: Callable[[str], str] = stem_term) -> Dict[str, float]:
+    """Stem -> TF-IDF score over the given § sections."""
+    return tfidf_scores(build_section_matrix(sections, workers, stem))
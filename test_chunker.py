@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+
+import random
+from chunker import TextChunker
+
+def reference_paragraphs(text):
+    """The original split/strip/filter segmentation."""
+    return [p.strip() for p in text.split('\n\n') if p.strip() and len(p.strip()) > 10]
+
+def test_offset_table_matches_split(tmp_path):
+    rng = random.Random(28)
+    alphabet = ['a', 'ä', 'ß', ' ', '\n', '\n\n', ' ', '## § 1. Titel\n\n', 'Sein und Zeit ', '\r\n']
+    
+    for _ in range(200):
+        text = ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 80)))
+        text_file = tmp_path / "text.md"
+        text_file.write_bytes(text.encode('utf-8'))
+        # read_text translates \r\n; the mmap path must segment the same way
+        expected = reference_paragraphs(text.replace('\r\n', '\n'))
+        
+        for use_mmap in (False, True):
+            chunker = TextChunker(text_file, use_mmap=use_mmap)
+            assert len(chunker) == len(expected)
+            assert [chunker.get_paragraph(i) for i in range(len(chunker))] == expected
+            assert chunker.extract_paragraphs() == expected
+
+def test_sections_and_context(tmp_path):
+    text_file = tmp_path / "text.md"
+    text_file.write_text(
+        "Vorwort ohne Paragraphen.\n\n## § 1. Die Notwendigkeit\n\nErster Absatz hier.\n\n"
+        "Zweiter Absatz hier.\n\n## § 2. Die formale Struktur\n\nDritter Absatz hier.",
+        encoding='utf-8'
+    )
+    chunker = TextChunker(text_file)
+    
+    assert chunker.section_id(0) == -1
+    assert chunker.section_header(3) == "## § 1. Die Notwendigkeit"
+    assert chunker.section_header(5) == "## § 2. Die formale Struktur"
+    assert [header for header, _ in chunker.extract_sections()] == [
+        "## § 1. Die Notwendigkeit", "## § 2. Die formale Struktur"
+    ]
+    
+    current, prev = chunker.get_paragraph_with_context(3, context_size=2)
+    assert current == "Zweiter Absatz hier."
+    assert prev == ["## § 1. Die Notwendigkeit", "Erster Absatz hier."]
+    assert [i for i, _, _ in chunker.chunk_iterator(start=2, end=4)] == [2, 3]
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+
+import copy
+import io
+import json
+
+from comparison import RenderCache, render_paragraph, write_comparison
+from passages_store import PassageStore, PassageWriter
+
+with open("passages_75-80.json", 'r', encoding='utf-8') as f:
+    PASSAGES = json.load(f)
+
+def write_shards(output, models):
+    with PassageWriter(output, PASSAGES["paragraph_numbers"], {}, shard_size=2) as writer:
+        for model, model_data in models.items():
+            for number, data in model_data.items():
+                writer.write(model, int(number), data)
+
+def test_render_paragraph_sections():
+    markdown = render_paragraph(77, PASSAGES["models"], separator=True)
+    assert markdown.startswith("## Paragraph 77\n\n### German Original\n")
+    assert [line for line in markdown.splitlines() if line.endswith(" Translation")] == [
+        "### GPT Translation", "### CLAUDE Translation", "### GEMINI Translation", "### GROK Translation"]
+    assert markdown.endswith("---\n")
+
+def test_streamed_output_and_render_cache(tmp_path):
+    passages = tmp_path / "passages"
+    write_shards(passages, PASSAGES["models"])
+    numbers = PASSAGES["paragraph_numbers"]
+
+    out = io.StringIO()
+    cache = RenderCache(tmp_path / "render_cache.json")
+    counts = write_comparison(out, PassageStore(passages).paragraphs(numbers), cache, separator=True)
+    cache.save()
+    assert counts == {"rendered": 6, "cached": 0, "models": 4}
+    assert out.getvalue() == ''.join(render_paragraph(n, PASSAGES["models"], True) + '\n' for n in numbers)
+
+    # One changed translation re-renders only its paragraph
+    models = copy.deepcopy(PASSAGES["models"])
+    models["claude"]["78"]["english_translation"] = "A revised translation."
+    write_shards(passages, models)
+
+    out = io.StringIO()
+    cache = RenderCache(tmp_path / "render_cache.json")
+    counts = write_comparison(out, PassageStore(passages).paragraphs(numbers), cache, separator=True)
+    assert counts == {"rendered": 1, "cached": 5, "models": 4}
+    assert "A revised translation." in out.getvalue()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+
+from concordance import ConcordanceIndex, format_concordance, load_or_build
+
+TEXT = """## § 29. Das Da-sein als Befindlichkeit
+
+Was wir ontologisch mit dem Titel Befindlichkeit anzeigen, ist ontisch das Bekannteste.
+
+Das Verhalten des Daseins zu seinem Sein ist Verhaltens-los nicht zu denken."""
+
+TRANSLATION = """# Being and Time - Translation
+
+**Model:** gpt-4o
+**Started:** 1-2
+
+---
+
+## Paragraph 1
+
+**German:**
+Was wir ontologisch mit dem Titel Befindlichkeit anzeigen, ist ontisch das Bekannteste.
+
+**English:**
+What we indicate ontologically by the term attunement is ontically the most familiar.
+
+---
+
+"""
+
+def test_lookup_returns_kwic_with_each_models_english(tmp_path):
+    text_file = tmp_path / "cleaned_text.md"
+    text_file.write_text(TEXT, encoding='utf-8')
+    translation_file = tmp_path / "full_translation_gpt.md"
+    translation_file.write_text(TRANSLATION, encoding='utf-8')
+    index_file = tmp_path / "concordance_index.json"
+    
+    index, rebuilt = load_or_build(index_file, text_file, [translation_file])
+    assert rebuilt
+    
+    hits = index.lookup("befindlichkeit")
+    assert [(hit.paragraph, hit.keyword) for hit in hits] == [(0, "Befindlichkeit"), (1, "Befindlichkeit")]
+    assert hits[1].left.endswith("mit dem Titel ") and hits[1].right.startswith(" anzeigen")
+    
+    # Prefix match picks up inflected and hyphenated forms
+    assert [hit.keyword for hit in index.lookup("Verhalten")] == ["Verhalten", "Verhaltens-los"]
+    
+    report = format_concordance(index, "Befindlichkeit", hits)
+    assert "**gpt:** What we indicate ontologically by the term attunement" in report
+    assert "**gpt:** (not translated)" in report
+    
+    # Unchanged sources reuse the saved index; a changed translation rebuilds it
+    assert not load_or_build(index_file, text_file, [translation_file])[1]
+    translation_file.write_text(TRANSLATION.replace("attunement", "state-of-mind"), encoding='utf-8')
+    index, rebuilt = load_or_build(index_file, text_file, [translation_file])
+    assert rebuilt and "state-of-mind" in index.english["gpt"][1]
+    assert isinstance(ConcordanceIndex.load(index_file), ConcordanceIndex)
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+
+from pathlib import Path
+
+import pandas as pd
+
+from consistency import check_consistency, load_term_map, model_consistency, parse_conventions, worst_paragraphs
+
+CONVENTIONS = """## Core Philosophical Terms
+
+- **dasein**: Dasein [variants: daseins (12x)] (alt: 1. "Existence, 2. "Being-there - a literal gloss)
+- **sorge**: Care (alt: 1. Concern)
+- **zeit**: **: (alt: 1. Time, 2. Temporality)
+"""
+
+def test_parse_conventions_cleans_renderings_and_forms(tmp_path):
+    conventions_file = tmp_path / "CONVENTIONS.md"
+    conventions_file.write_text(CONVENTIONS, encoding='utf-8')
+    
+    rules = parse_conventions(conventions_file)
+    
+    assert rules["dasein"].forms == ["dasein", "daseins"]
+    assert rules["dasein"].renderings == ["Dasein", "Existence", "Being-there"]
+    assert rules["sorge"].expected == "Care"
+    assert "zeit" not in rules  # no primary rendering chosen yet
+
+def test_generated_conventions_match_only_nouns(tmp_path):
+    conventions = Path("CONVENTIONS.md").read_text(encoding='utf-8')
+    conventions_file = tmp_path / "CONVENTIONS.md"
+    
+    # As generated, no term has a primary rendering, so there is nothing to check
+    conventions_file.write_text(conventions, encoding='utf-8')
+    assert parse_conventions(conventions_file) == {}
+    
+    decided = (conventions.replace("- **sein**: **:", "- **sein**: Being")
+               .replace("- **zeitlichkeit**: **:", "- **zeitlichkeit**: Temporality"))
+    conventions_file.write_text(decided, encoding='utf-8')
+    rules = parse_conventions(conventions_file)
+    assert sorted(rules) == ["sein", "zeitlichkeit"]
+    assert rules["sein"].forms == ["sein", "seins", "seinen"]
+    assert rules["zeitlichkeit"].forms == ["zeitlichkeit"]
+    
+    translations = pd.DataFrame([
+        ("gpt", 1, "Die Frage nach dem Sinn von Sein.", "The question of the meaning of Being."),
+        ("gpt", 2, "Das Dasein versteht sich in seinem Sein.", "Dasein understands itself in its Being."),
+        ("gpt", 3, "Er stellt seine Frage in seiner Weise.", "He asks his question in his way."),
+        ("gpt", 4, "Die zeitlichen Bestimmungen des Seins.", "The temporal determinations of Being."),
+    ], columns=["model", "paragraph", "german", "english"])
+    checks = check_consistency(translations, rules)
+    assert checks[["paragraph", "term", "expected"]].values.tolist() == [
+        [1, "sein", True], [2, "sein", True], [4, "sein", True]]
+
+def test_rates_and_worst_paragraphs(tmp_path):
+    term_map = tmp_path / "terms.yaml"
+    term_map.write_text("sorge: [Care, Concern]\ndasein:\n  renderings: Dasein\n  forms: [dasein, daseins]\n",
+                        encoding='utf-8')
+    rules = load_term_map(term_map)
+    
+    translations = pd.DataFrame([
+        ("gpt", 1, "Die Sorge des Daseins", "The care of Dasein"),
+        ("gpt", 2, "Sorge", "Concern"),
+        ("claude", 1, "Die Sorge des Daseins", "The concern of existence"),
+        ("claude", 3, "Nichts", "Nothing"),
+    ], columns=["model", "paragraph", "german", "english"])
+    
+    checks = check_consistency(translations, rules)
+    assert len(checks) == 5
+    
+    rates = model_consistency(checks)
+    assert rates.loc["gpt", "consistency"] == 2 / 3
+    assert rates.loc["gpt", "accepted"] == 1.0
+    assert rates.loc["claude", "consistency"] == 0.0
+    
+    worst = worst_paragraphs(checks)
+    assert worst.iloc[0]["paragraph"] == 1
+    assert worst.iloc[0]["misses"] == 2
+    assert worst.iloc[0]["checks"] == 4
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+
+import asyncio
+import json
+from collections import Counter
+
+from langchain_core.exceptions import OutputParserException
+from langchain_core.runnables import RunnableLambda
+
+from critique import CritiqueStore, consensus, run_bulk_critiques, run_sequential_critiques
+from meta_analysis import MetaCommentary
+
+with open("passages_75-80.json", 'r', encoding='utf-8') as f:
+    MODELS = json.load(f)["models"]
+
+def fake_chain(critic_model, failing=(), malformed=()):
+    def critique(inputs):
+        paragraph_number = int(inputs["critique_prompt"].split("(Paragraph ")[1].split(")")[0])
+        if paragraph_number in failing:
+            raise RuntimeError("rate limited")
+        if paragraph_number in malformed:
+            raise OutputParserException("Invalid json output")
+        return MetaCommentary(critic_model=critic_model, paragraph_number=paragraph_number,
+                              best_translation="Claude", reasoning="", thinking="", overall_insights="")
+    return RunnableLambda(critique)
+
+def test_bulk_run_records_every_pair_and_resumes_failures(tmp_path):
+    store = CritiqueStore(tmp_path / "critiques.jsonl")
+    critics = ["gpt-4o-mini", "grok-3-mini"]
+    chains = {"gpt-4o-mini": fake_chain("gpt-4o-mini", malformed={77}),
+              "grok-3-mini": fake_chain("grok-3-mini", failing={76})}
+    
+    outcomes = asyncio.run(run_bulk_critiques(MODELS, [75, 76, 77], critics, store, chains=chains))
+    assert sorted((o.critic_model, o.paragraph_number, o.status) for o in outcomes) == [
+        ("gpt-4o-mini", 75, "ok"), ("gpt-4o-mini", 76, "ok"), ("gpt-4o-mini", 77, "parse_error"),
+        ("grok-3-mini", 75, "ok"), ("grok-3-mini", 76, "error"), ("grok-3-mini", 77, "ok"),
+    ]
+    
+    # Reloaded from disk, only the failed pairs are retried
+    store = CritiqueStore(tmp_path / "critiques.jsonl")
+    chains = {critic: fake_chain(critic) for critic in critics}
+    outcomes = asyncio.run(run_bulk_critiques(MODELS, [75, 76, 77], critics, store, chains=chains))
+    assert sorted((o.critic_model, o.paragraph_number) for o in outcomes if o.status != "skipped") == [
+        ("gpt-4o-mini", 77), ("grok-3-mini", 76)]
+    
+    records = CritiqueStore(tmp_path / "critiques.jsonl").successful(76)
+    assert [r["critic_model"] for r in records] == critics
+    assert records[1]["meta_commentary"]["best_translation"] == "Claude"
+
+def test_early_stop_skips_critics_once_majority_is_locked(tmp_path):
+    store = CritiqueStore(tmp_path / "critiques.jsonl")
+    critics = ["gpt-4o-mini", "claude-3-5-haiku-latest", "gemini-2.5-flash"]
+    chains = {critic: fake_chain(critic) for critic in critics}
+    
+    outcomes, results = asyncio.run(run_sequential_critiques(MODELS, [75, 77], critics, store, chains=chains))
+    
+    # Two of three votes for Claude settle it; the third critic is never asked
+    assert [(r.paragraph_number, r.winner, r.reason, r.calls, r.calls_saved) for r in results] == [
+        (75, "claude", "majority", 2, 1), (77, "claude", "majority", 2, 1)]
+    assert all(r.tokens_saved > 0 for r in results)
+    assert sorted(o.critic_model for o in outcomes if o.status == "early_stopped") == ["gemini-2.5-flash"] * 2
+    
+    # Resuming without early stopping fills in only the skipped critic
+    outcomes = asyncio.run(run_bulk_critiques(MODELS, [75, 77], critics, store, chains=chains))
+    assert [o.critic_model for o in outcomes if o.status == "ok"] == ["gemini-2.5-flash"] * 2
+
+def test_consensus_by_score_margin():
+    votes = Counter({"claude": 1, "gpt": 1})
+    scores = {"claude": [9, 9], "gpt": [7, 6], "grok": [5, 6]}
+    
+    assert consensus(votes, scores, n_critics=4) is None
+    assert consensus(votes, scores, n_critics=4, score_margin=3.0) is None
+    assert consensus(votes, scores, n_critics=4, score_margin=2.5) == ("claude", "score_margin")
+    assert consensus(Counter({"gpt": 3}), scores, n_critics=4) == ("gpt", "majority")
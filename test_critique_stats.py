@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+
+import numpy as np
+
+from critique_stats import CritiqueScores, critic_agreement, model_means, rank_models, self_preference, vote_agreement
+
+MODELS = ["gpt", "claude"]
+
+def record(critic, paragraph, accuracy, accessibility=None, best=None):
+    critiques = {f"{model.upper()} Translation": {"philosophical_accuracy_score": score}
+                 for model, score in zip(MODELS, accuracy)}
+    for model, score in zip(MODELS, accessibility or []):
+        critiques[f"{model.upper()} Translation"]["accessibility_score"] = score
+    return {"critic_model": critic, "paragraph_number": paragraph,
+            "meta_commentary": {"critiques": critiques, "best_translation": best}}
+
+def test_tensor_and_model_means():
+    scores = CritiqueScores(models=MODELS)
+    scores.extend([
+        record("gpt-4o-mini", 1, [8, 6], [7, 9], "GPT"),
+        record("claude-3-5-haiku-latest", 1, [7, 9], best="CLAUDE"),
+        record("gpt-4o-mini", 2, [9, 5], [8, 6]),
+    ])
+
+    assert scores.tensor.shape == (2, 2, 2, 2)
+    assert np.isnan(scores.tensor[1, 0, 1, 0])  # claude did not critique paragraph 2
+
+    means = model_means(scores)
+    assert means.loc["gpt", "philosophical_accuracy_score_mean"] == 8.0
+    assert means.loc["gpt", "philosophical_accuracy_score_n"] == 3
+    assert means.loc["claude", "accessibility_score_mean"] == 7.5
+    assert means.loc["claude", "accessibility_score_n"] == 2
+    # 95% CI half-width with t(2) = 4.303 and sd = 1
+    assert abs(means.loc["gpt", "philosophical_accuracy_score_ci"] - 4.303 / np.sqrt(3)) < 1e-9
+
+    ranking = rank_models(scores)
+    assert list(ranking.index) == ["gpt", "claude"]
+    assert list(ranking["votes"]) == [1, 1]
+
+def test_adding_a_critique_updates_the_ranking():
+    scores = CritiqueScores(models=MODELS)
+    scores.add(record("gpt-4o-mini", 1, [8, 7]))
+    assert rank_models(scores).index[0] == "gpt"
+
+    scores.add(record("grok-3-mini", 1, [2, 9]))
+    assert rank_models(scores).index[0] == "claude"
+
+def test_later_critiques_of_a_cell_win():
+    scores = CritiqueScores(models=MODELS)
+    scores.extend([record("gpt-4o-mini", 1, [3, 4])] * 200 + [record("gpt-4o-mini", 1, [8, 7])])
+    assert scores.tensor[0, :, 0, 0].tolist() == [8.0, 7.0]
+
+    scores.add(record("gpt-4o-mini", 1, [5, 6]))
+    assert scores.tensor[0, :, 0, 0].tolist() == [5.0, 6.0]
+
+def test_agreement_and_self_preference():
+    scores = CritiqueScores(models=MODELS)
+    for paragraph, (a, b) in enumerate([(8, 6), (7, 5), (9, 8), (6, 4)]):
+        scores.add(record("gpt-4o-mini", paragraph, [a + 2, b], best="GPT"))
+        scores.add(record("claude-3-5-haiku-latest", paragraph, [a, b + 1], best="GPT"))
+
+    agreement = critic_agreement(scores)
+    assert agreement.loc["gpt-4o-mini", "claude-3-5-haiku-latest"] > 0.5
+    assert vote_agreement(scores) == 1.0
+
+    bias = self_preference(scores).set_index("critic")
+    assert bias.loc["gpt-4o-mini", "own_model"] == "gpt"
+    assert bias.loc["gpt-4o-mini", "bias"] == 2.0
+    assert bias.loc["claude-3-5-haiku-latest", "bias"] == 1.0
+    assert bias.loc["claude-3-5-haiku-latest", "paragraphs"] == 4
+
+def test_models_inferred_from_labels():
+    scores = CritiqueScores()
+    scores.add({"critic_model": "gemini-2.5-flash", "paragraph_number": 3,
+                "meta_commentary": {"critiques": {"GROK": {"philosophical_accuracy_score": 7},
+                                                  "Gemini Translation": {"accessibility_score": 8}},
+                                    "best_translation": "GROK"}})
+    assert scores.model_names == ["grok", "gemini"]
+    assert rank_models(scores).loc["grok", "votes"] == 1
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+
+import random
+
+from divergence import chrf_similarity, ngram_profile, score_paragraphs, select_for_critique
+
+def test_similarity_is_symmetric_and_bounded():
+    a = ngram_profile("Being-in-the-world is a unitary phenomenon.")
+    b = ngram_profile("Being-in-the-World is a  unified phenomenon.")
+    c = ngram_profile("Qxz vwy")
+    
+    assert chrf_similarity(a, a) == 1.0
+    assert chrf_similarity(a, b) == chrf_similarity(b, a)
+    assert 0.5 < chrf_similarity(a, b) < 1.0
+    assert chrf_similarity(a, c) < 0.1
+
+def test_hashed_overlap_matches_exact_ngram_counts():
+    random.seed(3)
+    words = ["Sein", "Dasein", "Welt", "Sorge", "Zeit", "care", "world", "being"]
+    a = " ".join(random.choices(words, k=40))
+    b = " ".join(random.choices(words, k=35))
+    
+    def exact(x, y):
+        x, y = "".join(x.lower().split()), "".join(y.lower().split())
+        precisions, recalls = [], []
+        for n in range(1, 7):
+            gx = [x[i:i + n] for i in range(len(x) - n + 1)]
+            gy = [y[i:i + n] for i in range(len(y) - n + 1)]
+            overlap = sum(min(gx.count(g), gy.count(g)) for g in set(gx))
+            precisions.append(overlap / len(gx))
+            recalls.append(overlap / len(gy))
+        p, r = sum(precisions) / 6, sum(recalls) / 6
+        return 2 * p * r / (p + r)
+    
+    assert abs(chrf_similarity(ngram_profile(a), ngram_profile(b)) - exact(a, b)) < 1e-12
+
+def test_paragraphs_ranked_by_divergence():
+    english = {
+        "gpt": {1: "Care is the being of Dasein.", 2: "The world is worldly.", 3: "Only one model."},
+        "claude": {1: "Care is the Being of Dasein.", 2: "Anxiety discloses nothing at all."},
+        "gemini": {1: "Care is the being of Dasein!", 2: "The world worlds."},
+    }
+    
+    divergences = score_paragraphs(english)
+    
+    assert [d.paragraph for d in divergences] == [2, 1]
+    assert divergences[0].outlier == "claude"
+    assert select_for_critique(divergences, top=1) == [2]
+    assert select_for_critique(divergences, min_divergence=0.0) == [1, 2]
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+
+import pytest
+
+pytest.importorskip("spacy")
+
+from lemmatizer import SpacyLemmatizer
+
+PARAGRAPHS = [
+    "Die Befindlichkeiten des Daseins sind ursprünglich erschlossen.",
+    "Das Dasein ist in seiner Befindlichkeit immer schon vor sich gebracht.",
+]
+
+class CountingLemmatizer(SpacyLemmatizer):
+    piped = 0
+    
+    def _lemmatize_docs(self, paragraphs):
+        CountingLemmatizer.piped += len(paragraphs)
+        return super()._lemmatize_docs(paragraphs)
+
+def test_lemmas_are_cached_per_paragraph(tmp_path):
+    cache_file = tmp_path / "lemma_cache.json"
+    try:
+        lemmas = CountingLemmatizer(batch_size=1, cache_file=cache_file).lemma_map(PARAGRAPHS)
+    except (ImportError, ValueError) as e:  # no German model and no spacy-lookups-data
+        pytest.skip(str(e))
+    
+    assert lemmas["befindlichkeiten"] == lemmas["befindlichkeit"] == "befindlichkeit"
+    assert lemmas["daseins"] == "dasein"
+    assert CountingLemmatizer.piped == 2
+    
+    again = CountingLemmatizer(cache_file=cache_file).lemma_map(PARAGRAPHS + ["Die Befindlichkeit ist Stimmung."])
+    assert again["befindlichkeit"] == "befindlichkeit"
+    assert CountingLemmatizer.piped == 3
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+
+import argparse
+import logging
+
+import driver
+from chunker import TextChunker
+from paragraph_ids import build_remap, changed_paragraphs
+from translator import PhilosophicalTranslation
+
+GERMAN = [f"Absatz Nummer {i} über das Sein." for i in range(6)]
+
+def translation(german_paragraphs):
+    blocks = "".join(f"## Paragraph {i}\n\n**German:**\n{german}\n\n**English:**\nParagraph {i} on Being.\n\n---\n\n"
+                     for i, german in enumerate(german_paragraphs))
+    return "# Being and Time - Translation\n\n**Model:** gpt-4o\n**Started:** 0-5\n\n---\n\n" + blocks
+
+def write(tmp_path, text_paragraphs):
+    text_file = tmp_path / "cleaned_text.md"
+    text_file.write_text("\n\n".join(text_paragraphs), encoding='utf-8')
+    translation_file = tmp_path / "full_translation_gpt.md"
+    translation_file.write_text(translation(GERMAN), encoding='utf-8')
+    return text_file, translation_file
+
+def test_changed_ends_of_the_span_are_retranslated(tmp_path):
+    edited = [GERMAN[0] + " Geändert."] + GERMAN[1:5] + [GERMAN[5] + " Geändert."]
+    text_file, translation_file = write(tmp_path, edited)
+
+    remap = build_remap(translation_file, TextChunker(text_file))
+    assert remap.mapping == {0: None, 1: 1, 2: 2, 3: 3, 4: 4, 5: None}
+    assert remap.dropped == [0, 5]
+    assert remap.changed == [0, 5]
+
+def test_changed_paragraphs_follow_moves():
+    # A paragraph inserted before the span shifts it by one; the interior and last paragraphs changed
+    mapping = {0: 1, 1: 2, 2: None, 3: 4, 4: None}
+    assert changed_paragraphs(mapping, new_count=6) == [3, 5]
+    # A changed run at the start ends just before the first match
+    assert changed_paragraphs({0: None, 1: None, 2: 3}, new_count=4) == [1, 2]
+    # Nothing matched: the old numbers, clamped to the new text
+    assert changed_paragraphs({0: None, 1: None, 2: None}, new_count=2) == [0, 1]
+
+def test_retranslate_rewrite_keeps_every_paragraph(tmp_path, monkeypatch):
+    edited = [GERMAN[0] + " Geändert."] + GERMAN[1:5] + [GERMAN[5] + " Geändert."]
+    text_file, translation_file = write(tmp_path, edited)
+
+    class FakeTranslator:
+        def __init__(self, model_name):
+            pass
+
+        def translate_paragraph(self, context, config):
+            return PhilosophicalTranslation(translation=f"New: {context.current_german}", thinking="")
+
+    monkeypatch.setattr(driver, "Translator", FakeTranslator)
+    args = argparse.Namespace(input=text_file, output=translation_file, start=0, end=-1,
+                              model="gpt-4o", context_size=2, mmap=False)
+    driver.retranslate_changed_mode(args, logging.getLogger(__name__))
+
+    rewritten = translation_file.read_text(encoding='utf-8')
+    assert [line for line in rewritten.splitlines() if line.startswith("## Paragraph")] == [
+        f"## Paragraph {i}" for i in range(6)]
+    assert f"New: {edited[0]}" in rewritten and f"New: {edited[5]}" in rewritten
+    assert rewritten.count("on Being.") == 4
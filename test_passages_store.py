@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+
+import json
+
+import pytest
+
+from passages_store import MANIFEST, PassageStore, PassageWriter
+
+with open("passages_75-80.json", 'r', encoding='utf-8') as f:
+    PASSAGES = json.load(f)
+
+def write(output, shard_size=None):
+    metadata = {"paragraph_range": "75-80", "paragraph_numbers": PASSAGES["paragraph_numbers"]}
+    with PassageWriter(output, PASSAGES["paragraph_numbers"], metadata, shard_size) as writer:
+        for model, model_data in PASSAGES["models"].items():
+            for number, data in model_data.items():
+                writer.write(model, int(number), data)
+        writer.write_error("broken", "could not parse")
+
+@pytest.mark.parametrize("name,shard_size", [("passages.json", None), ("passages.jsonl", None), ("shards", 2)])
+def test_formats_round_trip(tmp_path, name, shard_size):
+    output = tmp_path / name
+    write(output, shard_size)
+
+    store = PassageStore(output)
+    assert store.paragraph_numbers == [75, 76, 77, 78, 79, 80]
+    assert store.header["paragraph_range"] == "75-80"
+
+    models = store.models()
+    assert models.pop("broken") == {"error": "could not parse"}
+    assert models == PASSAGES["models"]
+
+    only_77 = store.models([77])
+    assert {model: list(data) for model, data in only_77.items() if model != "broken"} == \
+        {model: ["77"] for model in PASSAGES["models"]}
+    assert only_77["claude"]["77"] == PASSAGES["models"]["claude"]["77"]
+
+def test_sharded_reads_skip_other_shards(tmp_path):
+    output = tmp_path / "shards"
+    write(output, shard_size=2)
+
+    with open(output / MANIFEST, 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+    assert [(s["first"], s["last"]) for s in manifest["shards"]] == [(75, 76), (77, 78), (79, 80)]
+
+    # A damaged shard outside the requested range is never opened
+    (output / manifest["shards"][0]["file"]).write_text("not json\n{\"model\": \"x\", \"paragraph\": 75, ", encoding='utf-8')
+    assert PassageStore(output).models([79])["gpt"] == {"79": PASSAGES["models"]["gpt"]["79"]}
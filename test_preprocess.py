@@ -1,7 +1,35 @@
 #!/usr/bin/env python3
 
+import random
 import re
-from preprocess import remove_footnotes, rejoin_split_text
+from pathlib import Path
+
+import pytest
+
+from preprocess import (remove_footnotes, rejoin_split_text, clean_djvu_text, clean_djvu_stream,
+                        clean_djvu_text_fused, clean_djvu_directory, load_manifest_entries,
+                        write_manifest, clean_djvu_text_cached, fix_hyphenation, CLEANING_STAGES,
+                        Stage, extract_footnotes)
+
+DJVU_FILE = Path(__file__).parent / "sein_und_zeit_djvu.txt"
+
+# Small alphabet of OCR features: words, page numbers, footnotes, soft hyphens, § headings
+FUZZ_ALPHABET = ['a', 'b', 'Ä', ' ', '  ', '\n', '\n\n', '\t', '1', '2', '12 ', '¬', '§ 3.', '§',
+                 '.', '\n1 foot note\n', '\n\n200 \n\n', '\r']
+
+def load_djvu_text():
+    """Full DJVU source, or skip when it is missing or still git-crypt encrypted."""
+    if not DJVU_FILE.exists() or DJVU_FILE.read_bytes()[:9] == b'\x00GITCRYPT':
+        pytest.skip("sein_und_zeit_djvu.txt not available (git-crypt locked?)")
+    return DJVU_FILE.read_text(encoding='utf-8')
+
+def fuzz_texts(seed, count=2000, max_tokens=40):
+    rng = random.Random(seed)
+    for _ in range(count):
+        yield ''.join(rng.choice(FUZZ_ALPHABET) for _ in range(rng.randint(0, max_tokens)))
+
+def chunked(text, size):
+    return [text[i:i + size] for i in range(0, len(text), size)]
 
 def test_case():
     # Your exact example
@@ -43,5 +71,73 @@ anschauliche Daseinsauslegung bewegt, mag sie das Dasein als
 »Lebenssorge« und Not oder gegenteilig verstehen."""
     print(expected)
     
+def test_stream_matches_batch_on_fuzzed_text():
+    for text in fuzz_texts(seed=30):
+        expected = clean_djvu_text(text)
+        for size in (1, 3, 17):
+            assert ''.join(clean_djvu_stream(chunked(text, size))) == expected, repr(text)
+
+def test_stream_matches_batch_on_full_text():
+    text = load_djvu_text()
+    expected = clean_djvu_text(text)
+    assert ''.join(clean_djvu_stream(chunked(text, 4096))) == expected
+
+def test_fused_matches_staged_on_fuzzed_text():
+    for text in fuzz_texts(seed=31, count=3000):
+        assert clean_djvu_text_fused(text) == clean_djvu_text(text), repr(text)
+
+def test_fused_matches_staged_on_full_text():
+    text = load_djvu_text()
+    assert clean_djvu_text_fused(text) == clean_djvu_text(text)
+
+def test_directory_mode_cleans_and_skips_up_to_date(tmp_path):
+    source = "Sein und\n\n12 \n\nZeit. Text\n1 foot note\n§ 3. Die Frage"
+    (tmp_path / "in" / "vol2").mkdir(parents=True)
+    (tmp_path / "in" / "vol1.txt").write_text(source, encoding='utf-8')
+    (tmp_path / "in" / "vol2" / "part.txt").write_text(source * 2, encoding='utf-8')
+    
+    entries = clean_djvu_directory(tmp_path / "in", tmp_path / "out", workers=2)
+    assert [e["status"] for e in entries] == ["cleaned", "cleaned"]
+    assert (tmp_path / "out" / "vol1.md").read_text(encoding='utf-8') == clean_djvu_text(source)
+    assert entries[0]["footnotes_removed"] == 1
+    
+    manifest = write_manifest(entries, tmp_path / "manifest.json", 0.0)
+    previous = load_manifest_entries(tmp_path / "manifest.json")
+    rerun = clean_djvu_directory(tmp_path / "in", tmp_path / "out", workers=2, previous=previous)
+    assert [e["status"] for e in rerun] == ["skipped", "skipped"]
+    assert rerun[1]["output_chars"] == manifest["files"][1]["output_chars"]
+
+def test_cached_pipeline_recomputes_from_first_changed_stage(tmp_path):
+    source = "Erster Absatz\n\n12 \n\nweiter¬\ngehend.\n\n\n§ 3. Die Frage\n\nLetzter  Absatz"
+    text, reports = clean_djvu_text_cached(source, tmp_path)
+    assert text == clean_djvu_text(source)
+    assert not any(r.cached for r in reports)
+    
+    _, reports = clean_djvu_text_cached(source, tmp_path)
+    assert all(r.cached for r in reports)
+    
+    # Changing the hyphenation rule reuses the first two stages and diffs the rest
+    stages = list(CLEANING_STAGES)
+    stages[2] = Stage("fix_hyphenation", 2, lambda t: fix_hyphenation(t).replace("weitergehend", "weiter gehend"))
+    text, reports = clean_djvu_text_cached(source, tmp_path, stages=stages)
+    assert [r.cached for r in reports] == [True, True, False, False, False]
+    assert "weiter gehend" in text
+    assert reports[2].compared and len(reports[2].changed_paragraphs) == 1
+    assert reports[-1].changed_paragraphs == [0]  # page break joined the first two paragraphs
+
+def test_extract_footnotes_body_matches_remove_footnotes():
+    for text in fuzz_texts(seed=34):
+        assert extract_footnotes(text)[0] == remove_footnotes(text), repr(text)
+
+def test_endnotes_are_keyed_by_page_and_linked():
+    text = ("Die Sorge. 1 Und weiter, der Mensch: 2 ist.\n\n1 a. a. O. S. 49.\n2 Vgl. Aristoteles.\n\n200 \n\n"
+            "Neue Seite. 1 Text\n1 Kant, KrV.\n201 \n")
+    _, table = extract_footnotes(text)
+    assert [(page, [n.number for n in notes]) for page, notes in table.items()] == [(200, [1, 2]), (201, [1])]
+    
+    cleaned = clean_djvu_text(text, endnotes=True)
+    assert cleaned.startswith("Die Sorge.[^1] Und weiter, der Mensch:[^2] ist. Neue Seite.[^3] Text")
+    assert cleaned.endswith("## Endnotes\n\n[^1]: a. a. O. S. 49.\n\n[^2]: Vgl. Aristoteles.\n\n[^3]: Kant, KrV.")
+
 if __name__ == "__main__":
     test_case()
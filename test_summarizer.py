@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+
+from langchain_core.runnables import RunnableLambda
+
+from summarizer import MapReduceSummarizer, split_sections
+
+ANALYSIS = """# Analysis of Paragraph 77
+
+*Generated on 2026-01-01 10:00:00*
+
+## German Original
+
+Das Sein des Seienden.
+
+## The AI Philosophical Debate
+
+### GPT's Analysis
+
+GPT preferred the Claude translation.
+
+### CLAUDE's Analysis
+
+Claude preferred its own translation.
+"""
+
+def recording_chain(calls, prefix):
+    def summarize(inputs):
+        calls.append(inputs["prompt"])
+        return f"{prefix} {len(calls)}"
+    return RunnableLambda(summarize)
+
+def test_split_sections_by_heading_and_size():
+    titles = [s.title for s in split_sections(ANALYSIS)]
+    # The title and timestamp alone make no section
+    assert titles == ["German Original", "The AI Philosophical Debate"]
+    assert not any("Generated on" in s.text for s in split_sections(ANALYSIS))
+
+    # The heading-only "## The AI Philosophical Debate" part is dropped
+    small = split_sections(ANALYSIS, max_chars=60)
+    assert [s.title for s in small][1:] == ["The AI Philosophical Debate / GPT's Analysis",
+                                            "The AI Philosophical Debate / CLAUDE's Analysis"]
+    assert all(s.text for s in small)
+
+def test_analysis_that_fits_takes_one_call():
+    with open("final_analysis_paragraph_77.md", 'r', encoding='utf-8') as f:
+        analysis = f.read()
+    titles = [s.title for s in split_sections(analysis)]
+    assert "Four AI Translations" not in titles and "Four AI Translations / GPT Translation" in titles
+    
+    map_calls, reduce_calls = [], []
+    summarizer = MapReduceSummarizer(map_chain=recording_chain(map_calls, "section"),
+                                     reduce_chain=recording_chain(reduce_calls, "conclusion"))
+    assert summarizer.summarize(analysis, "- 4 models") == "conclusion 1"
+    assert (summarizer.calls, map_calls) == (1, [])
+    assert "FULL ANALYSIS:\n# Four Minds on Being" in reduce_calls[0]
+
+def test_only_changed_sections_are_resummarized(tmp_path):
+    cache_file = tmp_path / "summary_cache.json"
+    map_calls, reduce_calls = [], []
+
+    def summarizer():
+        return MapReduceSummarizer(cache_file=cache_file, map_chain=recording_chain(map_calls, "section"),
+                                   reduce_chain=recording_chain(reduce_calls, "conclusion"), max_reduce_chars=100)
+
+    first = summarizer()
+    assert first.summarize(ANALYSIS, "- 2 models") == "conclusion 1"
+    assert len(map_calls) == 2 and "SECTION SUMMARIES" in reduce_calls[0]
+
+    # A new timestamp alone costs nothing
+    second = summarizer()
+    second.summarize(ANALYSIS.replace("10:00:00", "11:00:00"), "- 2 models")
+    assert (second.calls, second.cached) == (0, 3)
+
+    third = summarizer()
+    third.summarize(ANALYSIS.replace("Das Sein", "Das Nichts"), "- 2 models")
+    assert third.calls == 2  # the changed section and the conclusion
+    assert "Das Nichts" in map_calls[-1]
+
+def test_oversized_summaries_are_reduced_in_groups():
+    map_calls, reduce_calls = [], []
+    analysis = "\n\n".join(f"## Paragraph {n}\n\nText of paragraph {n}." for n in range(12))
+    summarizer = MapReduceSummarizer(map_chain=recording_chain(map_calls, "summary " + "x" * 50),
+                                     reduce_chain=recording_chain(reduce_calls, "conclusion"),
+                                     max_reduce_chars=300)
+    summarizer.summarize(analysis, "")
+
+    assert len(map_calls) > 12  # section summaries, then group summaries
+    assert len(reduce_calls) == 1
+    summaries = reduce_calls[0].split("SECTION SUMMARIES:\n")[1].split("\n\nWrite a final section")[0]
+    assert len(summaries) <= 300
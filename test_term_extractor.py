@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+
+import asyncio
+import json
+from dataclasses import asdict
+
+import pytest
+from langchain_core.exceptions import OutputParserException
+from langchain_core.runnables import RunnableLambda
+
+import term_extractor
+import term_tfidf
+from term_index import build_term_index
+from term_extractor import (PhilosophicalTerm, TermAnalysis, TermAnalysisCache, TermAnalysisParseError,
+                            TermExtractor)
+
+TEXT = """## § 2. Die formale Struktur der Frage nach dem Sein
+
+Das Dasein ist ein Seiendes, das sich in seinem Sein zu diesem Sein verhält. Die Zuhandenheit des Zeugs.
+
+Die Zuhandenheit des Zeugs und die Zeitlichkeit des Daseins bleiben verdeckt. Dem Dasein ist die Zeitlichkeit.
+
+Zeitlichkeit und Zuhandenheit: das Sein des Daseins."""
+
+ANALYSIS = TermAnalysis(philosophical_importance=9, is_core_concept=True, translation_challenges="Hyphenation",
+                        suggested_renderings=["readiness-to-hand"], contextual_variations="None")
+
+class StubTranslator:
+    def __init__(self, model_name):
+        self.model_name = model_name
+
+@pytest.fixture
+def extractor(tmp_path, monkeypatch):
+    monkeypatch.setattr(term_extractor, "Translator", StubTranslator)
+    text_file = tmp_path / "cleaned.md"
+    text_file.write_text(TEXT, encoding='utf-8')
+    return TermExtractor(text_file)
+
+def term(canonical_form, contexts=("Die Zuhandenheit des Zeugs.",)):
+    return PhilosophicalTerm(canonical_form=canonical_form, stem=canonical_form.lower(), total_frequency=1,
+                             morphological_forms={canonical_form: 1}, contexts=list(contexts))
+
+def test_unwrap_analysis():
+    assert TermExtractor._unwrap_analysis(ANALYSIS) is ANALYSIS
+    assert TermExtractor._unwrap_analysis({"raw": None, "parsed": ANALYSIS, "parsing_error": None}) is ANALYSIS
+    with pytest.raises(TermAnalysisParseError, match="bad JSON"):
+        TermExtractor._unwrap_analysis({"raw": None, "parsed": None, "parsing_error": "bad JSON"})
+    with pytest.raises(TermAnalysisParseError, match="no parsed output"):
+        TermExtractor._unwrap_analysis({"raw": None, "parsed": None, "parsing_error": None})
+    with pytest.raises(TermAnalysisParseError, match="str"):
+        TermExtractor._unwrap_analysis("not an analysis")
+
+def test_analysis_outcomes(extractor, monkeypatch):
+    def analyze(inputs):
+        prompt = inputs["term_prompt"]
+        if '"Zuhandenheit"' in prompt:
+            return {"raw": None, "parsed": ANALYSIS, "parsing_error": None}
+        if '"Zeitlichkeit"' in prompt:
+            raise OutputParserException("Invalid json output")
+        if '"Sorge"' in prompt:
+            return {"raw": None, "parsed": None, "parsing_error": "missing field"}
+        raise RuntimeError("rate limited")
+    monkeypatch.setattr(extractor, "_term_analysis_chain", lambda: RunnableLambda(analyze))
+    
+    terms = [term("Zuhandenheit"), term("Zeitlichkeit"), term("Sorge"), term("Angst")]
+    outcomes = asyncio.run(extractor.analyze_terms_async(terms, concurrency=2))
+    assert [(o.term, o.status) for o in outcomes] == [
+        ("Zuhandenheit", "ok"), ("Zeitlichkeit", "parse_error"), ("Sorge", "parse_error"), ("Angst", "error")]
+    assert outcomes[3].error == "rate limited"
+    assert terms[0].philosophical_importance == 9 and terms[1].philosophical_importance is None
+
+def analyzed(canonical_form, contexts=("Die Zuhandenheit des Zeugs.",)):
+    return ANALYSIS.apply_to(term(canonical_form, contexts))
+
+def test_cache_put_apply_and_save(tmp_path):
+    cache = TermAnalysisCache(tmp_path / "term_cache.json")
+    cache.put("gpt-4o", analyzed("Zuhandenheit"))
+    cache.save()
+    
+    cache = TermAnalysisCache(tmp_path / "term_cache.json")
+    fresh = term("Zuhandenheit")
+    assert cache.apply("gpt-4o", fresh) and cache.hits == 1
+    assert fresh.suggested_renderings == ["readiness-to-hand"] and fresh.philosophical_importance == 9
+    assert not cache.apply("claude-sonnet-4", term("Zuhandenheit"))
+    assert not cache.apply("gpt-4o", term("Zeitlichkeit"))
+
+def test_cache_key_follows_contexts_and_prompt(tmp_path, monkeypatch):
+    cache = TermAnalysisCache(tmp_path / "term_cache.json")
+    cache.put("gpt-4o", analyzed("Zuhandenheit"))
+    
+    assert not cache.apply("gpt-4o", term("Zuhandenheit", contexts=["Die Zuhandenheit des Hammers."]))
+    assert cache.apply("gpt-4o", term("Zuhandenheit"))
+    
+    monkeypatch.setattr(term_extractor, "TERM_PROMPT", term_extractor.TERM_PROMPT + "\nAnswer in German.")
+    assert not cache.apply("gpt-4o", term("Zuhandenheit"))
+
+def test_cache_imports_analysis_files(tmp_path):
+    analysis_file = tmp_path / "term_analysis.json"
+    terms = [asdict(analyzed("Zuhandenheit")), asdict(term("Zeitlichkeit"))]  # the second was never analyzed
+    analysis_file.write_text(json.dumps({"metadata": {"model": "gpt-4o"}, "terms": terms}), encoding='utf-8')
+    
+    cache = TermAnalysisCache(tmp_path / "term_cache.json")
+    assert cache.import_analysis(analysis_file) == 1
+    assert cache.import_analysis(analysis_file) == 0  # already cached
+    assert cache.apply("gpt-4o", term("Zuhandenheit"))
+    
+    # Files without a model cannot be keyed
+    analysis_file.write_text(json.dumps({"metadata": {}, "terms": terms}), encoding='utf-8')
+    assert TermAnalysisCache(tmp_path / "other_cache.json").import_analysis(analysis_file) == 0
+
+class CapitalizingLemmatizer:
+    """Lemmas that differ from every Snowball stem."""
+    def lemma_map(self, paragraphs):
+        return {"daseins": "Dasein", "seinem": "Sein", "sein": "Sein", "dasein": "Dasein",
+                "zuhandenheit": "Zuhandenheit", "zeitlichkeit": "Zeitlichkeit"}
+
+def test_term_index_uses_the_clustering_normalizer(extractor):
+    extractor.lemmatizer = CapitalizingLemmatizer()
+    terms = extractor.extract_and_cluster_terms()
+    assert sorted(terms) == ["Dasein", "Sein", "Zeitlichkeit", "Zuhandenheit"]
+    
+    index = build_term_index(extractor.chunker, stem=extractor.normalize)
+    for stem, term in terms.items():
+        assert sorted(index.stems[stem]) == sorted(term.morphological_forms)
+    assert index.paragraphs("Daseinsanalyse", stem=extractor.normalize) == []
+
+def test_tfidf_priority_uses_lemmas(extractor, monkeypatch):
+    extractor.lemmatizer = CapitalizingLemmatizer()
+    terms = extractor.extract_and_cluster_terms()
+    
+    scores = {}
+    def recording_scores(*args, **kwargs):
+        scores.update(section_tfidf_scores(*args, **kwargs))
+        return scores
+    section_tfidf_scores = term_tfidf.section_tfidf_scores
+    monkeypatch.setattr(term_tfidf, "section_tfidf_scores", recording_scores)
+    
+    top = extractor.prioritize_terms(terms, top_n=4, scorer="tfidf")
+    assert sorted(term.stem for term in top) == sorted(terms)
+    assert all(scores.get(term.stem, 0.0) > 0 for term in top)
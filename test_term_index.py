@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+
+from chunker import TextChunker
+from term_index import TermIndex, build_term_index
+
+TEXT = """## § 12. Die Vorzeichnung des In-der-Welt-seins
+
+Das Dasein ist ein Seiendes, das sich in seinem Sein zu diesem Sein verhält.
+
+Kurz.
+
+Die Zuhandenheit des Zeugs und die Zeitlichkeit des Daseins bleiben verdeckt."""
+
+def crude_stem(term):
+    return term[:6]
+
+def test_index_locates_forms_and_stems(tmp_path):
+    text_file = tmp_path / "cleaned.md"
+    text_file.write_text(TEXT, encoding='utf-8')
+    chunker = TextChunker(text_file)
+    
+    index = build_term_index(chunker, stem=crude_stem)
+    
+    # Paragraph numbers follow TextChunker (the short paragraph is skipped there too)
+    assert index.paragraphs("Zuhandenheit", stem=crude_stem) == [2]
+    paragraph, start, end = index.locations("zuhandenheit", stem=crude_stem)[0]
+    assert chunker.get_paragraph(paragraph)[start:end] == "Zuhandenheit"
+    
+    # Unknown surface forms fall back to every form with the same stem
+    assert index.paragraphs("Daseinsanalyse", stem=crude_stem) == [1, 2]
+    
+    index.save(tmp_path / "term_index.json")
+    loaded = TermIndex.load(tmp_path / "term_index.json")
+    assert loaded.forms == index.forms
+    assert loaded.is_current(chunker)
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+
+import random
+
+from bench_terms import legacy_extract_term_contexts
+from term_scanner import count_terms, extract_term_contexts, scan_paragraph
+
+WORDS = ['In-der-Welt-sein', 'in-der-welt-sein', 'Sein-zum-Tode', 'sein-zum-Tod', 'Mit-dasein', 'Zu-sein',
+         'Dasein', 'Seiendes', 'Zeitlichkeit', 'Erschlossenheit', 'Besorgen', 'damit', 'daher', 'Welt',
+         'weltlich', 'Sorge', 'die', 'und', 'Angst', 'Wahrheit', 'Gerede', 'Verstehen', 'Befindlichkeit',
+         'Das', 'Geschichtlichkeit', 'Sein', 'zeitigt', '»Welt«', '-', ',', '.', '§', 'Überlieferung']
+
+def random_paragraphs(seed, count=2000):
+    rng = random.Random(seed)
+    return [''.join(rng.choice(WORDS) + rng.choice([' ', '', '-', '\n'])
+                    for _ in range(rng.randint(0, 60)))
+            for _ in range(count)]
+
+def test_scanner_matches_original_extraction():
+    paragraphs = random_paragraphs(35)
+    scanned = extract_term_contexts(paragraphs)
+    legacy = legacy_extract_term_contexts(paragraphs)
+    assert scanned == legacy
+    assert list(scanned) == list(legacy)
+
+def test_earlier_patterns_claim_their_span():
+    occurrences = scan_paragraph("Das In-der-Welt-sein und die Zeitlichkeit des Daseins")
+    assert [term for term, _, _ in occurrences] == ['in-der-welt-sein', 'zeitlichkeit', 'daseins']
+    assert occurrences[0][1:] == (4, 20)
+
+def test_parallel_scan_merges_in_document_order():
+    paragraphs = random_paragraphs(36, count=500)
+    counts, contexts = count_terms(paragraphs)
+    
+    parallel_counts, parallel_contexts = count_terms(paragraphs, workers=2)
+    assert list(parallel_counts.items()) == list(counts.items())
+    assert parallel_contexts == contexts
+    
+    _, capped = count_terms(paragraphs, workers=2, max_contexts=3)
+    assert capped == {term: found[:3] for term, found in contexts.items()}
@@ -0,0 +1,25 @@
+#!/usr/bin/env python3
+
+from term_tfidf import build_section_matrix, section_tfidf_scores, tfidf_scores
+
+SECTIONS = [
+    ("## § 15. Zeug", ["Die Zuhandenheit des Zeugs ist Zuhandenheit, dasselbe gilt für die Zuhandenheit."]),
+    ("## § 29. Befindlichkeit", ["Die Befindlichkeit ist Befindlichkeit und dasselbe wie die Befindlichkeit."]),
+    ("## § 44. Wahrheit", ["Die Erschlossenheit der Erschlossenheit ist dasselbe wie Erschlossenheit."]),
+]
+
+def identity(term):
+    return term
+
+def test_terms_spread_over_every_section_rank_below_concentrated_ones():
+    scores = section_tfidf_scores(SECTIONS, stem=identity)
+    
+    assert set(scores) == {"zuhandenheit", "befindlichkeit", "erschlossenheit", "dasselbe"}
+    assert scores["dasselbe"] < min(scores["zuhandenheit"], scores["befindlichkeit"], scores["erschlossenheit"])
+
+def test_matrix_is_sparse_and_parallel_build_matches():
+    matrix = build_section_matrix(SECTIONS, stem=identity)
+    
+    assert matrix.n_sections == 3
+    assert len(matrix.counts) == 6  # one entry per (stem, section) that occurs
+    assert tfidf_scores(build_section_matrix(SECTIONS, workers=2, stem=identity)) == tfidf_scores(matrix)
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+
+import pandas as pd
+
+from translation_dataset import build_translation_frame, write_dataset
+
+GPT = """# Being and Time - Translation
+
+**Model:** gpt-4o
+**Started:** 0-1
+
+---
+
+## Paragraph 0
+
+**German:**
+Die Frage nach dem Sinn von Sein.
+
+**English:**
+The question of the meaning of Being.
+
+**Key Terms:** Sein, Sinn
+
+---
+
+## Paragraph 1 - ERROR
+
+**German:**
+Sein ist der selbstverständlichste Begriff.
+
+**Error:**
+rate limited
+
+---
+
+## Paragraph 1
+
+**German:**
+Sein ist der selbstverständlichste Begriff.
+
+**English:**
+Being is the most self-evident concept.
+
+**Translation Uncertainties:**
+- selbstverständlich: self-evident or obvious
+
+---
+
+## Paragraph 0 - ERROR
+
+**German:**
+Die Frage nach dem Sinn von Sein.
+
+**Error:**
+timeout
+
+---
+
+"""
+
+CLAUDE = """# Being and Time - Translation
+
+**Model:** claude
+
+---
+
+## Paragraph 0
+
+**German:**
+Die Frage nach dem Sinn von Sein.
+
+**English:**
+The question concerning the sense of being.
+
+---
+
+"""
+
+def build(tmp_path):
+    files = []
+    for model, text in (("gpt", GPT), ("claude", CLAUDE)):
+        path = tmp_path / f"full_translation_{model}.md"
+        path.write_text(text, encoding='utf-8')
+        files.append(path)
+    return build_translation_frame(files)
+
+def test_one_row_per_model_paragraph(tmp_path):
+    df = build(tmp_path)
+
+    assert list(df.columns) == ["model", "paragraph", "section", "german_chars", "english_chars", "notes_chars",
+                                "key_terms", "key_term_count", "uncertainty_count", "is_error", "error_message"]
+    assert not df.duplicated(["model", "paragraph"]).any()
+    assert [(r.model, r.paragraph, r.is_error) for r in df.itertuples()] == [
+        ("claude", 0, False), ("gpt", 0, False), ("gpt", 1, False)]
+
+    # The repair replaced the error; the later error did not replace the success
+    gpt = df[df["model"] == "gpt"].set_index("paragraph")
+    assert gpt.loc[0, "key_terms"] == ["Sein", "Sinn"]
+    assert gpt.loc[1, "uncertainty_count"] == 1
+    assert gpt.loc[1, "english_chars"] == len("Being is the most self-evident concept.")
+
+def test_parquet_and_csv_round_trip(tmp_path):
+    df = build(tmp_path)
+
+    write_dataset(df, tmp_path / "translations.parquet")
+    parquet = pd.read_parquet(tmp_path / "translations.parquet")
+    assert parquet[["model", "paragraph", "english_chars", "is_error"]].astype({"model": str}).equals(
+        df[["model", "paragraph", "english_chars", "is_error"]].astype({"model": str}))
+    assert [list(terms) for terms in parquet["key_terms"]] == list(df["key_terms"])
+
+    write_dataset(df, tmp_path / "translations.csv")
+    csv = pd.read_csv(tmp_path / "translations.csv", keep_default_na=False)
+    assert list(csv["paragraph"]) == list(df["paragraph"])
+    assert list(csv["key_terms"]) == ["", "Sein; Sinn", ""]
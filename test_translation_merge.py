@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+
+from translation_merge import index_translation_runs, iter_paragraph_blocks, merge_translation_files
+
+HEADER = "# Being and Time - Translation\n\n**Model:** gpt-4o\n**Started:** {start}\n\n---\n\n"
+
+def ok(number, english):
+    return f"## Paragraph {number}\n\n**German:**\nDeutsch {number}.\n\n**English:**\n{english}\n\n---\n\n"
+
+def error(number, message="rate limited"):
+    return f"## Paragraph {number} - ERROR\n\n**German:**\nDeutsch {number}.\n\n**Error:**\n{message}\n\n---\n\n"
+
+# Run 1: 0 ok, 1 error (repaired later), 2 error (never repaired), 3 ok (superseded later)
+RUN_1 = HEADER.format(start="0-3") + ok(0, "First.") + error(1) + error(2) + ok(3, "Old three.")
+# Run 2: repairs 1, supersedes 3, fails 0 again (stale), fails 2 again; interrupted inside 4
+RUN_2 = (HEADER.format(start="1-4") + ok(1, "Repaired one.") + ok(3, "New three.") + error(0)
+         + error(2, "timeout") + "## Paragraph 4\n\n**German:**\nDeutsch 4.\n\n**English:**\nTrunc")
+
+def write_runs(tmp_path):
+    paths = []
+    for i, text in enumerate((RUN_1, RUN_2)):
+        path = tmp_path / f"run_{i}.md"
+        path.write_text(text, encoding='utf-8')
+        paths.append(path)
+    return paths
+
+def test_iter_paragraph_blocks_offsets_and_status(tmp_path):
+    _, run_2 = write_runs(tmp_path)
+    blocks = list(iter_paragraph_blocks(run_2, file_index=1))
+
+    assert [(b.number, b.status) for b in blocks] == [(1, "ok"), (3, "ok"), (0, "error"), (2, "error"), (4, "incomplete")]
+    raw = run_2.read_bytes()
+    assert raw[blocks[1].offset:blocks[1].offset + blocks[1].length].decode('utf-8') == ok(3, "New three.")
+    # The truncated final block runs to the end of the file
+    assert blocks[-1].offset + blocks[-1].length == len(raw)
+
+    heading_only = tmp_path / "heading_only.md"
+    heading_only.write_text("## Paragraph 7\n\n**German:**\nDeutsch 7.\n", encoding='utf-8')
+    assert [b.status for b in iter_paragraph_blocks(heading_only)] == ["incomplete"]
+
+def test_index_keeps_latest_success(tmp_path):
+    chosen, summary = index_translation_runs(write_runs(tmp_path))
+
+    assert {n: (b.file_index, b.status) for n, b in chosen.items()} == {
+        0: (0, "ok"), 1: (1, "ok"), 2: (1, "error"), 3: (1, "ok"), 4: (1, "incomplete")}
+    assert summary.superseded == [3]
+    assert summary.repaired == [1]
+    assert summary.stale_errors_dropped == [0]
+    assert summary.incomplete == [4]
+    assert summary.remaining_errors == [2, 4]
+    assert summary.blocks_read == 9
+    assert summary.total_paragraphs == 5
+
+def test_merge_writes_ordered_canonical_file(tmp_path):
+    runs = write_runs(tmp_path)
+    output = tmp_path / "merged.md"
+    merge_translation_files(runs, output)
+    merged = output.read_text(encoding='utf-8')
+
+    assert merged.startswith("# Being and Time - Translation\n\n**Model:** gpt-4o\n**Started:** 0-4\n\n---\n\n")
+    assert merged.count("## Paragraph") == 5
+    assert [line for line in merged.splitlines() if line.startswith("## Paragraph")] == [
+        "## Paragraph 0", "## Paragraph 1", "## Paragraph 2 - ERROR", "## Paragraph 3", "## Paragraph 4 - ERROR"]
+    assert "Old three." not in merged and "New three." in merged and "Repaired one." in merged
+    assert "timeout" in merged and "rate limited" not in merged
+    # The truncated block is written as an error, not as a finished translation
+    assert merged.endswith("**English:**\nTrunc\n\n**Error:**\n"
+                           "Incomplete: the run stopped before this paragraph was finished\n\n---\n\n")
+
+    # Merging in place over the newest run is safe
+    merge_translation_files(runs, runs[1])
+    assert runs[1].read_text(encoding='utf-8') == merged
+
+def test_truncated_later_block_does_not_replace_a_success(tmp_path):
+    run_1, run_2 = tmp_path / "run_0.md", tmp_path / "run_1.md"
+    run_1.write_text(HEADER.format(start="1-1") + ok(1, "The complete translation."), encoding='utf-8')
+    run_2.write_text(HEADER.format(start="1-1") + "## Paragraph 1\n\n**German:**\nDeutsch 1.\n\n**English:**\nThe comp",
+                     encoding='utf-8')
+
+    chosen, summary = index_translation_runs([run_1, run_2])
+    assert (chosen[1].file_index, chosen[1].status) == (0, "ok")
+    assert (summary.superseded, summary.incomplete, summary.remaining_errors) == ([], [1], [])
+
+    output = tmp_path / "merged.md"
+    merge_translation_files([run_1, run_2], output)
+    merged = output.read_text(encoding='utf-8')
+    assert "The complete translation." in merged and "The comp\n" not in merged
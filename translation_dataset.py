@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Columnar dataset of all model translations for cross-model analytics.
+One row per (model, paragraph), exported to Parquet/Arrow so questions like
+"error rate by section" become vectorized queries instead of markdown parsing.
+"""
+
+import logging
+from pathlib import Path
+from typing import List, Optional
+
+import pandas as pd
+
+from chunker import TextChunker
+from translation_parser import TranslationParser
+
+logger = logging.getLogger(__name__)
+
+def model_name_from_path(file_path: Path) -> str:
+    """Derive the model name from a full_translation_<model>.md filename."""
+    return file_path.stem.replace('full_translation_', '')
+
+def build_translation_frame(file_paths: List[Path],
+                            chunker: Optional[TextChunker] = None) -> pd.DataFrame:
+    """Load translation files into one DataFrame with a row per model-paragraph."""
+    sections = chunker.paragraph_sections() if chunker else []
+
+    rows = []
+    for file_path in file_paths:
+        model_name = model_name_from_path(file_path)
+        logger.info(f"Parsing {file_path.name}...")
+
+        # Re-runs append to the file: keep the latest success, as merge-translations does
+        latest = {}
+        for paragraph in TranslationParser(file_path).parse_paragraphs():
+            previous = latest.get(paragraph.number)
+            if previous is None or not paragraph.is_error or previous.is_error:
+                latest[paragraph.number] = paragraph
+
+        for paragraph in latest.values():
+            section = sections[paragraph.number] if paragraph.number < len(sections) else None
+            rows.append({
+                "model": model_name,
+                "paragraph": paragraph.number,
+                "section": section,
+                "german_chars": len(paragraph.german_text),
+                "english_chars": len(paragraph.english_translation or ""),
+                "notes_chars": len(paragraph.thinking or ""),
+                "key_terms": paragraph.key_terms,
+                "key_term_count": len(paragraph.key_terms),
+                "uncertainty_count": len(paragraph.uncertainties),
+                "is_error": paragraph.is_error,
+                "error_message": paragraph.error_message,
+            })
+
+    df = pd.DataFrame(rows, columns=[
+        "model", "paragraph", "section", "german_chars", "english_chars", "notes_chars",
+        "key_terms", "key_term_count", "uncertainty_count", "is_error", "error_message"
+    ])
+
+    # Compact dtypes keep the dataset small and group-bys fast
+    df = df.astype({
+        "model": "category",
+        "section": "category",
+        "paragraph": "int32",
+        "german_chars": "int32",
+        "english_chars": "int32",
+        "notes_chars": "int32",
+        "key_term_count": "int16",
+        "uncertainty_count": "int16",
+        "is_error": "bool",
+    })
+
+    return df.sort_values(["model", "paragraph"], ignore_index=True)
+
+def write_dataset(df: pd.DataFrame, output_file: Path):
+    """Write the dataset as Parquet (.parquet), Arrow IPC/Feather (.arrow, .feather) or CSV (.csv)."""
+    suffix = output_file.suffix.lower()
+
+    if suffix == ".parquet":
+        df.to_parquet(output_file, index=False)
+    elif suffix in (".arrow", ".feather"):
+        df.to_feather(output_file)
+    elif suffix == ".csv":
+        # CSV has no list type; key terms become one "; "-separated field
+        df.assign(key_terms=df["key_terms"].map("; ".join)).to_csv(output_file, index=False)
+    else:
+        raise ValueError(f"Unsupported dataset format '{suffix}' (use .parquet, .arrow, .feather or .csv)")
+
+    logger.info(f"Saved {len(df)} rows to {output_file}")
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Streaming merge of partial and overlapping translation runs.
+
+translate_mode appends to its output file, so restarted or ranged runs leave
+duplicate paragraphs, stale ERROR blocks and repeated headers behind. This
+module indexes paragraph blocks by byte offset (never holding file contents in
+memory), keeps the latest successful version of each paragraph and writes one
+canonical, ordered translation file.
+"""
+
+import logging
+import os
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+PARAGRAPH_HEADER_PATTERN = re.compile(rb'^## Paragraph (\d+)(\s*-\s*ERROR)?\s*$')
+MODEL_LINE_PATTERN = re.compile(rb'^\*\*Model:\*\*\s*(.+?)\s*$')
+BLOCK_FIELD_PATTERN = r'^\*\*{label}:\*\*\n(.*?)(?=\n\n\*\*[^*\n]+:\*\*|\n\n---|\Z)'
+
+@dataclass
+class ParagraphBlock:
+    """Location of one paragraph block inside a translation file."""
+    number: int
+    file_index: int
+    offset: int
+    length: int
+    status: str  # "ok", "error" or "incomplete" (cut off before its closing ---)
+
+    @property
+    def is_success(self) -> bool:
+        return self.status == "ok"
+
+@dataclass
+class MergeSummary:
+    """What the merge kept, replaced and dropped."""
+    total_paragraphs: int = 0
+    blocks_read: int = 0
+    superseded: List[int] = field(default_factory=list)        # older success replaced by newer success
+    incomplete: List[int] = field(default_factory=list)        # blocks cut off by an interrupted run
+    repaired: List[int] = field(default_factory=list)          # error replaced by a later success
+    stale_errors_dropped: List[int] = field(default_factory=list)  # later error ignored, success kept
+    remaining_errors: List[int] = field(default_factory=list)
+
+def iter_paragraph_blocks(file_path: Path, file_index: int = 0) -> Iterator[ParagraphBlock]:
+    """Yield paragraph block locations in file order, reading line by line."""
+    current = None
+    has_english = has_separator = False
+    offset = 0
+
+    def finish(end_offset: int) -> ParagraphBlock:
+        number, start, is_error = current
+        if is_error:
+            status = "error"
+        else:
+            status = "ok" if has_english and has_separator else "incomplete"
+        return ParagraphBlock(number, file_index, start, end_offset - start, status)
+
+    with open(file_path, 'rb') as f:
+        for line in f:
+            header_match = PARAGRAPH_HEADER_PATTERN.match(line)
+
+            # A new paragraph header or a top-level run header ends the current block
+            if header_match or line.startswith(b'# '):
+                if current:
+                    yield finish(offset)
+                    current = None
+
+            if header_match:
+                current = (int(header_match.group(1)), offset, header_match.group(2) is not None)
+                has_english = has_separator = False
+            elif current and line.startswith(b'**English:**'):
+                has_english = True
+            elif current and line.rstrip() == b'---':
+                has_separator = True
+
+            offset += len(line)
+
+    if current:
+        yield finish(offset)
+
+def read_block(handle, block: ParagraphBlock) -> str:
+    """Read the raw markdown of one block from an open binary file handle."""
+    handle.seek(block.offset)
+    return handle.read(block.length).decode('utf-8')
+
+def block_field(block_text: str, label: str) -> Optional[str]:
+    """Extract a '**Label:**' section (e.g. German, English) from raw block markdown."""
+    field_match = re.search(BLOCK_FIELD_PATTERN.format(label=re.escape(label)),
+                            block_text, re.MULTILINE | re.DOTALL)
+    return field_match.group(1).strip() if field_match else None
+
+def renumber_block(block_text: str, number: int) -> str:
+    """Rewrite the '## Paragraph N' header of a raw block."""
+    return re.sub(r'^## Paragraph \d+', f'## Paragraph {number}', block_text, count=1)
+
+def read_model_name(file_path: Path) -> Optional[str]:
+    """Return the model named in a translation file header, if any."""
+    with open(file_path, 'rb') as f:
+        for line in f:
+            model_match = MODEL_LINE_PATTERN.match(line)
+            if model_match:
+                return model_match.group(1).decode('utf-8')
+            if PARAGRAPH_HEADER_PATTERN.match(line):
+                return None
+    return None
+
+def index_translation_runs(file_paths: List[Path]) -> Tuple[Dict[int, ParagraphBlock], MergeSummary]:
+    """Pick the latest successful block for every paragraph across runs.
+
+    Files are treated as ordered oldest to newest; within a file later blocks win.
+    Incomplete blocks never replace a success.
+    """
+    chosen: Dict[int, ParagraphBlock] = {}
+    summary = MergeSummary()
+
+    for file_index, file_path in enumerate(file_paths):
+        for block in iter_paragraph_blocks(file_path, file_index):
+            summary.blocks_read += 1
+            previous = chosen.get(block.number)
+            if block.status == "incomplete":
+                summary.incomplete.append(block.number)
+
+            if previous is None:
+                chosen[block.number] = block
+            elif block.is_success:
+                if previous.is_success:
+                    summary.superseded.append(block.number)
+                else:
+                    summary.repaired.append(block.number)
+                chosen[block.number] = block
+            elif previous.is_success:
+                if block.status == "error":
+                    summary.stale_errors_dropped.append(block.number)
+            else:
+                # Both failed: keep the most recent failure message
+                chosen[block.number] = block
+
+    summary.total_paragraphs = len(chosen)
+    summary.remaining_errors = sorted(n for n, b in chosen.items() if not b.is_success)
+    return chosen, summary
+
+def merge_translation_files(file_paths: List[Path], output_file: Path) -> MergeSummary:
+    """Merge translation runs into one canonical file ordered by paragraph number."""
+    chosen, summary = index_translation_runs(file_paths)
+
+    model_name = next((name for name in map(read_model_name, file_paths) if name), "unknown")
+    numbers = sorted(chosen)
+
+    # Write to a temporary file first so an input can also be the output
+    tmp_file = output_file.with_name(output_file.name + '.tmp')
+    handles = [open(p, 'rb') for p in file_paths]
+    try:
+        with open(tmp_file, 'wb') as out:
+            out.write(b"# Being and Time - Translation\n\n")
+            out.write(f"**Model:** {model_name}\n".encode('utf-8'))
+            if numbers:
+                out.write(f"**Started:** {numbers[0]}-{numbers[-1]}\n".encode('utf-8'))
+            out.write(b"\n---\n\n")
+
+            for number in numbers:
+                block = chosen[number]
+                source = handles[block.file_index]
+                source.seek(block.offset)
+                content = source.read(block.length).rstrip()
+
+                # A block cut off by an interrupted run (with no complete version) is
+                # written as an error, so it is not mistaken for a finished translation
+                if block.status == "incomplete":
+                    content = re.sub(rb'^(## Paragraph \d+)', rb'\1 - ERROR', content, count=1)
+                    content += b"\n\n**Error:**\nIncomplete: the run stopped before this paragraph was finished"
+                if not content.endswith(b'---'):
+                    content += b"\n\n---"
+                out.write(content + b"\n\n")
+    finally:
+        for handle in handles:
+            handle.close()
+
+    os.replace(tmp_file, output_file)
+    return summary
+
+def log_merge_summary(summary: MergeSummary, log: logging.Logger = logger, limit: int = 20):
+    """Log a readable report of what the merge replaced."""
+    def preview(numbers: List[int]) -> str:
+        numbers = sorted(set(numbers))
+        suffix = '...' if len(numbers) > limit else ''
+        return f"{len(numbers)} {numbers[:limit]}{suffix}" if numbers else "0"
+
+    log.info(f"  Blocks read: {summary.blocks_read}")
+    log.info(f"  Paragraphs written: {summary.total_paragraphs}")
+    log.info(f"  Superseded by newer translation: {preview(summary.superseded)}")
+    log.info(f"  Errors repaired by later runs: {preview(summary.repaired)}")
+    log.info(f"  Stale errors dropped: {preview(summary.stale_errors_dropped)}")
+    log.info(f"  Incomplete blocks (interrupted runs): {preview(summary.incomplete)}")
+    log.info(f"  Errors remaining: {preview(summary.remaining_errors)}")
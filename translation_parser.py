@@ -44,27 +44,22 @@ class TranslationParser:
         paragraphs = []
         
         # Split by paragraph headers: ## Paragraph N or ## Paragraph N - ERROR
-        paragraph_pattern = r'^## Paragraph (\d+)(?:\s*-\s*ERROR)?$'
+        paragraph_pattern = r'^## Paragraph (\d+)(\s*-\s*ERROR)?$'
         sections = re.split(paragraph_pattern, self.content, flags=re.MULTILINE)
         
-        # sections[0] is content before first paragraph (usually header/metadata)
-        # sections[1] is first paragraph number, sections[2] is first paragraph content, etc.
-        for i in range(1, len(sections), 2):
-            if i + 1 < len(sections):
-                para_num = int(sections[i])
-                para_content = sections[i + 1].strip()
-                
-                # Check if this was an error paragraph by looking at the original header
-                header_match = re.search(rf'^## Paragraph {para_num}(\s*-\s*ERROR)?$', 
-                                       self.content, re.MULTILINE)
-                is_error = header_match and header_match.group(1) is not None
-                
-                if is_error:
-                    paragraph = self._parse_error_paragraph(para_num, para_content)
-                else:
-                    paragraph = self._parse_successful_paragraph(para_num, para_content)
-                
-                paragraphs.append(paragraph)
+        # sections[0] is content before first paragraph (usually header/metadata), then
+        # (paragraph number, ERROR suffix or None, paragraph content) for each header
+        for i in range(1, len(sections) - 2, 3):
+            para_num = int(sections[i])
+            para_content = sections[i + 2].strip()
+            
+            # The header's own suffix, so a re-run of the same paragraph gets its own status
+            if sections[i + 1] is not None:
+                paragraph = self._parse_error_paragraph(para_num, para_content)
+            else:
+                paragraph = self._parse_successful_paragraph(para_num, para_content)
+            
+            paragraphs.append(paragraph)
         
         self._paragraphs = paragraphs
         return paragraphs
@@ -72,11 +67,11 @@ class TranslationParser:
     def _parse_successful_paragraph(self, para_num: int, content: str) -> ParsedParagraph:
         """Parse a successfully translated paragraph."""
         german = self._extract_section(content, r'\*\*German:\*\*(.*?)(?=\*\*English:|\*\*Error:|\Z)', multiline=True)
-        english = self._extract_section(content, r'\*\*English:\*\*(.*?)(?=\*\*Translator\'s Notes:|\*\*Error:|\Z)', multiline=True)
-        thinking = self._extract_section(content, r'\*\*Translator\'s Notes:\*\*(.*?)(?=\*\*Key Terms:|\*\*Error:|\Z)', multiline=True)
+        english = self._extract_section(content, r'\*\*English:\*\*(.*?)(?=\*\*Translator\'s Notes:|\*\*Key Terms:|\*\*Translation Uncertainties:|\*\*Error:|\n---|\Z)', multiline=True)
+        thinking = self._extract_section(content, r'\*\*Translator\'s Notes:\*\*(.*?)(?=\*\*Key Terms:|\*\*Translation Uncertainties:|\*\*Error:|\n---|\Z)', multiline=True)
         
         # Extract key terms (comma-separated)
-        key_terms_raw = self._extract_section(content, r'\*\*Key Terms:\*\*(.*?)(?=\*\*Translation Uncertainties:|\*\*Error:|\Z)')
+        key_terms_raw = self._extract_section(content, r'\*\*Key Terms:\*\*([^\n]*)')
         key_terms = []
         if key_terms_raw:
             key_terms = [term.strip() for term in key_terms_raw.split(',') if term.strip()]